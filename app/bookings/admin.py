@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Booking, BookingTableRelationship, Client
+from .models import ArchivedBooking, Booking, BookingTableRelationship, Client
 
 
 class BookingTableRelationshipInline(admin.TabularInline):
@@ -26,3 +26,14 @@ class BookingAdmin(admin.ModelAdmin):
 @admin.register(BookingTableRelationship)
 class BookingTableRelationshipAdmin(admin.ModelAdmin):
     pass
+
+
+@admin.register(ArchivedBooking)
+class ArchivedBookingAdmin(admin.ModelAdmin):
+    list_display = [
+        'reference',
+        'booking_date',
+        'archived_at',
+    ]
+    list_select_related = ['client', 'site']
+    exclude = ['data']
@@ -0,0 +1,149 @@
+from django.conf import settings
+from django.db.models import Prefetch
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.api import SparseFieldsMixin
+from core.mixins import ReplicaReadMixin, StatementTimeoutMixin
+from core.pagination import KeysetCursorPagination
+from sites.models import Site, Table
+from .batch import ERROR_INVALID, ERROR_NOT_FOUND, ERROR_TIMEOUT, evaluate_batch
+from .filters import BookingFilterBackend, ClientFilterBackend
+from .models import Booking, Client
+from .serializers import AvailabilityQuerySerializer, BookingSerializer, ClientSerializer
+
+
+class BookingAPIMixin(SparseFieldsMixin):
+    """
+    Mixin for the Booking API views, scoped to the Bookings the User can see.
+    """
+
+    serializer_class = BookingSerializer
+    keyset_ordering = ('booking_date', 'id')
+    field_plans = {
+        'id': ('id',),
+        'reference': ('reference',),
+        'site': ('site',),
+        'site_name': ('site__site_name',),
+        'client': ('client',),
+        'client_name': ('client__client_name',),
+        'client_email': ('client__client_email',),
+        'client_phone': ('client__client_phone',),
+        'booking_date': ('booking_date',),
+        'party': ('party',),
+        'duration': ('duration',),
+        'status': ('status',),
+        'notes': ('notes',),
+        'tables': (Prefetch('tables', queryset=Table.objects.only('id')),),
+        'booking_created_at': ('booking_created_at',),
+        'updated_at': ('updated_at',),
+    }
+
+    def get_queryset(self):
+        return self.plan_queryset(Booking.objects.get_bookings(self.request.user))
+
+
+class BookingListAPIView(
+    ReplicaReadMixin, StatementTimeoutMixin, BookingAPIMixin, ListAPIView
+):
+    """
+    API view to return the Bookings the User can see a page at a time, ordered by date.
+    """
+
+    pagination_class = KeysetCursorPagination
+    filter_backends = [BookingFilterBackend]
+    statement_timeout = 5000
+    atomic_requests = False
+
+
+class BookingDetailAPIView(BookingAPIMixin, RetrieveAPIView):
+    """
+    API view to return a single Booking.
+    """
+
+
+class ClientAPIMixin(SparseFieldsMixin):
+    """
+    Mixin for the Client API views, scoped to the Clients the User can see.
+    """
+
+    serializer_class = ClientSerializer
+    keyset_ordering = ('client_name', 'id')
+    field_plans = {
+        'id': ('id',),
+        'client_name': ('client_name',),
+        'client_email': ('client_email',),
+        'client_phone': ('client_phone',),
+    }
+
+    def get_queryset(self):
+        return self.plan_queryset(Client.objects.get_clients(self.request.user))
+
+
+class ClientListAPIView(ClientAPIMixin, ListAPIView):
+    """
+    API view to return the Clients the User can see a page at a time, ordered by name.
+    """
+
+    pagination_class = KeysetCursorPagination
+    filter_backends = [ClientFilterBackend]
+
+
+class ClientDetailAPIView(ClientAPIMixin, RetrieveAPIView):
+    """
+    API view to return a single Client.
+    """
+
+
+class AvailabilityBatchAPIView(APIView):
+    """
+    API view to answer a batch of availability queries in one request, e.g.
+    `{"queries": [{"site": 1, "date": "2021-06-01", "party_size": 2, "time": "19:00"}]}`.
+
+    Each query is answered in order with its available times, or whether its time is
+    available if given. Queries which cannot be answered are given an error marker
+    rather than failing the batch, and `complete` is False if the time budget ran out.
+    """
+
+    def post(self, request, *args, **kwargs):
+        queries = request.data.get('queries') if isinstance(request.data, dict) else None
+        if not isinstance(queries, list):
+            raise ValidationError({'queries': 'A list of queries is required.'})
+
+        max_queries = settings.AVAILABILITY_BATCH_MAX_QUERIES
+        if len(queries) > max_queries:
+            raise ValidationError({'queries': f'At most {max_queries} queries are allowed.'})
+
+        results = [None] * len(queries)
+        valid_queries = {}
+
+        for index, query in enumerate(queries):
+            serializer = AvailabilityQuerySerializer(data=query)
+            if serializer.is_valid():
+                valid_queries[index] = serializer.validated_data
+            else:
+                results[index] = {'error': ERROR_INVALID}
+
+        # Only the Sites the User can see are answered for.
+        site_ids = set(
+            Site.objects.get_sites(request.user)
+            .filter(id__in={query['site'] for query in valid_queries.values()})
+            .values_list('id', flat=True)
+        )
+        for index, query in list(valid_queries.items()):
+            if query['site'] not in site_ids:
+                results[index] = {'error': ERROR_NOT_FOUND}
+                del valid_queries[index]
+
+        for index, result in zip(valid_queries, evaluate_batch(list(valid_queries.values()))):
+            results[index] = result
+
+        return Response(
+            {
+                'results': results,
+                'complete': all(result.get('error') != ERROR_TIMEOUT for result in results),
+            }
+        )
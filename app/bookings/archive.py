@@ -0,0 +1,193 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.utils import timezone
+
+from sites.models import Table
+from .models import ArchivedBooking, ArchivedClientStats, Booking, BookingTableRelationship
+
+
+def get_archive_cutoff():
+    """Return the time before which Bookings are archived."""
+    return timezone.now() - timedelta(days=settings.BOOKING_ARCHIVE_AFTER)
+
+
+def serialize_booking(booking, relationships):
+    """Return the fields of a Booking and its Tables as they are kept in the archive."""
+    return {
+        **{
+            field.attname: None
+            if field.value_from_object(booking) is None
+            else field.value_to_string(booking)
+            for field in Booking._meta.concrete_fields
+        },
+        'tables': [
+            [relationship.table_id, relationship.created_at.isoformat()]
+            for relationship in relationships
+        ],
+    }
+
+
+def refresh_archived_client_stats(keys):
+    """
+    Recompute the ArchivedClientStats of the given (client_id, site_id) pairs from their
+    archived Bookings, deleting those with none left.
+    """
+    keys = set(keys)
+    if not keys:
+        return
+
+    confirmed = Q(status=Booking.StatusChoices.CONFIRMED)
+    client_ids = {client_id for client_id, _ in keys}
+    rows = (
+        ArchivedBooking.objects.filter(client_id__in=client_ids)
+        .values('client_id', 'site_id')
+        .annotate(
+            total=Count('id'),
+            cancelled=Count('id', filter=Q(status=Booking.StatusChoices.CANCELLED)),
+            visits=Count('id', filter=confirmed),
+            party_total=Sum('party', filter=confirmed),
+            first_visit=Min('booking_date', filter=confirmed),
+            last_visit=Max('booking_date', filter=confirmed),
+        )
+        .order_by()
+    )
+    stats = [
+        ArchivedClientStats(**{**row, 'party_total': row['party_total'] or 0})
+        for row in rows
+        if (row['client_id'], row['site_id']) in keys
+    ]
+
+    stale = Q()
+    for client_id, site_id in keys:
+        stale |= Q(client_id=client_id, site_id=site_id)
+    ArchivedClientStats.objects.filter(stale).delete()
+    ArchivedClientStats.objects.bulk_create(stats)
+
+
+def archive_chunk(cutoff, chunk_size):
+    """
+    Move the oldest Bookings before the cutoff, up to chunk_size, and their Tables into
+    the archive in a single transaction. Bookings locked by another transaction are
+    skipped until the next run. Returns the number of Bookings archived.
+    """
+    with transaction.atomic():
+        bookings = list(
+            Booking.objects.filter(booking_date__lt=cutoff)
+            .select_for_update(skip_locked=True)
+            .order_by('booking_date', 'id')[:chunk_size]
+        )
+        if not bookings:
+            return 0
+
+        booking_ids = [booking.id for booking in bookings]
+        relationships = BookingTableRelationship.objects.filter(booking_id__in=booking_ids)
+        tables = {}
+        for relationship in relationships.order_by('created_at'):
+            tables.setdefault(relationship.booking_id, []).append(relationship)
+
+        ArchivedBooking.objects.bulk_create(
+            ArchivedBooking(
+                id=booking.id,
+                reference=booking.reference,
+                site_id=booking.site_id,
+                client_id=booking.client_id,
+                status=booking.status,
+                booking_date=booking.booking_date,
+                party=booking.party,
+                data=ArchivedBooking.compress(
+                    serialize_booking(booking, tables.get(booking.id, []))
+                ),
+            )
+            for booking in bookings
+        )
+
+        # Raw deletes skip the signals of every row, the Bookings are past so neither
+        # availability nor the daily stats of their dates change.
+        relationships._raw_delete(relationships.db)
+        archived = Booking.objects.filter(id__in=booking_ids)
+        archived._raw_delete(archived.db)
+
+        refresh_archived_client_stats((booking.client_id, booking.site_id) for booking in bookings)
+
+    return len(bookings)
+
+
+def archive_bookings(cutoff=None, chunk_size=None, max_chunks=None, pause=None):
+    """
+    Archive the Bookings before the cutoff, by default those older than
+    BOOKING_ARCHIVE_AFTER days, in chunks. Each chunk is committed on its own so an
+    interrupted run resumes where it stopped, and the run pauses between chunks and
+    stops after max_chunks to throttle the load on the database. Returns the number of
+    Bookings archived.
+    """
+    cutoff = cutoff or get_archive_cutoff()
+    chunk_size = chunk_size or settings.BOOKING_ARCHIVE_CHUNK_SIZE
+    max_chunks = max_chunks or settings.BOOKING_ARCHIVE_MAX_CHUNKS
+    pause = settings.BOOKING_ARCHIVE_PAUSE if pause is None else pause
+
+    count = 0
+    for x in range(max_chunks):
+        if x and pause:
+            time.sleep(pause)
+
+        archived = archive_chunk(cutoff, chunk_size)
+        count += archived
+        if archived < chunk_size:
+            break
+
+    return count
+
+
+def restore_bookings(queryset):
+    """
+    Move the ArchivedBookings of the given queryset back into the Booking table as they
+    were, with the Tables which still exist. Returns the number of Bookings restored.
+    """
+    with transaction.atomic():
+        archived = list(
+            ArchivedBooking.objects.filter(id__in=queryset.values('id')).select_for_update()
+        )
+        if not archived:
+            return 0
+
+        bookings, created_at, relationships = [], {}, []
+        for archived_booking in archived:
+            data = archived_booking.get_data()
+            booking = Booking(
+                **{
+                    field.attname: field.to_python(data[field.attname])
+                    for field in Booking._meta.concrete_fields
+                    if field.attname in data
+                }
+            )
+            created_at[booking.id] = booking.booking_created_at
+            bookings.append(booking)
+            relationships += [
+                BookingTableRelationship(booking_id=booking.id, table_id=table_id)
+                for table_id, _ in data['tables']
+            ]
+
+        # Saving sets the time the Booking was created, and updated, to now. The updated
+        # time is kept so integrations syncing changes see the Booking again.
+        Booking.objects.bulk_create(bookings)
+        for booking in bookings:
+            booking.booking_created_at = created_at[booking.id]
+        Booking.objects.bulk_update(bookings, ['booking_created_at'])
+
+        table_ids = set(
+            Table.objects.filter(
+                id__in={relationship.table_id for relationship in relationships}
+            ).values_list('id', flat=True)
+        )
+        BookingTableRelationship.objects.bulk_create(
+            relationship for relationship in relationships if relationship.table_id in table_ids
+        )
+
+        ArchivedBooking.objects.filter(id__in=[booking.id for booking in bookings]).delete()
+        refresh_archived_client_stats((booking.client_id, booking.site_id) for booking in bookings)
+
+    return len(bookings)
@@ -0,0 +1,235 @@
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.replicas import get_replica
+from core.singleflight import single_flight
+from sites.snapshot import get_site_snapshot
+from .utils import BookingSystem
+
+METRICS_CACHE_KEY = 'bookings.availability.metrics'
+METRICS_COUNTERS = ('entries_computed', 'runtime_ms')
+
+
+def get_generation_cache_key(site_id, date):
+    return f'bookings.availability.generation.{site_id}.{date.isoformat()}'
+
+
+def get_availability_cache_key(site_id, date, party_size):
+    return f'bookings.availability.{site_id}.{date.isoformat()}.{party_size}'
+
+
+def get_metrics_counter_key(name):
+    return f'{METRICS_CACHE_KEY}.{name}'
+
+
+def get_generation(site_id, date):
+    """
+    Return the generation of the availability of a Site on the given date, replaced
+    whenever a Booking on that date changes.
+    """
+    key = get_generation_cache_key(site_id, date)
+    generation = cache.get(key)
+
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, settings.AVAILABILITY_CACHE_TIMEOUT)
+        generation = cache.get(key)
+
+    return generation
+
+
+def invalidate_availability(site_id, date):
+    """Discard the cached availability of a Site on the given date."""
+    cache.set(
+        get_generation_cache_key(site_id, date),
+        uuid.uuid4().hex,
+        settings.AVAILABILITY_CACHE_TIMEOUT,
+    )
+
+
+def is_cacheable(booking_system):
+    """
+    Return True if the availability of the BookingSystem can be cached. Only future
+    dates are, as the slots of today move with the time, and only for new Bookings of
+    the Site's default duration.
+    """
+    return (
+        booking_system.booking_date > timezone.localdate()
+        and booking_system.duration == booking_system.site.booking_duration
+        and booking_system.exclude_booking_id is None
+    )
+
+
+def get_party_sizes(snapshot):
+    return range(snapshot.min_party_num, snapshot.max_party_num + 1)
+
+
+def compute_availability(site, date, party_sizes=None):
+    """
+    Compute the available time slots of a Site on the given date and store them in the
+    cache, for each party size of the Site unless given. Returns the number of entries
+    computed.
+    """
+    snapshot = get_site_snapshot(site)
+    party_sizes = party_sizes or get_party_sizes(snapshot)
+
+    # The generation is read before the Bookings, so a Booking changed while computing
+    # leaves entries of the old generation to be ignored, never stale entries current.
+    generation = get_generation(snapshot.id, date)
+
+    entries = {
+        get_availability_cache_key(snapshot.id, date, party_size): (
+            snapshot.version,
+            generation,
+            BookingSystem(snapshot, date, party_size).get_available_time_slots(),
+        )
+        for party_size in party_sizes
+    }
+    cache.set_many(entries, settings.AVAILABILITY_CACHE_TIMEOUT)
+    return len(entries)
+
+
+def get_cache_entry(booking_system):
+    """
+    Return the cache key of the BookingSystem's availability, the version and generation
+    an entry must have been computed for, and the entry cached if any.
+    """
+    snapshot = booking_system.site
+    date = booking_system.booking_date
+    current = (snapshot.version, get_generation(snapshot.id, date))
+    key = get_availability_cache_key(snapshot.id, date, booking_system.party_size)
+    return key, current, cache.get(key)
+
+
+def get_cached_time_slots(booking_system):
+    """
+    Return the available time slots of the BookingSystem if cached, otherwise None.
+    An entry is only used if computed for the current version of the Site and
+    generation of the date.
+    """
+    if not is_cacheable(booking_system):
+        return None
+
+    key, current, entry = get_cache_entry(booking_system)
+    if entry is not None and entry[:2] == current:
+        return entry[2]
+    return None
+
+
+def get_stale_time_slots(site_id, date, party_size):
+    """
+    Return the available time slots last cached for a Site, date and party size, even if
+    computed for an older version or generation, otherwise None. Only to fall back on
+    when they cannot be computed.
+    """
+    entry = cache.get(get_availability_cache_key(site_id, date, party_size))
+    return entry[2] if entry is not None else None
+
+
+def compute_time_slots(booking_system, current=None):
+    """
+    Compute the available time slots of the BookingSystem. Identical concurrent requests
+    for a new Booking share a single computation, keyed by the version of the Site and
+    generation of the date so a change is never hidden by a computation before it.
+    A request waits for a computation in progress for a short time only, then computes
+    its own.
+    """
+    snapshot = booking_system.site
+    if (
+        booking_system.exclude_booking_id is not None
+        or booking_system.duration != snapshot.booking_duration
+    ):
+        return booking_system.get_available_time_slots()
+
+    date = booking_system.booking_date
+    version, generation = current or (snapshot.version, get_generation(snapshot.id, date))
+    key = '.'.join(
+        [
+            get_availability_cache_key(snapshot.id, date, booking_system.party_size),
+            str(int(booking_system.frontend)),
+            version,
+            generation,
+        ]
+    )
+    return single_flight(
+        key,
+        booking_system.get_available_time_slots,
+        settings.AVAILABILITY_COALESCE_TIMEOUT,
+        max_wait=settings.AVAILABILITY_COALESCE_WAIT,
+    )
+
+
+def get_available_time_slots(booking_system):
+    """
+    Return the available time slots of the BookingSystem, from the cache when possible.
+    Those computed from a replica are not cached, as a lagging replica could leave them
+    cached after the change they miss.
+    """
+    if not is_cacheable(booking_system):
+        return compute_time_slots(booking_system)
+
+    key, current, entry = get_cache_entry(booking_system)
+    if entry is not None and entry[:2] == current:
+        return entry[2]
+
+    available_time_slots = compute_time_slots(booking_system, current)
+    if get_replica():
+        return available_time_slots
+    cache.set(key, (*current, available_time_slots), settings.AVAILABILITY_CACHE_TIMEOUT)
+    return available_time_slots
+
+
+def get_precompute_dates(snapshot, today=None):
+    """
+    Return the dates availability is precomputed for, from tomorrow up to the number of
+    days in advance set, or the Site's early booking period if shorter.
+    """
+    today = today or timezone.localdate()
+    days = min(settings.AVAILABILITY_PRECOMPUTE_DAYS, snapshot.early_booking)
+    return [today + timedelta(days=x) for x in range(1, days + 1)]
+
+
+def get_precompute_chunks(snapshot, dates):
+    """
+    Split the dates to precompute into chunks of roughly the same amount of work, so
+    Sites with a wider range of party sizes are given fewer dates per chunk.
+    """
+    party_count = max(len(get_party_sizes(snapshot)), 1)
+    size = max(settings.AVAILABILITY_PRECOMPUTE_CHUNK_SIZE // party_count, 1)
+    return [dates[x : x + size] for x in range(0, len(dates), size)]
+
+
+def reset_metrics(**metrics):
+    """Record the metrics of a new precompute run and reset its counters."""
+    cache.set(METRICS_CACHE_KEY, metrics, None)
+    cache.set_many({get_metrics_counter_key(name): 0 for name in METRICS_COUNTERS}, None)
+
+
+def increment_metrics(**counters):
+    for name, value in counters.items():
+        try:
+            cache.incr(get_metrics_counter_key(name), value)
+        except ValueError:
+            # The counters were evicted, they are reset by the next run.
+            pass
+
+
+def get_precompute_metrics():
+    """
+    Return the metrics of the last precompute run, including how many of the expected
+    entries have been computed so far and how long they took.
+    """
+    metrics = cache.get(METRICS_CACHE_KEY)
+    if metrics is None:
+        return None
+
+    counters = cache.get_many([get_metrics_counter_key(name) for name in METRICS_COUNTERS])
+    for name in METRICS_COUNTERS:
+        metrics[name] = counters.get(get_metrics_counter_key(name), 0)
+
+    expected = metrics['entries_expected']
+    metrics['coverage'] = metrics['entries_computed'] / expected if expected else 1.0
+    return metrics
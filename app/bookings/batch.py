@@ -0,0 +1,148 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from time import monotonic
+
+from django.conf import settings
+from django.db import connections
+
+from frontend.utils import get_early_booking_date, get_last_booking_date
+from sites.snapshot import get_site_snapshot
+from .availability import get_available_time_slots, get_cached_time_slots
+from .utils import BookingSystem, get_booked_tables
+
+logger = logging.getLogger(__name__)
+
+# Markers of the queries of a batch which could not be answered.
+ERROR_INVALID = 'invalid'
+ERROR_NOT_FOUND = 'not_found'
+ERROR_DATE_UNAVAILABLE = 'date_unavailable'
+ERROR_PARTY_SIZE_UNAVAILABLE = 'party_size_unavailable'
+ERROR_TIMEOUT = 'timeout'
+ERROR_FAILED = 'failed'
+
+
+def evaluate_group(site_id, date, party_sizes):
+    """
+    Return the available time slots of a Site on the given date for each party size, or
+    the error marker of those which cannot be booked. The booked Tables of the date are
+    loaded once for the whole group, and only if a party size is not already cached.
+    """
+    snapshot = get_site_snapshot(site_id)
+
+    # The same range of dates the frontend booking form accepts.
+    if not get_last_booking_date(snapshot).date() <= date <= get_early_booking_date(snapshot):
+        return {party_size: ERROR_DATE_UNAVAILABLE for party_size in party_sizes}
+
+    results = {}
+    booked_tables = None
+
+    for party_size in party_sizes:
+        if not snapshot.min_party_num <= party_size <= snapshot.max_party_num:
+            results[party_size] = ERROR_PARTY_SIZE_UNAVAILABLE
+            continue
+
+        booking_system = BookingSystem(snapshot, date, party_size, frontend=True)
+        available_time_slots = get_cached_time_slots(booking_system)
+
+        if available_time_slots is None:
+            if booked_tables is None:
+                booked_tables = list(get_booked_tables(snapshot.id, date))
+            booking_system.booked_tables = booked_tables
+            available_time_slots = get_available_time_slots(booking_system)
+
+        results[party_size] = available_time_slots
+
+    return results
+
+
+def run_group(site_id, date, party_sizes, deadline, close_connections=False):
+    """
+    Evaluate a group, marking it as failed rather than failing the whole batch, or as
+    timed out if it starts after the deadline. When run in a worker thread, the thread's
+    database connections are closed once done.
+    """
+    if monotonic() >= deadline:
+        return ERROR_TIMEOUT
+
+    try:
+        return evaluate_group(site_id, date, party_sizes)
+    except Exception:
+        logger.exception('Failed to evaluate availability of site %s on %s', site_id, date)
+        return ERROR_FAILED
+    finally:
+        if close_connections:
+            connections.close_all()
+
+
+@lru_cache(maxsize=None)
+def get_executor(workers):
+    """
+    Return the worker threads shared by all the batches of the process, so concurrent
+    batches are bounded to as many threads, and database connections, between them.
+    """
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix='availability-batch')
+
+
+def evaluate_groups(groups, timeout):
+    """
+    Evaluate the groups of (site id, date) to party sizes in parallel, returning the
+    result of each evaluated within the time budget and a timeout marker for the rest.
+    """
+    deadline = monotonic() + timeout
+    workers = settings.AVAILABILITY_BATCH_WORKERS
+
+    # Without workers the groups are evaluated in turn until the time budget runs out.
+    if workers <= 1:
+        return {
+            key: run_group(*key, party_sizes, deadline) for key, party_sizes in groups.items()
+        }
+
+    executor = get_executor(workers)
+    results = {}
+    futures = {
+        executor.submit(run_group, *key, party_sizes, deadline, True): key
+        for key, party_sizes in groups.items()
+    }
+    done, not_done = wait(futures, timeout=max(deadline - monotonic(), 0))
+
+    for future in done:
+        results[futures[future]] = future.result()
+    for future in not_done:
+        future.cancel()
+        results[futures[future]] = ERROR_TIMEOUT
+
+    # Groups still running finish in the background, their results are discarded. Those
+    # still queued behind other batches are timed out as soon as they start.
+    return results
+
+
+def format_result(query, group_result):
+    """Return the compact result of a query: its times, if its time is free, or an error."""
+    if isinstance(group_result, str):
+        return {'error': group_result}
+
+    available_time_slots = group_result[query['party_size']]
+    if isinstance(available_time_slots, str):
+        return {'error': available_time_slots}
+
+    if query.get('time') is not None:
+        return {'available': query['time'] in available_time_slots}
+    return {'times': [time_slot.strftime('%H:%M') for time_slot in available_time_slots]}
+
+
+def evaluate_batch(queries, timeout=None):
+    """
+    Answer a batch of availability queries, each a dict of the Site id, date, party size
+    and optionally a time. Queries are grouped by Site and date so each group's
+    timetable is loaded once. Returns the result of each query in order.
+    """
+    timeout = settings.AVAILABILITY_BATCH_TIMEOUT if timeout is None else timeout
+
+    groups = defaultdict(set)
+    for query in queries:
+        groups[query['site'], query['date']].add(query['party_size'])
+
+    results = evaluate_groups({key: sorted(value) for key, value in groups.items()}, timeout)
+    return [format_result(query, results[query['site'], query['date']]) for query in queries]
@@ -0,0 +1,80 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from calendars.utils import invalidate_resources
+from sites.models import ScheduleOverride
+from sites.snapshot import invalidate_site_snapshot
+from .filters import get_date_range_filter
+from .models import Booking, BookingTableRelationship
+from .signals import notify_booking_changed
+from .tasks import send_cancellation_emails
+
+
+def cancel_bookings(queryset):
+    """
+    Cancel the confirmed future Bookings of the given queryset in bulk. The statuses are
+    updated and the Tables removed with a query each, rather than saving every Booking,
+    and the cancellation emails are sent by a single task once the transaction is
+    committed. Returns the number of Bookings cancelled.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        bookings = list(
+            Booking.objects.filter(
+                id__in=queryset.values('id'),
+                status=Booking.StatusChoices.CONFIRMED,
+                booking_date__gt=now,
+            )
+            .select_for_update()
+            .order_by()
+            .values_list('id', 'site_id', 'booking_date')
+        )
+        if not bookings:
+            return 0
+
+        booking_ids = [booking_id for booking_id, _, _ in bookings]
+        Booking.objects.filter(id__in=booking_ids).update(
+            status=Booking.StatusChoices.CANCELLED, updated_at=now
+        )
+
+        # A raw delete skips touch_booking for every relationship, the Bookings have
+        # already been touched and their receivers are notified once per Site below.
+        relationships = BookingTableRelationship.objects.filter(booking_id__in=booking_ids)
+        relationships._raw_delete(relationships.db)
+
+        dates = defaultdict(list)
+        for _, site_id, booking_date in bookings:
+            dates[site_id].append(booking_date)
+        for site_id, site_dates in dates.items():
+            notify_booking_changed(None, site_id, site_dates)
+
+        transaction.on_commit(lambda: send_cancellation_emails.delay(booking_ids))
+
+    return len(booking_ids)
+
+
+def close_site(site, start, end, description=''):
+    """
+    Close a Site on every date between start and end inclusive, replacing any overrides
+    of its hours on those dates, and cancel the Bookings made for them. Returns the
+    number of Bookings cancelled.
+    """
+    dates = [start + timedelta(days=x) for x in range((end - start).days + 1)]
+
+    with transaction.atomic():
+        ScheduleOverride.objects.filter(site=site, date__gte=start, date__lte=end).delete()
+        ScheduleOverride.objects.bulk_create(
+            ScheduleOverride(site=site, date=date, is_closed=True, description=description)
+            for date in dates
+        )
+        # Bulk creating skips the signals which would invalidate the snapshot.
+        invalidate_site_snapshot(site.id)
+        invalidate_resources(site.id)
+
+        return cancel_bookings(
+            Booking.objects.filter(get_date_range_filter('booking_date', start, end), site=site)
+        )
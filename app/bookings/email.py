@@ -67,23 +67,34 @@ def send_booking_updated_email(booking):
     )
 
 
+def get_booking_cancelled_email(booking):
+    """
+    Return the arguments of the email to the Client of the given Booking when it is
+    cancelled.
+    """
+    site = booking.site
+    content = site.client_email_booking_cancelled_content
+
+    return {
+        'recipients': booking.client.client_email,
+        'subject': site.client_email_booking_cancelled_subject,
+        'message': get_email_message(booking, content, html=False),
+        'html_message': get_email_message(booking, content),
+    }
+
+
 def send_booking_cancelled_email(booking):
     """
     Send an email to the Client of the given Booking when it is cancelled.
     """
-    client = booking.client
-    site = booking.site
+    mail.send(**get_booking_cancelled_email(booking))
 
-    subject = site.client_email_booking_cancelled_subject
-    message = get_email_message(booking, site.client_email_booking_cancelled_content, html=False)
-    html_message = get_email_message(booking, site.client_email_booking_cancelled_content)
 
-    mail.send(
-        client.client_email,
-        subject=subject,
-        message=message,
-        html_message=html_message,
-    )
+def send_booking_cancelled_emails(bookings):
+    """
+    Queue the cancellation emails of the given Bookings, created in a single query.
+    """
+    mail.send_many([get_booking_cancelled_email(booking) for booking in bookings])
 
 
 def send_booking_notification_email(booking):
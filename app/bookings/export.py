@@ -0,0 +1,111 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Aggregate, CharField, OuterRef, Subquery
+from django.utils import timezone
+
+from .models import Booking, BookingTableRelationship
+
+# Rows fetched from the database at a time. Rows are streamed as they are fetched so
+# memory use is bounded by this rather than the number of Bookings exported.
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+}
+
+# Field names of the exported columns, and the values they are read from.
+EXPORT_FIELDS = {
+    'reference': 'reference',
+    'site': 'site__site_name',
+    'booking_date': 'booking_date',
+    'party': 'party',
+    'duration': 'duration',
+    'status': 'status',
+    'tables': 'table_names',
+    'client_name': 'client__client_name',
+    'client_email': 'client__client_email',
+    'client_phone': 'client__client_phone',
+    'notes': 'notes',
+    'booking_created_at': 'booking_created_at',
+}
+
+STATUS_LABELS = dict(Booking.StatusChoices.choices)
+
+
+class ConcatNames(Aggregate):
+    """
+    Aggregate the values into a comma separated string. STRING_AGG on PostgreSQL,
+    GROUP_CONCAT elsewhere.
+    """
+
+    function = 'GROUP_CONCAT'
+    template = "%(function)s(%(distinct)s%(expressions)s, ', ')"
+    output_field = CharField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='STRING_AGG', **extra_context)
+
+
+def get_export_queryset(queryset):
+    """
+    Return the values of the exported columns of the Bookings, with the names of their
+    Tables aggregated in the database rather than prefetched.
+    """
+    table_names = (
+        BookingTableRelationship.objects.filter(booking=OuterRef('pk'))
+        .order_by()
+        .values('booking')
+        .annotate(names=ConcatNames('table__table_name'))
+        .values('names')
+    )
+    return (
+        queryset.select_related(None)
+        .annotate(table_names=Subquery(table_names))
+        .order_by('booking_date', 'id')
+        .values(*EXPORT_FIELDS.values())
+    )
+
+
+def format_row(values):
+    """Return the exported columns of a row of values."""
+    row = {name: values[field] for name, field in EXPORT_FIELDS.items()}
+    row['booking_date'] = timezone.localtime(row['booking_date']).isoformat()
+    row['booking_created_at'] = timezone.localtime(row['booking_created_at']).isoformat()
+    row['status'] = STATUS_LABELS[row['status']]
+    row['client_phone'] = str(row['client_phone'] or '')
+    row['tables'] = row['tables'] or ''
+    return row
+
+
+def iter_rows(queryset):
+    for values in get_export_queryset(queryset).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield format_row(values)
+
+
+class Echo:
+    """Pseudo-buffer returning what is written, so csv.writer can produce lines."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(queryset):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in iter_rows(queryset):
+        yield writer.writerow(row.values())
+
+
+def iter_jsonl(queryset):
+    for row in iter_rows(queryset):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def iter_export(queryset, export_format):
+    """Return an iterator of the lines of the export of the Bookings."""
+    if export_format == 'jsonl':
+        return iter_jsonl(queryset)
+    return iter_csv(queryset)
@@ -8,7 +8,9 @@ from django.utils import timezone
 import pytz
 from phonenumber_field.formfields import PhoneNumberField
 
+from core.replicas import use_primary_for_validation
 from sites.models import Site
+from sites.snapshot import get_site_snapshot
 from .models import Booking, BookingTableRelationship, Client
 from .utils import BookingSystem
 
@@ -27,10 +29,11 @@ class BookingBaseForm(forms.ModelForm):
 
     def __init__(self, site, *args, **kwargs):
         self.site = site
+        self.snapshot = get_site_snapshot(site)
         self.booking_system = None
         super().__init__(*args, **kwargs)
         party_choices = [
-            (x, x) for x in range(self.site.min_party_num, self.site.max_party_num + 1)
+            (x, x) for x in range(self.snapshot.min_party_num, self.snapshot.max_party_num + 1)
         ]
         self.fields['party'] = forms.ChoiceField(
             choices=party_choices,
@@ -83,8 +86,9 @@ class CreateBookingForm(BookingBaseForm):
         party_size = int(cleaned_data.get('party'))
         time = cleaned_data.get('time')
 
-        self.booking_system = BookingSystem(self.site, date, party_size)
-        time_slot_available = self.booking_system.check_time_slot_available(time)
+        self.booking_system = BookingSystem(self.snapshot, date, party_size)
+        with use_primary_for_validation():
+            time_slot_available = self.booking_system.check_time_slot_available(time)
 
         if not time_slot_available:
             raise ValidationError('The time slot selected is not available.')
@@ -112,7 +116,7 @@ class CreateBookingForm(BookingBaseForm):
             client=client,
             booking_date=booking_date,
             party=self.cleaned_data.get('party'),
-            duration=self.site.booking_duration,
+            duration=self.snapshot.booking_duration,
             notes=self.cleaned_data.get('notes'),
             created_by_user=user,
         )
@@ -151,13 +155,14 @@ class UpdateBookingForm(BookingBaseForm):
         duration = cleaned_data.get('duration')
 
         self.booking_system = BookingSystem(
-            self.site,
+            self.snapshot,
             date,
             int(party_size),
             duration=duration,
             exclude_booking_id=self.instance.id,
         )
-        time_slot_available = self.booking_system.check_time_slot_available(time)
+        with use_primary_for_validation():
+            time_slot_available = self.booking_system.check_time_slot_available(time)
 
         if not time_slot_available:
             raise ValidationError(
@@ -0,0 +1,46 @@
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from ...archive import archive_bookings, restore_bookings
+from ...models import ArchivedBooking
+
+
+class Command(BaseCommand):
+    help = (
+        'Move the Bookings older than BOOKING_ARCHIVE_AFTER days into the archive, in '
+        'chunks with a pause between each. Safe to interrupt and run again. With '
+        '--restore-client, move the archived Bookings of a Client back instead.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--before', help='Archive the Bookings before this date, YYYY-MM-DD.')
+        parser.add_argument('--chunk-size', type=int, help='Bookings archived per transaction.')
+        parser.add_argument('--max-chunks', type=int, help='Chunks archived before stopping.')
+        parser.add_argument('--pause', type=float, help='Seconds between chunks.')
+        parser.add_argument(
+            '--restore-client', type=int, help='Id of the Client to restore the Bookings of.'
+        )
+
+    def handle(self, *args, **options):
+        if client_id := options['restore_client']:
+            count = restore_bookings(ArchivedBooking.objects.filter(client_id=client_id))
+            self.stdout.write(f'Restored {count} Bookings')
+            return
+
+        cutoff = None
+        if value := options['before']:
+            try:
+                date = parse_date(value)
+            except ValueError:
+                date = None
+            if date is None:
+                raise CommandError(f'"{value}" is not a valid date, use YYYY-MM-DD')
+            cutoff = timezone.make_aware(datetime.combine(date, time()))
+
+        count = archive_bookings(
+            cutoff, options['chunk_size'], options['max_chunks'], options['pause']
+        )
+        self.stdout.write(f'Archived {count} Bookings')
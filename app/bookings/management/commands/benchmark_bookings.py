@@ -0,0 +1,134 @@
+import random
+import statistics
+import string
+import time
+from datetime import timedelta
+from itertools import islice, product
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from sites.models import Site
+from ...filters import filter_bookings, get_date_range_filter
+from ...models import Booking, Client
+from ...partitioning import is_partitioned
+from ...utils import get_booked_tables
+
+BENCHMARK_SITE_NAME = 'Benchmark'
+BENCHMARK_CLIENT_EMAIL = 'benchmark@example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        'Time the calendar, availability and Booking list queries of a Site, to compare '
+        'them before and after partitioning the Booking table. Bookings can first be '
+        'seeded for a Site made for the benchmark, only do so on a scratch database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--site', type=int, help='Id of the Site to query.')
+        parser.add_argument(
+            '--seed', type=int, default=0, help='Bookings to seed for the benchmark Site.'
+        )
+        parser.add_argument(
+            '--years', type=int, default=3, help='Years the seeded Bookings are spread over.'
+        )
+        parser.add_argument('--runs', type=int, default=5, help='Times to run each query.')
+        parser.add_argument('--explain', action='store_true', help='Show the query plans.')
+
+    def handle(self, *args, **options):
+        if options['seed']:
+            site = self.seed_bookings(options['seed'], options['years'])
+        elif options['site']:
+            try:
+                site = Site.objects.get(id=options['site'])
+            except Site.DoesNotExist:
+                raise CommandError(f'Site "{options["site"]}" does not exist')
+        else:
+            site = Site.objects.filter(site_name=BENCHMARK_SITE_NAME).first()
+            if site is None:
+                raise CommandError('Give the --site to query, or --seed Bookings first')
+
+        partitioned = 'partitioned' if is_partitioned() else 'not partitioned'
+        self.stdout.write(
+            f'{site}: {Booking.objects.filter(site=site).count()} Bookings, table {partitioned}'
+        )
+
+        for name, queryset in self.get_queries(site).items():
+            timings = []
+            for _ in range(options['runs']):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+
+            self.stdout.write(
+                f'{name}: median {statistics.median(timings):.1f}ms, '
+                f'min {min(timings):.1f}ms over {len(timings)} runs'
+            )
+            if options['explain']:
+                self.stdout.write(queryset.explain())
+
+    def get_queries(self, site):
+        """Return the querysets of the hot paths, as they query the current week."""
+        today = timezone.localdate()
+        return {
+            'calendar': Booking.objects.filter(
+                get_date_range_filter('booking_date', today, today + timedelta(days=6)),
+                site=site,
+                status=Booking.StatusChoices.CONFIRMED,
+            )
+            .select_related('site', 'client')
+            .prefetch_related('tables'),
+            'availability': get_booked_tables(site.id, today),
+            'list': filter_bookings(Booking.objects.filter(site=site), {})
+            .select_related('client')
+            .order_by('booking_date', 'id')[:50],
+        }
+
+    def seed_bookings(self, count, years, batch_size=10000):
+        """
+        Create the given number of Bookings for the benchmark Site, spread over the given
+        years around today. Created in bulk, so without their emails or events.
+        """
+        site, _ = Site.objects.get_or_create(
+            site_name=BENCHMARK_SITE_NAME, defaults={'slug': 'benchmark'}
+        )
+        client, _ = Client.objects.get_or_create(
+            client_email=BENCHMARK_CLIENT_EMAIL,
+            defaults={'client_name': 'Benchmark', 'client_phone': '+441234567890'},
+        )
+
+        # Lowercase references never clash with those Booking.save() generates.
+        offset = Booking.objects.filter(site=site).count()
+        if offset + count > len(string.ascii_lowercase) ** 5:
+            raise CommandError('Too many Bookings to seed unique references for')
+        references = (
+            ''.join(letters)
+            for letters in islice(product(string.ascii_lowercase, repeat=5), offset, None)
+        )
+
+        rng = random.Random(offset)
+        start = timezone.now() - timedelta(days=365 * (years - 1))
+        slots = years * 365 * 24 * 4
+
+        for x in range(0, count, batch_size):
+            bookings = [
+                Booking(
+                    reference=next(references),
+                    site=site,
+                    client=client,
+                    booking_date=start + timedelta(minutes=15 * rng.randrange(slots)),
+                    party=rng.randint(1, 6),
+                    duration=site.booking_duration,
+                    status=rng.choice(
+                        [Booking.StatusChoices.CONFIRMED] * 9 + [Booking.StatusChoices.CANCELLED]
+                    ),
+                )
+                for _ in range(min(batch_size, count - x))
+            ]
+            with transaction.atomic():
+                Booking.objects.bulk_create(bookings)
+            self.stdout.write(f'Seeded {x + len(bookings)} of {count} Bookings')
+
+        return site
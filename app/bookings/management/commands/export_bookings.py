@@ -0,0 +1,51 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from ...export import EXPORT_FORMATS, iter_export
+from ...filters import filter_bookings
+from ...models import Booking
+
+
+class Command(BaseCommand):
+    help = (
+        'Export Bookings as CSV or JSON lines, with the same filters as the Booking list. '
+        'All dates are exported unless filtered.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv')
+        parser.add_argument('--output', '-o', help='File to write to, stdout if not given.')
+        parser.add_argument('--user', help='Only export the Bookings this username can see.')
+        parser.add_argument('--site', dest='booking_site', help='Id of the Site to export.')
+        parser.add_argument('--from', dest='date_from', help='First date, YYYY-MM-DD.')
+        parser.add_argument('--to', dest='date_to', help='Last date, YYYY-MM-DD.')
+        parser.add_argument('--query', dest='q', help='Search query.')
+
+    def handle(self, *args, **options):
+        queryset = Booking.objects.all()
+
+        if username := options['user']:
+            try:
+                user = get_user_model().objects.get(username=username)
+            except get_user_model().DoesNotExist:
+                raise CommandError(f'User "{username}" does not exist')
+            queryset = Booking.objects.get_bookings(user)
+
+        params = {
+            'booking_date_filter': 'all',
+            **{
+                name: options[name]
+                for name in ('booking_site', 'date_from', 'date_to', 'q')
+                if options[name]
+            },
+        }
+        queryset = filter_bookings(queryset, params)
+
+        lines = iter_export(queryset, options['format'])
+
+        if options['output']:
+            with open(options['output'], 'w', newline='') as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
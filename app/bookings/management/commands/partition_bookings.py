@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import NotSupportedError
+
+from ...partitioning import create_partitions, partition_table
+
+
+class Command(BaseCommand):
+    help = (
+        'Partition the Booking table by month on booking_date, on PostgreSQL. The table is '
+        'locked while its Bookings are copied, so run it during maintenance. Once '
+        'partitioned, the partitions of the months ahead are created daily.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead', type=int, help='Months to create partitions ahead of.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            partitioned = partition_table(options['months_ahead'])
+        except NotSupportedError as e:
+            raise CommandError(e)
+
+        if partitioned:
+            self.stdout.write('Partitioned the Booking table')
+        else:
+            created = create_partitions(options['months_ahead'])
+            self.stdout.write(
+                f'The Booking table is already partitioned, created {len(created)} partitions'
+            )
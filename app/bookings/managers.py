@@ -1,5 +1,8 @@
+from django.apps import apps
 from django.db import models
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, Max, Min, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 
 class ClientManager(models.Manager):
@@ -11,15 +14,66 @@ class ClientManager(models.Manager):
         """
         Method to filter the Client's available based on the User's manager status.
         """
-        queryset = super().get_queryset().prefetch_related('bookings')
+        queryset = super().get_queryset()
 
         if not user.is_manager:
-            queryset = queryset.annotate(
-                booking_count=Count('bookings', filter=Q(bookings__site_id=user.site_id))
-            ).filter(booking_count__gt=0)
+            Booking = apps.get_model('bookings', 'Booking')
+            ArchivedClientStats = apps.get_model('bookings', 'ArchivedClientStats')
+            queryset = queryset.filter(
+                Exists(Booking.objects.filter(client=OuterRef('pk'), site_id=user.site_id))
+                | Exists(
+                    ArchivedClientStats.objects.filter(
+                        client=OuterRef('pk'), site_id=user.site_id
+                    )
+                )
+            )
 
         return queryset
 
+    def get_clients_with_stats(self, user):
+        """
+        Method to return the Clients available to the User annotated with the number of
+        Bookings, and the dates of their last and next visits, at the Sites they can
+        see. The stats are correlated subqueries so only the rows fetched, such as a
+        single page, are aggregated. Archived Bookings are counted from their stats.
+        """
+        Booking = apps.get_model('bookings', 'Booking')
+        ArchivedClientStats = apps.get_model('bookings', 'ArchivedClientStats')
+        bookings = Booking.objects.filter(client=OuterRef('pk')).order_by().values('client')
+        archived = (
+            ArchivedClientStats.objects.filter(client=OuterRef('pk'))
+            .order_by()
+            .values('client')
+        )
+        if not user.is_manager:
+            bookings = bookings.filter(site_id=user.site_id)
+            archived = archived.filter(site_id=user.site_id)
+
+        now = timezone.now()
+        visits = bookings.filter(status=Booking.StatusChoices.CONFIRMED)
+
+        return self.get_clients(user).annotate(
+            booking_count=Coalesce(
+                Subquery(bookings.annotate(count=Count('id')).values('count')), 0
+            )
+            + Coalesce(Subquery(archived.annotate(count=Sum('total')).values('count')), 0),
+            # Archived Bookings are older than any in the Booking table, so are only the
+            # last visit if there is none there.
+            last_visit=Coalesce(
+                Subquery(
+                    visits.filter(booking_date__lt=now)
+                    .annotate(last_visit=Max('booking_date'))
+                    .values('last_visit')
+                ),
+                Subquery(archived.annotate(last_visit=Max('last_visit')).values('last_visit')),
+            ),
+            next_visit=Subquery(
+                visits.filter(booking_date__gte=now)
+                .annotate(next_visit=Min('booking_date'))
+                .values('next_visit')
+            ),
+        )
+
 
 class BookingManager(models.Manager):
     """
@@ -0,0 +1,21 @@
+# Generated by Django 3.2 on 2026-10-19 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_booking_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['booking_date', 'id'], name='bookings_bo_booking_544863_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['client_name', 'id'], name='bookings_cl_client__b5e330_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 3.2 on 2026-10-19 10:00
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# The expressions must match those searched in bookings.search.PostgresSearchBackend.
+INDEXES = {
+    'bookings_client_name_trgm': 'UPPER(client_name::text) gin_trgm_ops',
+    'bookings_client_email_trgm': 'UPPER(client_email::text) gin_trgm_ops',
+    'bookings_client_phone_trgm': "regexp_replace(client_phone, '\\D', '', 'g') gin_trgm_ops",
+}
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, expression in INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON bookings_client USING gin ({expression})'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name in INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_booking_client_keyset_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
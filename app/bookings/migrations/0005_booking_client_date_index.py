@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0004_client_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['client', 'booking_date'], name='bookings_bo_client__a1774a_idx'),
+        ),
+    ]
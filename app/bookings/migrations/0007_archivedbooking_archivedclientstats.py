@@ -0,0 +1,51 @@
+# Generated by Django 3.2 on 2026-10-19 13:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0003_schedule_override'),
+        ('bookings', '0006_outboxevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedClientStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('cancelled', models.PositiveIntegerField(default=0)),
+                ('visits', models.PositiveIntegerField(default=0)),
+                ('party_total', models.PositiveIntegerField(default=0)),
+                ('first_visit', models.DateTimeField(blank=True, null=True)),
+                ('last_visit', models.DateTimeField(blank=True, null=True)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_stats', to='bookings.client')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_client_stats', to='sites.site')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedBooking',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('reference', models.CharField(max_length=5, unique=True)),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'Confirmed'), (2, 'Cancelled')])),
+                ('booking_date', models.DateTimeField()),
+                ('party', models.PositiveSmallIntegerField()),
+                ('data', models.BinaryField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_bookings', to='bookings.client')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_bookings', to='sites.site')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='archivedclientstats',
+            constraint=models.UniqueConstraint(fields=('client', 'site'), name='archived_client_site_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedbooking',
+            index=models.Index(fields=['client', 'booking_date'], name='bookings_ar_client__9e7a06_idx'),
+        ),
+    ]
@@ -1,8 +1,11 @@
+import json
 import random
 import string
+import zlib
 
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Count, Max, Min, Q, Sum
 from django.utils import timezone
 
 from phonenumber_field.modelfields import PhoneNumberField
@@ -28,6 +31,9 @@ class Client(models.Model):
 
     objects = ClientManager()
 
+    class Meta:
+        indexes = [models.Index(fields=['client_name', 'id'])]
+
     def __str__(self):
         return f'{self.client_name} | {self.client_email}'
 
@@ -36,13 +42,69 @@ class Client(models.Model):
         Method to return the Bookings of the given Client. Results are filtered
         depending on the passed User's manager status.
         """
-        bookings = self.bookings.all().order_by('-booking_date')
+        bookings = self.bookings.select_related('site').order_by('-booking_date', '-id')
+
+        if not user.is_manager:
+            bookings = bookings.filter(site=user.site)
+
+        return bookings
+
+    def get_archived_bookings(self, user):
+        """
+        Method to return the archived Bookings of the given Client visible to the User.
+        """
+        bookings = self.archived_bookings.select_related('site').order_by(
+            '-booking_date', '-id'
+        )
 
         if not user.is_manager:
             bookings = bookings.filter(site=user.site)
 
         return bookings
 
+    def get_booking_stats(self, user):
+        """
+        Method to return the history stats of the Client's Bookings visible to the given
+        User, aggregated in a single query, along with the stats of those archived.
+        """
+        now = timezone.now()
+        confirmed = Q(status=Booking.StatusChoices.CONFIRMED)
+
+        stats = self.get_bookings(user).aggregate(
+            total=Count('id'),
+            cancelled=Count('id', filter=Q(status=Booking.StatusChoices.CANCELLED)),
+            visits=Count('id', filter=confirmed & Q(booking_date__lt=now)),
+            upcoming=Count('id', filter=confirmed & Q(booking_date__gte=now)),
+            confirmed=Count('id', filter=confirmed),
+            party_total=Sum('party', filter=confirmed),
+            first_visit=Min('booking_date', filter=confirmed),
+            last_visit=Max('booking_date', filter=confirmed & Q(booking_date__lt=now)),
+        )
+
+        archived_stats = self.archived_stats.all()
+        if not user.is_manager:
+            archived_stats = archived_stats.filter(site=user.site)
+        archived = archived_stats.aggregate(
+            total=Sum('total'),
+            cancelled=Sum('cancelled'),
+            visits=Sum('visits'),
+            party_total=Sum('party_total'),
+            first_visit=Min('first_visit'),
+            last_visit=Max('last_visit'),
+        )
+
+        # Archived Bookings are all past, so every confirmed one was a visit.
+        stats['archived'] = archived['total'] or 0
+        for name in ('total', 'cancelled', 'visits', 'party_total'):
+            stats[name] = (stats[name] or 0) + (archived[name] or 0)
+        confirmed_total = stats.pop('confirmed') + (archived['visits'] or 0)
+        party_total = stats.pop('party_total')
+        stats['average_party'] = party_total / confirmed_total if confirmed_total else None
+        stats['first_visit'] = archived['first_visit'] or stats['first_visit']
+        stats['last_visit'] = stats['last_visit'] or archived['last_visit']
+
+        return stats
+
 
 class Booking(models.Model):
     """
@@ -81,6 +143,7 @@ class Booking(models.Model):
     )
     duration = models.PositiveSmallIntegerField(choices=Site.BookingDurationChoices.choices)
     booking_created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     created_by_user = models.ForeignKey(
         get_user_model(),
         on_delete=models.SET_NULL,
@@ -89,9 +152,22 @@ class Booking(models.Model):
 
     objects = BookingManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['booking_date', 'id']),
+            models.Index(fields=['client', 'booking_date']),
+        ]
+
     def __str__(self):
         return f'Booking #{self.reference}'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep the date loaded to know which dates are affected when the Booking moves.
+        instance._loaded_booking_date = instance.__dict__.get('booking_date')
+        return instance
+
     def save(self, send_update_email=True, *args, **kwargs):
         # When the model is created, generate the reference number of the Booking.
         if not self.reference:
@@ -99,7 +175,10 @@ class Booking(models.Model):
                 reference = ''.join(
                     random.choice(string.ascii_uppercase + string.digits) for _ in range(5)
                 )
-                if not Booking.objects.filter(reference=reference).exists():
+                if not (
+                    Booking.objects.filter(reference=reference).exists()
+                    or ArchivedBooking.objects.filter(reference=reference).exists()
+                ):
                     self.reference = reference
                     break
 
@@ -148,3 +227,104 @@ class BookingTableRelationship(models.Model):
 
     def __str__(self):
         return f'{self.booking.reference} | {self.table}'
+
+
+class OutboxEvent(models.Model):
+    """
+    Model to store an event of the outbox, written in the same transaction as the change
+    it records and relayed to the consumers of its topic once committed.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    topic = models.CharField(max_length=50)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(
+                fields=['id'],
+                condition=Q(delivered_at__isnull=True),
+                name='outbox_pending_idx',
+            ),
+            models.Index(fields=['delivered_at'], name='outbox_delivered_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.id} | {self.topic}'
+
+
+class ArchivedBooking(models.Model):
+    """
+    Model to store a Booking moved out of the Booking table once older than the archive
+    horizon. The columns needed to list it are kept as a stub, and the rest of the
+    Booking and its Tables compressed, so it can be restored as it was.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    reference = models.CharField(max_length=5, unique=True)
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name='archived_bookings',
+    )
+    client = models.ForeignKey(
+        Client,
+        on_delete=models.CASCADE,
+        related_name='archived_bookings',
+    )
+    status = models.PositiveSmallIntegerField(choices=Booking.StatusChoices.choices)
+    booking_date = models.DateTimeField()
+    party = models.PositiveSmallIntegerField()
+    data = models.BinaryField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    StatusChoices = Booking.StatusChoices
+
+    class Meta:
+        indexes = [models.Index(fields=['client', 'booking_date'])]
+
+    def __str__(self):
+        return f'Booking #{self.reference}'
+
+    @staticmethod
+    def compress(data):
+        return zlib.compress(json.dumps(data, separators=(',', ':')).encode())
+
+    def get_data(self):
+        return json.loads(zlib.decompress(self.data))
+
+
+class ArchivedClientStats(models.Model):
+    """
+    Model to store the counts of the archived Bookings of a Client at a Site, so their
+    history is still counted without reading the archive.
+    """
+
+    client = models.ForeignKey(
+        Client,
+        on_delete=models.CASCADE,
+        related_name='archived_stats',
+    )
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name='archived_client_stats',
+    )
+    total = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    visits = models.PositiveIntegerField(default=0)
+    party_total = models.PositiveIntegerField(default=0)
+    first_visit = models.DateTimeField(null=True, blank=True)
+    last_visit = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['client', 'site'], name='archived_client_site_unique')
+        ]
+
+    def __str__(self):
+        return f'{self.client} | {self.site}'
@@ -0,0 +1,111 @@
+import logging
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+RELAY_LOCK_KEY = 'bookings.outbox.relay'
+
+# The consumer of each topic, registered with register_consumer().
+_consumers = {}
+
+
+def register_consumer(topic, consumer):
+    """
+    Register the function the events of a topic are relayed to, called with the payload
+    of each event. Events are delivered at least once, so consumers must be idempotent.
+    """
+    _consumers[topic] = consumer
+
+
+def record_event(topic, payload):
+    """
+    Write an event to the outbox. It is part of the current transaction, so is only
+    relayed if the change it records is committed.
+    """
+    return OutboxEvent.objects.create(topic=topic, payload=payload)
+
+
+def deliver_events(events):
+    """
+    Deliver the given events to their consumers in order. Returns the ids of the events
+    delivered and of those to retry.
+    """
+    delivered, failed = [], []
+
+    for event in events:
+        consumer = _consumers.get(event.topic)
+        if consumer is None:
+            logger.error('No consumer of outbox event %s on topic %s', event.id, event.topic)
+            delivered.append(event.id)
+            continue
+
+        try:
+            consumer(event.payload)
+        except Exception:
+            logger.exception('Failed to deliver outbox event %s', event.id)
+            if event.attempts + 1 >= settings.OUTBOX_MAX_ATTEMPTS:
+                # Given up on, rather than retried forever.
+                delivered.append(event.id)
+            else:
+                failed.append(event.id)
+        else:
+            delivered.append(event.id)
+
+    return delivered, failed
+
+
+def relay_events():
+    """
+    Relay the undelivered events of the outbox to their consumers in batches, in the
+    order they were written. Only one relay runs at a time so the order is kept, and it
+    stops well before its lock expires, leaving the rest to the next. Events which fail
+    are retried by the next relay. Returns the number of events delivered.
+    """
+    token = uuid.uuid4().hex
+    if not cache.add(RELAY_LOCK_KEY, token, settings.OUTBOX_RELAY_TIMEOUT):
+        return 0
+
+    deadline = time.monotonic() + settings.OUTBOX_RELAY_TIMEOUT / 2
+    count = 0
+    last_id = 0
+
+    try:
+        while time.monotonic() < deadline:
+            events = list(
+                OutboxEvent.objects.filter(delivered_at__isnull=True, id__gt=last_id)[
+                    : settings.OUTBOX_BATCH_SIZE
+                ]
+            )
+            if not events:
+                break
+
+            delivered, failed = deliver_events(events)
+            OutboxEvent.objects.filter(id__in=delivered).update(delivered_at=timezone.now())
+            OutboxEvent.objects.filter(id__in=failed).update(attempts=F('attempts') + 1)
+
+            count += len(delivered)
+            last_id = events[-1].id
+    finally:
+        if cache.get(RELAY_LOCK_KEY) == token:
+            cache.delete(RELAY_LOCK_KEY)
+
+    return count
+
+
+def compact_events():
+    """
+    Delete the events delivered longer ago than they are kept for. Returns the number of
+    events deleted.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.OUTBOX_RETENTION)
+    count, _ = OutboxEvent.objects.filter(delivered_at__lt=cutoff).delete()
+    return count
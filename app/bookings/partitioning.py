@@ -0,0 +1,189 @@
+from datetime import date, datetime, time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, NotSupportedError, connections, transaction
+from django.utils import timezone
+
+from .models import Booking
+
+TABLE = Booking._meta.db_table
+DEFAULT_PARTITION = f'{TABLE}_default'
+UNPARTITIONED_TABLE = f'{TABLE}_unpartitioned'
+
+
+def add_months(value, months):
+    """Return the first day of the month the given number of months after a date."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def get_partition_name(month):
+    return f'{TABLE}_y{month:%Y}m{month:%m}'
+
+
+def get_month_bounds(month):
+    """
+    Return the range of booking_date held by the partition of a month, from local
+    midnight on its first day, so the dates of a local date range fall in one partition.
+    """
+    tz = timezone.get_current_timezone()
+    return (
+        timezone.make_aware(datetime.combine(month, time()), tz),
+        timezone.make_aware(datetime.combine(add_months(month, 1), time()), tz),
+    )
+
+
+def is_partitioned(using=DEFAULT_DB_ALIAS):
+    """Return True if the Booking table is partitioned."""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))',
+            [TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def create_partition(cursor, month):
+    """
+    Create the partition of a month unless it exists, moving any Bookings of the month
+    out of the default partition into it. Returns True if it was created.
+    """
+    name = get_partition_name(month)
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [name])
+    if cursor.fetchone()[0]:
+        return False
+
+    qn = cursor.db.ops.quote_name
+    start, end = get_month_bounds(month)
+
+    # A partition can't be attached while the default partition holds rows of its range.
+    cursor.execute(
+        f'CREATE TABLE {qn(name)} (LIKE {qn(TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    )
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION)} '
+        f'WHERE booking_date >= %s AND booking_date < %s RETURNING *) '
+        f'INSERT INTO {qn(name)} SELECT * FROM moved',
+        [start, end],
+    )
+    cursor.execute(
+        f'ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(name)} FOR VALUES FROM (%s) TO (%s)',
+        [start, end],
+    )
+    return True
+
+
+def create_partitions(months_ahead=None, using=DEFAULT_DB_ALIAS):
+    """
+    Create the partitions of the current month and the months ahead, if the Booking
+    table is partitioned. Returns the names of the partitions created.
+    """
+    if not is_partitioned(using):
+        return []
+
+    if months_ahead is None:
+        months_ahead = settings.BOOKING_PARTITION_MONTHS_AHEAD
+    this_month = timezone.localdate().replace(day=1)
+
+    created = []
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        for x in range(months_ahead + 1):
+            month = add_months(this_month, x)
+            if create_partition(cursor, month):
+                created.append(get_partition_name(month))
+
+    return created
+
+
+def partition_table(months_ahead=None, using=DEFAULT_DB_ALIAS):
+    """
+    Convert the Booking table to one partitioned by month on booking_date, copying the
+    Bookings into a partition for each month they are on. Runs in a transaction holding
+    an exclusive lock on the table throughout, so is best run during maintenance.
+
+    A partitioned table can only have unique keys which include booking_date, so the
+    primary key becomes (id, booking_date), the reference is indexed but only kept unique
+    by Booking.save(), and the foreign key of BookingTableRelationship is dropped. Django
+    deletes the relationships of a deleted Booking itself, so this is not relied on.
+    Returns False if the table is already partitioned.
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        raise NotSupportedError('Only PostgreSQL supports partitioning the Booking table.')
+
+    if months_ahead is None:
+        months_ahead = settings.BOOKING_PARTITION_MONTHS_AHEAD
+    qn = connection.ops.quote_name
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE {qn(TABLE)} IN ACCESS EXCLUSIVE MODE')
+        if is_partitioned(using):
+            return False
+
+        # Read what is recreated on the partitioned table, named as it is now.
+        cursor.execute(
+            'SELECT pg_get_indexdef(indexrelid) FROM pg_index '
+            'WHERE indrelid = %s::regclass AND NOT indisprimary',
+            [TABLE],
+        )
+        indexes = [
+            definition.replace('CREATE UNIQUE INDEX', 'CREATE INDEX')
+            for definition, in cursor.fetchall()
+        ]
+        cursor.execute(
+            'SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint '
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            'SELECT conrelid::regclass, conname FROM pg_constraint '
+            "WHERE confrelid = %s::regclass AND contype = 'f'",
+            [TABLE],
+        )
+        references = cursor.fetchall()
+        cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [TABLE, 'id'])
+        sequence = cursor.fetchone()[0]
+        cursor.execute(f'SELECT MIN(booking_date), MAX(booking_date) FROM {qn(TABLE)}')
+        first, last = cursor.fetchone()
+
+        for table, name in references:
+            cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT {qn(name)}')
+
+        cursor.execute(f'ALTER TABLE {qn(TABLE)} RENAME TO {qn(UNPARTITIONED_TABLE)}')
+        cursor.execute(
+            f'CREATE TABLE {qn(TABLE)} (LIKE {qn(UNPARTITIONED_TABLE)} '
+            f'INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (booking_date)'
+        )
+        cursor.execute(f'ALTER SEQUENCE {sequence} OWNED BY {qn(TABLE)}.id')
+        cursor.execute(f'CREATE TABLE {qn(DEFAULT_PARTITION)} PARTITION OF {qn(TABLE)} DEFAULT')
+
+        # A partition for every month with Bookings, and those ahead of the current one.
+        this_month = timezone.localdate().replace(day=1)
+        month = min(timezone.localdate(first).replace(day=1), this_month) if first else this_month
+        last_month = add_months(this_month, months_ahead)
+        if last:
+            last_month = max(timezone.localdate(last).replace(day=1), last_month)
+        while month <= last_month:
+            start, end = get_month_bounds(month)
+            cursor.execute(
+                f'CREATE TABLE {qn(get_partition_name(month))} PARTITION OF {qn(TABLE)} '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [start, end],
+            )
+            month = add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO {qn(TABLE)} SELECT * FROM {qn(UNPARTITIONED_TABLE)}')
+        cursor.execute(f'DROP TABLE {qn(UNPARTITIONED_TABLE)}')
+
+        cursor.execute(f'ALTER TABLE {qn(TABLE)} ADD PRIMARY KEY (id, booking_date)')
+        for definition in indexes:
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(name)} {definition}')
+
+    return True
@@ -0,0 +1,118 @@
+import re
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections
+from django.db.models import Case, F, FloatField, Func, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest, Replace, Upper
+
+import phonenumbers
+
+# Trigram indexes cannot help with shorter queries than this.
+MIN_PHONE_DIGITS = 3
+
+
+def normalize_phone(value):
+    """
+    Return the digits of the given phone number in the national format it is stored in,
+    so '+44 7700 900123' and '07700900123' both become '07700900123'.
+    """
+    try:
+        number = phonenumbers.parse(value, settings.PHONENUMBER_DEFAULT_REGION)
+        value = phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.NATIONAL)
+    except phonenumbers.NumberParseException:
+        pass
+    return re.sub(r'\D', '', value)
+
+
+class SearchBackend:
+    """
+    Portable search of Clients and Bookings, used with databases other than
+    PostgreSQL. Filters by case-insensitive containment and ranks prefix matches first.
+    """
+
+    def annotate_search(self, queryset, prefix=''):
+        """Annotate the fields searched other than the Client's name and email."""
+        phone = Replace(F(f'{prefix}client_phone'), Value(' '), Value(''))
+        return queryset.annotate(search_phone=Replace(phone, Value('-'), Value('')))
+
+    def get_client_filter(self, query, prefix=''):
+        """Return the filter matching Clients by name, email or phone number."""
+        client_filter = Q(**{f'{prefix}client_name__icontains': query}) | Q(
+            **{f'{prefix}client_email__icontains': query}
+        )
+
+        if len(digits := normalize_phone(query)) >= MIN_PHONE_DIGITS:
+            client_filter |= Q(search_phone__contains=digits)
+
+        return client_filter
+
+    def search_clients(self, queryset, query):
+        queryset = self.annotate_search(queryset)
+        return queryset.filter(self.get_client_filter(query))
+
+    def search_bookings(self, queryset, query):
+        """
+        Filter Bookings by reference or Client. References are generated in upper case
+        so exact lookups of the query as given and upper cased can use the unique index,
+        where a case-insensitive lookup would not.
+        """
+        queryset = self.annotate_search(queryset, 'client__')
+        return queryset.filter(
+            Q(reference__in={query, query.upper()}) | self.get_client_filter(query, 'client__')
+        )
+
+    def rank_clients(self, queryset, query):
+        """Return the Clients matching the query with the best matches first."""
+        queryset = self.search_clients(queryset, query).annotate(
+            rank=Case(
+                When(client_name__istartswith=query, then=Value(2)),
+                When(client_email__istartswith=query, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        )
+        return queryset.order_by('-rank', 'client_name', 'id')
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Search backed by the pg_trgm GIN indexes of bookings migration 0004. The icontains
+    lookups compile to UPPER(field) LIKE UPPER(query) which the indexes on the upper
+    cased name and email serve. Names are also matched by trigram similarity so typos
+    are still found, and results are ranked by similarity.
+    """
+
+    def annotate_search(self, queryset, prefix=''):
+        # Both must match the expressions of the indexes to be used.
+        return queryset.annotate(
+            search_name=Upper(f'{prefix}client_name'),
+            search_phone=Func(
+                F(f'{prefix}client_phone'),
+                Value(r'\D'),
+                Value(''),
+                Value('g'),
+                function='regexp_replace',
+            ),
+        )
+
+    def get_client_filter(self, query, prefix=''):
+        return super().get_client_filter(query, prefix) | Q(
+            search_name__trigram_similar=query.upper()
+        )
+
+    def rank_clients(self, queryset, query):
+        queryset = self.search_clients(queryset, query).annotate(
+            rank=Greatest(
+                TrigramSimilarity('client_name', query),
+                TrigramSimilarity('client_email', query),
+                output_field=FloatField(),
+            )
+        )
+        return queryset.order_by('-rank', 'client_name', 'id')
+
+
+def get_search_backend(using='default'):
+    if connections[using].vendor == 'postgresql':
+        return PostgresSearchBackend()
+    return SearchBackend()
@@ -0,0 +1,67 @@
+from rest_framework import serializers
+
+from core.api import SparseFieldsSerializerMixin
+from .models import Booking, Client
+
+
+class BookingSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Booking model.
+    """
+
+    site_name = serializers.CharField(source='site.site_name', read_only=True)
+    client_name = serializers.CharField(source='client.client_name', read_only=True)
+    client_email = serializers.EmailField(source='client.client_email', read_only=True)
+    client_phone = serializers.CharField(source='client.client_phone', read_only=True)
+    status = serializers.CharField(source='get_status_display', read_only=True)
+
+    class Meta:
+        model = Booking
+        fields = [
+            'id',
+            'reference',
+            'site',
+            'site_name',
+            'client',
+            'client_name',
+            'client_email',
+            'client_phone',
+            'booking_date',
+            'party',
+            'duration',
+            'status',
+            'notes',
+            'tables',
+            'booking_created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
+
+
+class ClientSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Client model.
+    """
+
+    client_phone = serializers.CharField(read_only=True)
+
+    class Meta:
+        model = Client
+        fields = [
+            'id',
+            'client_name',
+            'client_email',
+            'client_phone',
+        ]
+        read_only_fields = fields
+
+
+class AvailabilityQuerySerializer(serializers.Serializer):
+    """
+    Serializer for a single query of a batch of availability queries.
+    """
+
+    site = serializers.IntegerField()
+    date = serializers.DateField()
+    party_size = serializers.IntegerField(min_value=1)
+    time = serializers.TimeField(required=False)
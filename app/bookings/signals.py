@@ -1,9 +1,74 @@
-from django.db.models.signals import pre_delete
+import logging
+from datetime import date, datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import Signal
 from django.dispatch.dispatcher import receiver
 from django.utils import timezone
 
 from sites.models import Table
+from .availability import invalidate_availability
 from .models import Booking, BookingTableRelationship
+from .outbox import record_event, register_consumer
+from .tasks import relay_outbox, warm_availability
+
+logger = logging.getLogger(__name__)
+
+BOOKING_CHANGED = 'booking.changed'
+
+# Sent by the outbox relay for each change to a Booking, or the Tables assigned to it,
+# once committed. Receivers are passed the `booking_id` and `site_id` of the Booking,
+# and the local `dates` it was and is now on. Bookings changed in bulk are sent once per
+# Site, with a `booking_id` of None and the dates of all of them. A change may be sent
+# more than once, so receivers must be idempotent.
+booking_changed = Signal()
+
+
+def get_local_date(value):
+    if isinstance(value, datetime):
+        return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+    return value
+
+
+def notify_booking_changed(booking_id, site_id, dates=()):
+    """
+    Record a change to a Booking in the outbox, in the transaction making the change, and
+    relay it to the booking_changed receivers once the transaction is committed.
+    """
+    dates = sorted({get_local_date(value) for value in dates if value is not None})
+    record_event(
+        BOOKING_CHANGED,
+        {
+            'booking_id': booking_id,
+            'site_id': site_id,
+            'dates': [value.isoformat() for value in dates],
+        },
+    )
+    transaction.on_commit(relay_outbox.delay)
+
+
+def send_booking_changed(payload):
+    """
+    Send the booking_changed signal for an event of the outbox. Every receiver is sent
+    the change even if one fails, and the event is retried if any did.
+    """
+    responses = booking_changed.send_robust(
+        sender=Booking,
+        booking_id=payload['booking_id'],
+        site_id=payload['site_id'],
+        dates=tuple(date.fromisoformat(value) for value in payload['dates']),
+    )
+
+    errors = [response for _, response in responses if isinstance(response, Exception)]
+    for error in errors:
+        logger.error('Receiver of booking_changed failed', exc_info=error)
+    if errors:
+        raise errors[0]
+
+
+register_consumer(BOOKING_CHANGED, send_booking_changed)
 
 
 @receiver(pre_delete, sender=Table)
@@ -12,16 +77,51 @@ def cancel_future_bookings(sender, instance, *args, **kwargs):
     When a Table is deleted from a Site, cancel all of the future bookings for that
     Table.
     """
-    relationships = (
-        BookingTableRelationship.objects.filter(
-            table_id=instance.id,
-            booking__status=Booking.StatusChoices.CONFIRMED,
-            booking__booking_date__gte=timezone.now(),
-        )
-        .select_related('booking')
-        .order_by('booking')
-        .distinct()
+    from .cancellation import cancel_bookings
+
+    cancel_bookings(Booking.objects.filter(tables=instance))
+
+
+@receiver(post_save, sender=BookingTableRelationship)
+@receiver(post_delete, sender=BookingTableRelationship)
+def touch_booking(sender, instance, *args, **kwargs):
+    """
+    When a Table is added to or removed from a Booking, mark the Booking as updated so
+    the change is included in calendar delta-syncs.
+    """
+    Booking.objects.filter(pk=instance.booking_id).update(updated_at=timezone.now())
+
+    booking = (
+        Booking.objects.filter(pk=instance.booking_id)
+        .values_list('site_id', 'booking_date')
+        .first()
     )
+    if booking is not None:
+        notify_booking_changed(instance.booking_id, booking[0], [booking[1]])
+
+
+@receiver(post_save, sender=Booking)
+def booking_saved(sender, instance, *args, **kwargs):
+    """
+    Notify the booking_changed receivers when a Booking is created or updated.
+    """
+    dates = [instance.booking_date, getattr(instance, '_loaded_booking_date', None)]
+    notify_booking_changed(instance.id, instance.site_id, dates)
+    instance._loaded_booking_date = instance.booking_date
+
+
+@receiver(booking_changed)
+def recompute_availability(sender, site_id, dates=(), **kwargs):
+    """
+    Invalidate the availability of the Booking's Site on the dates affected, and
+    recompute those which are precomputed.
+    """
+    today = timezone.localdate()
+    last_date = today + timedelta(days=settings.AVAILABILITY_PRECOMPUTE_DAYS)
+
+    for day in dates:
+        invalidate_availability(site_id, day)
 
-    for relationship in relationships:
-        relationship.booking.cancel_booking()
+    dates = [day.isoformat() for day in dates if today < day <= last_date]
+    if dates:
+        warm_availability.delay(site_id, dates, record_metrics=False)
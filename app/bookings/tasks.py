@@ -1,19 +1,36 @@
+import time
+from datetime import date
+
 from django.utils import timezone
 
 from celery import shared_task
 
 from bookings.models import Booking
+from core.replicas import replica_reads
 from sites.models import Site
-from .email import send_booking_notification_email
+from sites.snapshot import get_site_snapshot
+from .archive import archive_bookings
+from .availability import (
+    compute_availability,
+    get_party_sizes,
+    get_precompute_chunks,
+    get_precompute_dates,
+    increment_metrics,
+    reset_metrics,
+)
+from .email import send_booking_cancelled_emails, send_booking_notification_email
+from .outbox import compact_events, relay_events
+from .partitioning import create_partitions
 
 
 @shared_task
+@replica_reads
 def send_reminder_emails():
     """
     Send reminder emails for all Bookings depending on the email reminder settings for
     their corresponding Site.
     """
-    for site in Site.objects.all():
+    for site in Site.objects.select_related('email_templates'):
         reminder_time = site.email_reminder_time
         now = timezone.now()
 
@@ -38,4 +55,115 @@ def send_reminder_emails():
         ).select_related('client')
 
         for booking in bookings:
+            # Share the Site, and its email templates, rather than loading it per Booking.
+            booking.site = site
             send_booking_notification_email(booking)
+
+
+@shared_task
+def precompute_availability():
+    """
+    Precompute the availability of every Site for the coming days, so the first visitors
+    of the day, or after a change, are not left waiting for it. The work is split into
+    chunks warmed by the workers in parallel.
+    """
+    started = time.monotonic()
+    today = timezone.localdate()
+    chunks = []
+    entries_expected = 0
+
+    for site_id in Site.objects.values_list('id', flat=True):
+        snapshot = get_site_snapshot(site_id)
+        dates = get_precompute_dates(snapshot, today)
+        entries_expected += len(dates) * len(get_party_sizes(snapshot))
+        chunks.extend(
+            (site_id, [day.isoformat() for day in chunk])
+            for chunk in get_precompute_chunks(snapshot, dates)
+        )
+
+    # Recorded before the chunks are sent, as they add to the counters as they finish.
+    metrics = {
+        'started_at': timezone.now().isoformat(),
+        'sites': len({site_id for site_id, _ in chunks}),
+        'dates': sum(len(dates) for _, dates in chunks),
+        'chunks': len(chunks),
+        'entries_expected': entries_expected,
+    }
+    reset_metrics(**metrics)
+
+    for site_id, dates in chunks:
+        warm_availability.delay(site_id, dates)
+
+    metrics['dispatch_runtime_ms'] = int((time.monotonic() - started) * 1000)
+    return metrics
+
+
+@shared_task
+def warm_availability(site_id, dates, record_metrics=True):
+    """
+    Compute and cache the availability of a Site on the given ISO formatted dates.
+    """
+    started = time.monotonic()
+
+    try:
+        entries_computed = sum(
+            compute_availability(site_id, date.fromisoformat(day)) for day in dates
+        )
+    except Site.DoesNotExist:
+        # The Site was deleted since the work was sent.
+        return 0
+
+    if record_metrics:
+        increment_metrics(
+            entries_computed=entries_computed,
+            runtime_ms=int((time.monotonic() - started) * 1000),
+        )
+
+    return entries_computed
+
+
+@shared_task
+def send_cancellation_emails(booking_ids):
+    """
+    Send the cancellation emails of Bookings cancelled in bulk, in a single batch.
+    """
+    bookings = Booking.objects.filter(id__in=booking_ids).select_related(
+        'client', 'site__email_templates'
+    )
+    send_booking_cancelled_emails(bookings)
+    return len(bookings)
+
+
+@shared_task
+def relay_outbox():
+    """
+    Relay the undelivered events of the outbox to their consumers. Sent whenever an
+    event is committed, and on a schedule to retry those which failed.
+    """
+    return relay_events()
+
+
+@shared_task
+def compact_outbox():
+    """
+    Delete the events of the outbox delivered longer ago than they are kept for.
+    """
+    return compact_events()
+
+
+@shared_task
+def create_booking_partitions():
+    """
+    Create the partitions of the months ahead, if the Booking table is partitioned, so
+    new Bookings never fall into the default partition.
+    """
+    return create_partitions()
+
+
+@shared_task
+def archive_old_bookings():
+    """
+    Archive a throttled share of the Bookings older than BOOKING_ARCHIVE_AFTER days.
+    Runs daily, so a backlog is worked through over several runs.
+    """
+    return archive_bookings()
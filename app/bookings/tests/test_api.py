@@ -0,0 +1,268 @@
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from core.pagination import encode_cursor
+from sites.snapshot import _snapshots
+from ..models import Booking, BookingTableRelationship
+
+
+class BookingAPITest(APITestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', site_name='Site 1')
+        self.other_site = baker.make('sites.Site', site_name='Site 2')
+        self.table = baker.make('sites.Table', site=self.site)
+
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+
+        self.bookings = [
+            baker.make(
+                'bookings.Booking',
+                site=self.site,
+                booking_date=datetime.fromisoformat(f'2021-06-0{day}T12:00:00+01:00'),
+            )
+            for day in range(1, 6)
+        ]
+        self.other_booking = baker.make(
+            'bookings.Booking',
+            site=self.other_site,
+            booking_date=datetime.fromisoformat('2021-06-03T12:00:00+01:00'),
+            status=Booking.StatusChoices.CANCELLED,
+        )
+        for booking in self.bookings:
+            BookingTableRelationship.objects.create(booking=booking, table=self.table)
+
+        self.url = reverse('api-booking-list')
+
+    def get_ids(self, response):
+        return [booking['id'] for booking in response.data['results']]
+
+    def test_list(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 6)
+        self.assertIsNone(response.data['next'])
+
+        booking = response.data['results'][0]
+        self.assertEqual(booking['reference'], self.bookings[0].reference)
+        self.assertEqual(booking['site_name'], 'Site 1')
+        self.assertEqual(booking['client_name'], self.bookings[0].client.client_name)
+        self.assertEqual(booking['status'], 'Confirmed')
+        self.assertEqual(booking['tables'], [self.table.id])
+
+    def test_list_scoped_to_site(self):
+        user = baker.make('accounts.User', is_manager=False, site=self.other_site)
+        self.client.force_login(user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(self.get_ids(response), [self.other_booking.id])
+
+    def test_list_token_authentication(self):
+        self.client.logout()
+        token = Token.objects.create(user=self.user)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cursor_pagination(self):
+        response = self.client.get(self.url, {'page_size': 4})
+
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertIsNone(response.data['previous'])
+
+        response = self.client.get(response.data['next'])
+
+        self.assertEqual(
+            self.get_ids(response),
+            [self.bookings[3].id, self.bookings[4].id],
+        )
+        self.assertIsNone(response.data['next'])
+
+        response = self.client.get(response.data['previous'])
+
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertEqual(response.data['results'][0]['id'], self.bookings[0].id)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tampered_cursor(self):
+        response = self.client.get(self.url, {'cursor': encode_cursor(['garbage', 1])})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_sparse_fields(self):
+        response = self.client.get(self.url, {'fields': 'id,reference'})
+
+        self.assertEqual(
+            response.data['results'][0],
+            {'id': self.bookings[0].id, 'reference': self.bookings[0].reference},
+        )
+
+    def test_sparse_fields_unknown(self):
+        response = self.client.get(self.url, {'fields': 'id,password'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', response.data['fields'])
+
+    def test_page_queries_bounded(self):
+        # On PostgreSQL, the statement timeout is set, within a savepoint in the test.
+        timeout_queries = 3 if connection.vendor == 'postgresql' else 0
+
+        # Session, User, Bookings with their Site and Client, Tables.
+        with self.assertNumQueries(4 + timeout_queries):
+            self.client.get(self.url)
+
+        baker.make('bookings.Booking', site=self.site, _quantity=5)
+
+        with self.assertNumQueries(4 + timeout_queries):
+            self.client.get(self.url)
+
+        # Without the Tables they are not prefetched.
+        with self.assertNumQueries(3 + timeout_queries):
+            self.client.get(self.url, {'fields': 'id,client_name'})
+
+    def test_filter_date_range(self):
+        response = self.client.get(self.url, {'date_from': '2021-06-02', 'date_to': '2021-06-03'})
+
+        self.assertEqual(
+            self.get_ids(response),
+            [self.bookings[1].id, self.bookings[2].id, self.other_booking.id],
+        )
+
+    def test_filter_site_and_status(self):
+        response = self.client.get(self.url, {'site': self.other_site.id})
+        self.assertEqual(self.get_ids(response), [self.other_booking.id])
+
+        response = self.client.get(self.url, {'status': 'cancelled'})
+        self.assertEqual(self.get_ids(response), [self.other_booking.id])
+
+        response = self.client.get(self.url, {'status': 'other'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'site': 'other'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filter_updated_since(self):
+        Booking.objects.filter(id=self.bookings[0].id).update(
+            updated_at=datetime.fromisoformat('2030-01-01T00:00:00+00:00')
+        )
+
+        response = self.client.get(self.url, {'updated_since': '2029-12-31T00:00:00Z'})
+
+        self.assertEqual(self.get_ids(response), [self.bookings[0].id])
+
+    def test_detail(self):
+        response = self.client.get(
+            reverse('api-booking-detail', kwargs={'pk': self.bookings[0].id}),
+            {'fields': 'reference'},
+        )
+
+        self.assertEqual(response.data, {'reference': self.bookings[0].reference})
+
+
+class ClientAPITest(APITestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.user = baker.make('accounts.User', is_manager=False, site=self.site)
+        self.client.force_login(self.user)
+
+        self.client_1 = baker.make('bookings.Client', client_name='Ann', client_email='a@a.com')
+        self.client_2 = baker.make('bookings.Client', client_name='Bob', client_email='b@b.com')
+        self.client_3 = baker.make('bookings.Client', client_name='Cat', client_email='c@c.com')
+        baker.make('bookings.Booking', site=self.site, client=self.client_1)
+        baker.make('bookings.Booking', site=self.site, client=self.client_2)
+        baker.make('bookings.Booking', client=self.client_3)
+
+        self.url = reverse('api-client-list')
+
+    def test_list_scoped_to_site(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            [client['client_name'] for client in response.data['results']],
+            ['Ann', 'Bob'],
+        )
+
+    def test_list_search(self):
+        response = self.client.get(self.url, {'q': 'bob', 'fields': 'client_email'})
+
+        self.assertEqual(response.data['results'], [{'client_email': 'b@b.com'}])
+
+    def test_page_queries_bounded(self):
+        # Session, User, Clients.
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+
+class AvailabilityBatchAPITest(APITestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', min_party_num=1, max_party_num=4, last_booking=1)
+        self.other_site = baker.make('sites.Site')
+        baker.make('sites.Table', site=self.site, number_of_seats=4)
+
+        self.user = baker.make('accounts.User', is_manager=False, site=self.site)
+        self.client.force_login(self.user)
+
+        self.date = (timezone.localdate() + timedelta(days=2)).isoformat()
+        self.url = reverse('api-availability')
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+    def test_batch(self):
+        queries = [
+            {'site': self.site.id, 'date': self.date, 'party_size': 2},
+            {'site': self.site.id, 'date': self.date, 'party_size': 2, 'time': '19:00'},
+            {'site': self.site.id, 'date': 'invalid', 'party_size': 2},
+            {'site': self.other_site.id, 'date': self.date, 'party_size': 2},
+            'invalid',
+        ]
+
+        response = self.client.post(self.url, {'queries': queries}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['complete'])
+
+        results = response.data['results']
+        self.assertIn('19:00', results[0]['times'])
+        self.assertEqual(results[1], {'available': True})
+        self.assertEqual(results[2], {'error': 'invalid'})
+        self.assertEqual(results[3], {'error': 'not_found'})
+        self.assertEqual(results[4], {'error': 'invalid'})
+
+    @override_settings(AVAILABILITY_BATCH_TIMEOUT=0)
+    def test_batch_incomplete(self):
+        queries = [{'site': self.site.id, 'date': self.date, 'party_size': 2}]
+
+        response = self.client.post(self.url, {'queries': queries}, format='json')
+
+        self.assertFalse(response.data['complete'])
+        self.assertEqual(response.data['results'], [{'error': 'timeout'}])
+
+    @override_settings(AVAILABILITY_BATCH_MAX_QUERIES=1)
+    def test_batch_invalid(self):
+        response = self.client.post(self.url, {'queries': 'invalid'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.url, {'queries': [{}, {}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
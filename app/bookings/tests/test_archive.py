@@ -0,0 +1,175 @@
+import io
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from model_bakery import baker
+
+from ..archive import archive_bookings, restore_bookings
+from ..models import (
+    ArchivedBooking,
+    ArchivedClientStats,
+    Booking,
+    BookingTableRelationship,
+    Client,
+)
+
+
+@override_settings(BOOKING_ARCHIVE_AFTER=365)
+class ArchiveTestCase(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.table = baker.make('sites.Table', site=self.site)
+        self.client_ = baker.make('bookings.Client')
+        self.old_date = timezone.now() - timedelta(days=400)
+
+        self.old_bookings = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            client=self.client_,
+            booking_date=self.old_date,
+            party=4,
+            status=Booking.StatusChoices.CONFIRMED,
+            _quantity=3,
+        )
+        Booking.objects.filter(id=self.old_bookings[2].id).update(
+            status=Booking.StatusChoices.CANCELLED
+        )
+        for booking in self.old_bookings:
+            BookingTableRelationship.objects.create(booking=booking, table=self.table)
+
+        self.booking = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            client=self.client_,
+            booking_date=timezone.now() - timedelta(days=1),
+            party=2,
+            status=Booking.StatusChoices.CONFIRMED,
+        )
+
+
+class ArchiveBookingsTest(ArchiveTestCase):
+    def test_old_bookings_archived(self):
+        self.assertEqual(archive_bookings(), 3)
+
+        self.assertEqual(list(Booking.objects.all()), [self.booking])
+        self.assertFalse(
+            BookingTableRelationship.objects.filter(
+                booking_id__in=[booking.id for booking in self.old_bookings]
+            ).exists()
+        )
+
+        archived = ArchivedBooking.objects.get(id=self.old_bookings[0].id)
+        self.assertEqual(archived.reference, self.old_bookings[0].reference)
+        self.assertEqual(archived.get_data()['tables'][0][0], self.table.id)
+
+        stats = ArchivedClientStats.objects.get(client=self.client_, site=self.site)
+        self.assertEqual(stats.total, 3)
+        self.assertEqual(stats.cancelled, 1)
+        self.assertEqual(stats.visits, 2)
+        self.assertEqual(stats.party_total, 8)
+
+    def test_archived_in_chunks(self):
+        # Test a run stops after its chunks, and the next resumes where it stopped.
+        self.assertEqual(archive_bookings(chunk_size=2, max_chunks=1), 2)
+        self.assertEqual(ArchivedClientStats.objects.get().total, 2)
+
+        self.assertEqual(archive_bookings(chunk_size=2), 1)
+        self.assertEqual(ArchivedClientStats.objects.get().total, 3)
+
+    def test_restore_bookings(self):
+        archive_bookings()
+        old_booking = self.old_bookings[0]
+
+        count = restore_bookings(ArchivedBooking.objects.filter(id=old_booking.id))
+
+        self.assertEqual(count, 1)
+        booking = Booking.objects.get(id=old_booking.id)
+        self.assertEqual(booking.reference, old_booking.reference)
+        self.assertEqual(booking.booking_date, old_booking.booking_date)
+        self.assertEqual(booking.booking_created_at, old_booking.booking_created_at)
+        self.assertEqual(list(booking.tables.all()), [self.table])
+        self.assertFalse(ArchivedBooking.objects.filter(id=old_booking.id).exists())
+        self.assertEqual(ArchivedClientStats.objects.get().total, 2)
+
+    def test_restore_all_bookings(self):
+        archive_bookings()
+
+        restore_bookings(ArchivedBooking.objects.all())
+
+        self.assertEqual(Booking.objects.count(), 4)
+        self.assertFalse(ArchivedClientStats.objects.exists())
+
+    def test_command(self):
+        stdout = io.StringIO()
+
+        call_command('archive_bookings', stdout=stdout)
+        call_command('archive_bookings', restore_client=self.client_.id, stdout=stdout)
+
+        self.assertIn('Archived 3 Bookings', stdout.getvalue())
+        self.assertIn('Restored 3 Bookings', stdout.getvalue())
+
+
+class ArchivedStatsTest(ArchiveTestCase):
+    def setUp(self):
+        super().setUp()
+        archive_bookings()
+        self.user = baker.make('accounts.User', is_manager=False, site=self.site)
+
+    def test_get_booking_stats(self):
+        stats = self.client_.get_booking_stats(self.user)
+
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual(stats['archived'], 3)
+        self.assertEqual(stats['cancelled'], 1)
+        self.assertEqual(stats['visits'], 3)
+        self.assertEqual(stats['average_party'], 10 / 3)
+        self.assertEqual(stats['first_visit'], self.old_date)
+        self.assertEqual(stats['last_visit'], self.booking.booking_date)
+
+    def test_get_clients_with_stats(self):
+        Booking.objects.all().delete()
+
+        client = Client.objects.get_clients_with_stats(self.user).get()
+
+        # Test a Client with only archived Bookings is still listed with their history.
+        self.assertEqual(client, self.client_)
+        self.assertEqual(client.booking_count, 3)
+        self.assertEqual(client.last_visit, self.old_date)
+
+    def test_other_site(self):
+        user = baker.make('accounts.User', is_manager=False, site=baker.make('sites.Site'))
+
+        self.assertEqual(self.client_.get_booking_stats(user)['archived'], 0)
+        self.assertFalse(self.client_.get_archived_bookings(user).exists())
+
+
+class ClientArchiveViewTest(ArchiveTestCase):
+    def setUp(self):
+        super().setUp()
+        archive_bookings()
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+
+    def test_archived_bookings_listed(self):
+        response = self.client.get(reverse('client-archive', args=[self.client_.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'bookings/client_archive.html')
+        self.assertEqual(len(response.context['bookings']), 3)
+        self.assertContains(response, self.old_bookings[0].reference)
+
+    def test_client_detail_links_archive(self):
+        response = self.client.get(reverse('client-detail', args=[self.client_.id]))
+
+        self.assertContains(response, reverse('client-archive', args=[self.client_.id]))
+
+    def test_restore(self):
+        response = self.client.post(reverse('client-archive', args=[self.client_.id]))
+
+        self.assertRedirects(response, reverse('client-detail', args=[self.client_.id]))
+        self.assertEqual(Booking.objects.count(), 4)
+        self.assertFalse(ArchivedBooking.objects.exists())
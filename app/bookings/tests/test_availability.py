@@ -0,0 +1,149 @@
+from datetime import time, timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from model_bakery import baker
+
+from sites.snapshot import _snapshots, get_site_snapshot
+from ..availability import (
+    compute_availability,
+    get_availability_cache_key,
+    get_available_time_slots,
+    get_precompute_chunks,
+    get_precompute_dates,
+    invalidate_availability,
+)
+from ..utils import BookingSystem
+
+
+class AvailabilityTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', min_party_num=1, max_party_num=4)
+        self.table = baker.make('sites.Table', site=self.site, number_of_seats=4)
+        self.date = timezone.localdate() + timedelta(days=2)
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+    def get_booking_system(self, date=None, party_size=2, **kwargs):
+        return BookingSystem(self.site, date or self.date, party_size, **kwargs)
+
+    def test_get_available_time_slots(self):
+        available_time_slots = get_available_time_slots(self.get_booking_system())
+
+        self.assertEqual(
+            available_time_slots, self.get_booking_system().get_available_time_slots()
+        )
+
+        # Test the cached time slots are used the next time.
+        with patch.object(BookingSystem, 'get_available_time_slots') as mock:
+            self.assertEqual(
+                get_available_time_slots(self.get_booking_system()), available_time_slots
+            )
+            mock.assert_not_called()
+
+    def test_get_available_time_slots_invalidated(self):
+        get_available_time_slots(self.get_booking_system())
+        invalidate_availability(self.site.id, self.date)
+
+        with patch.object(BookingSystem, 'get_available_time_slots', return_value=[]) as mock:
+            self.assertEqual(get_available_time_slots(self.get_booking_system()), [])
+            mock.assert_called_once()
+
+    def test_get_available_time_slots_not_cacheable(self):
+        # Test today, other durations and updated Bookings are not cached.
+        booking_systems = [
+            self.get_booking_system(date=timezone.localdate()),
+            self.get_booking_system(duration=0),
+            self.get_booking_system(exclude_booking_id=1),
+        ]
+
+        for booking_system in booking_systems:
+            with self.subTest(booking_system=booking_system):
+                get_available_time_slots(booking_system)
+                key = get_availability_cache_key(
+                    self.site.id, booking_system.booking_date, booking_system.party_size
+                )
+
+                self.assertIsNone(cache.get(key))
+
+    def test_get_available_time_slots_from_replica(self):
+        # Test time slots computed from a replica are not cached.
+        booking_system = self.get_booking_system()
+        with patch('bookings.availability.get_replica', return_value='replica'):
+            get_available_time_slots(booking_system)
+
+        key = get_availability_cache_key(self.site.id, self.date, 2)
+        self.assertIsNone(cache.get(key))
+
+    def test_get_available_time_slots_coalesced(self):
+        # Test identical requests for today share a computation until the date changes.
+        today = timezone.localdate()
+
+        with patch.object(BookingSystem, 'get_available_time_slots', return_value=[]) as mock:
+            get_available_time_slots(self.get_booking_system(date=today))
+            get_available_time_slots(self.get_booking_system(date=today))
+            mock.assert_called_once()
+
+            get_available_time_slots(self.get_booking_system(date=today, frontend=True))
+            self.assertEqual(mock.call_count, 2)
+
+            invalidate_availability(self.site.id, today)
+            get_available_time_slots(self.get_booking_system(date=today))
+            self.assertEqual(mock.call_count, 3)
+
+    @override_settings(AVAILABILITY_COALESCE_WAIT=0.5)
+    def test_get_available_time_slots_waits_for_computation(self):
+        # Test a request waits briefly for an identical computation in progress.
+        booking_system = self.get_booking_system(date=timezone.localdate())
+        with patch('bookings.availability.single_flight', return_value=[]) as mock:
+            get_available_time_slots(booking_system)
+            self.assertEqual(mock.call_args.kwargs['max_wait'], 0.5)
+
+    def test_get_available_time_slots_not_coalesced(self):
+        with patch.object(BookingSystem, 'get_available_time_slots', return_value=[]) as mock:
+            for _ in range(2):
+                get_available_time_slots(self.get_booking_system(exclude_booking_id=1))
+            self.assertEqual(mock.call_count, 2)
+
+    def test_compute_availability(self):
+        self.assertEqual(compute_availability(self.site, self.date), 4)
+
+        # Test an entry is stored for each party size.
+        for party_size in range(1, 5):
+            with self.subTest(party_size=party_size):
+                key = get_availability_cache_key(self.site.id, self.date, party_size)
+
+                self.assertIsNotNone(cache.get(key))
+
+        entry = cache.get(get_availability_cache_key(self.site.id, self.date, 4))
+
+        self.assertIn(time(12, 0), entry[2])
+
+    @override_settings(AVAILABILITY_PRECOMPUTE_DAYS=14)
+    def test_get_precompute_dates(self):
+        today = timezone.localdate()
+        snapshot = get_site_snapshot(self.site)
+        dates = get_precompute_dates(snapshot, today)
+
+        self.assertEqual(len(dates), 14)
+        self.assertEqual(dates[0], today + timedelta(days=1))
+
+        # Test dates past the early booking period are not precomputed.
+        self.site.early_booking = 7
+        self.site.save()
+
+        self.assertEqual(len(get_precompute_dates(get_site_snapshot(self.site), today)), 7)
+
+    @override_settings(AVAILABILITY_PRECOMPUTE_CHUNK_SIZE=10)
+    def test_get_precompute_chunks(self):
+        dates = list(range(7))
+
+        # Test the chunks are sized by the number of party sizes of the Site.
+        chunks = get_precompute_chunks(get_site_snapshot(self.site), dates)
+
+        self.assertEqual(chunks, [[0, 1], [2, 3], [4, 5], [6]])
@@ -0,0 +1,154 @@
+from datetime import time, timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from model_bakery import baker
+
+from sites.snapshot import _snapshots
+from .. import batch
+from ..batch import (
+    ERROR_DATE_UNAVAILABLE,
+    ERROR_FAILED,
+    ERROR_PARTY_SIZE_UNAVAILABLE,
+    ERROR_TIMEOUT,
+    evaluate_batch,
+    get_executor,
+)
+from ..models import BookingTableRelationship
+
+
+class EvaluateBatchTest(TestCase):
+    def setUp(self):
+        self.site = baker.make(
+            'sites.Site',
+            min_party_num=1,
+            max_party_num=4,
+            booking_duration=60,
+            last_booking=1,
+        )
+        self.table = baker.make('sites.Table', site=self.site, number_of_seats=4)
+        self.date = timezone.localdate() + timedelta(days=2)
+
+        # The Table is booked from 12:00 to 13:00.
+        booking = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.make_aware(
+                timezone.datetime.combine(self.date, time(12))
+            ),
+            duration=60,
+        )
+        BookingTableRelationship.objects.create(booking=booking, table=self.table)
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+    def get_query(self, **kwargs):
+        return {'site': self.site.id, 'date': self.date, 'party_size': 2, **kwargs}
+
+    def test_evaluate_batch(self):
+        results = evaluate_batch(
+            [
+                self.get_query(),
+                self.get_query(time=time(14)),
+                self.get_query(time=time(12), party_size=3),
+            ]
+        )
+
+        self.assertIn('13:00', results[0]['times'])
+        self.assertNotIn('12:00', results[0]['times'])
+        self.assertEqual(results[1], {'available': True})
+        self.assertEqual(results[2], {'available': False})
+
+    def test_evaluate_batch_loads_group_once(self):
+        queries = [self.get_query(party_size=party_size) for party_size in range(1, 5)]
+
+        with patch.object(batch, 'get_booked_tables', wraps=batch.get_booked_tables) as mock:
+            evaluate_batch(queries)
+
+        mock.assert_called_once_with(self.site.id, self.date)
+
+        # Once cached, the group's Bookings are not loaded at all.
+        with patch.object(batch, 'get_booked_tables') as mock:
+            evaluate_batch(queries)
+
+        mock.assert_not_called()
+
+    def test_evaluate_batch_errors(self):
+        results = evaluate_batch(
+            [
+                self.get_query(party_size=5),
+                self.get_query(date=timezone.localdate()),
+                self.get_query(date=timezone.localdate() + timedelta(days=365)),
+            ]
+        )
+
+        self.assertEqual(
+            results,
+            [
+                {'error': ERROR_PARTY_SIZE_UNAVAILABLE},
+                {'error': ERROR_DATE_UNAVAILABLE},
+                {'error': ERROR_DATE_UNAVAILABLE},
+            ],
+        )
+
+    def test_evaluate_batch_failed_group(self):
+        other_date = self.date + timedelta(days=1)
+
+        with patch.object(
+            batch,
+            'evaluate_group',
+            side_effect=[ValueError, {2: []}],
+        ), self.assertLogs('bookings.batch', 'ERROR'):
+            results = evaluate_batch([self.get_query(), self.get_query(date=other_date)])
+
+        self.assertEqual(results, [{'error': ERROR_FAILED}, {'times': []}])
+
+    def test_evaluate_batch_timeout(self):
+        results = evaluate_batch([self.get_query()], timeout=0)
+
+        self.assertEqual(results, [{'error': ERROR_TIMEOUT}])
+
+
+@override_settings(AVAILABILITY_BATCH_WORKERS=2)
+class EvaluateBatchParallelTest(TransactionTestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', min_party_num=1, max_party_num=4, last_booking=1)
+        baker.make('sites.Table', site=self.site, number_of_seats=4)
+        self.date = timezone.localdate() + timedelta(days=2)
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+    def test_evaluate_batch(self):
+        queries = [
+            {'site': self.site.id, 'date': self.date + timedelta(days=x), 'party_size': 2}
+            for x in range(4)
+        ]
+
+        results = evaluate_batch(queries)
+
+        self.assertEqual(len(results), 4)
+        for result in results:
+            self.assertTrue(result['times'])
+
+    def test_evaluate_batch_timeout(self):
+        # Test groups starting after the time budget ran out are not evaluated.
+        queries = [
+            {'site': self.site.id, 'date': self.date + timedelta(days=x), 'party_size': 2}
+            for x in range(4)
+        ]
+
+        with patch.object(batch, 'evaluate_group') as mock:
+            results = evaluate_batch(queries, timeout=0)
+
+        self.assertEqual(results, [{'error': ERROR_TIMEOUT}] * 4)
+        mock.assert_not_called()
+
+    def test_executor_shared(self):
+        self.assertIs(get_executor(2), get_executor(2))
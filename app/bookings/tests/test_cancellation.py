@@ -0,0 +1,152 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from model_bakery import baker
+from post_office.models import Email
+
+from sites.models import ScheduleOverride
+from sites.snapshot import get_site_snapshot
+from ..cancellation import cancel_bookings, close_site
+from ..models import Booking, BookingTableRelationship, OutboxEvent
+from ..signals import booking_changed
+
+
+class CancelBookingsTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.table = baker.make('sites.Table', site=self.site)
+        self.booking_date = timezone.now() + timedelta(days=2)
+        self.bookings = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=self.booking_date,
+            status=Booking.StatusChoices.CONFIRMED,
+            _quantity=3,
+        )
+        for booking in self.bookings:
+            BookingTableRelationship.objects.create(booking=booking, table=self.table)
+
+    def test_bookings_cancelled(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            count = cancel_bookings(Booking.objects.filter(site=self.site))
+
+        self.assertEqual(count, 3)
+        self.assertFalse(
+            Booking.objects.filter(site=self.site)
+            .exclude(status=Booking.StatusChoices.CANCELLED)
+            .exists()
+        )
+        self.assertFalse(BookingTableRelationship.objects.exists())
+        self.assertEqual(
+            sorted(email.to[0] for email in Email.objects.all()),
+            sorted(booking.client.client_email for booking in self.bookings),
+        )
+
+    def test_queries_do_not_depend_on_bookings(self):
+        baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=self.booking_date,
+            status=Booking.StatusChoices.CONFIRMED,
+            _quantity=5,
+        )
+
+        # The savepoint, selecting the Bookings, cancelling them, removing their Tables,
+        # recording the change and releasing the savepoint.
+        with self.assertNumQueries(6):
+            cancel_bookings(Booking.objects.filter(site=self.site))
+
+    def test_only_confirmed_future_bookings_cancelled(self):
+        past_booking = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.now() - timedelta(hours=1),
+            status=Booking.StatusChoices.CONFIRMED,
+        )
+        self.bookings[0].status = Booking.StatusChoices.CANCELLED
+        self.bookings[0].save()
+
+        count = cancel_bookings(Booking.objects.filter(site=self.site))
+
+        self.assertEqual(count, 2)
+        past_booking.refresh_from_db()
+        self.assertEqual(past_booking.status, Booking.StatusChoices.CONFIRMED)
+
+    def test_booking_changed_sent_once_per_site(self):
+        # Only the changes made by the cancellation are relayed.
+        OutboxEvent.objects.update(delivered_at=timezone.now())
+
+        with patch.object(booking_changed, 'send_robust') as mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                cancel_bookings(Booking.objects.filter(site=self.site))
+
+        mock.assert_called_once_with(
+            sender=Booking,
+            booking_id=None,
+            site_id=self.site.id,
+            dates=(timezone.localdate(self.booking_date),),
+        )
+
+    def test_no_bookings(self):
+        with patch('bookings.cancellation.send_cancellation_emails') as mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                count = cancel_bookings(Booking.objects.none())
+
+        self.assertEqual(count, 0)
+        mock.delay.assert_not_called()
+
+
+class CloseSiteTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.start = timezone.localdate() + timedelta(days=1)
+        self.end = self.start + timedelta(days=2)
+
+    def test_site_closed(self):
+        baker.make(
+            'sites.ScheduleOverride',
+            site=self.site,
+            date=self.start,
+            is_closed=False,
+            opening_hour='10:00',
+            closing_hour='14:00',
+        )
+
+        close_site(self.site, self.start, self.end, 'Refurbishment')
+
+        overrides = ScheduleOverride.objects.filter(site=self.site)
+        self.assertEqual(overrides.count(), 3)
+        self.assertTrue(all(override.is_closed for override in overrides))
+        self.assertEqual(overrides[0].description, 'Refurbishment')
+        self.assertTrue(get_site_snapshot(self.site).get_day(self.start).is_closed)
+
+    def test_bookings_in_range_cancelled(self):
+        inside = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.make_aware(
+                timezone.datetime.combine(self.end, timezone.datetime.min.time())
+            )
+            + timedelta(hours=20),
+            status=Booking.StatusChoices.CONFIRMED,
+        )
+        outside = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.make_aware(
+                timezone.datetime.combine(self.end, timezone.datetime.min.time())
+            )
+            + timedelta(days=1, hours=12),
+            status=Booking.StatusChoices.CONFIRMED,
+        )
+
+        count = close_site(self.site, self.start, self.end)
+
+        self.assertEqual(count, 1)
+        inside.refresh_from_db()
+        outside.refresh_from_db()
+        self.assertEqual(inside.status, Booking.StatusChoices.CANCELLED)
+        self.assertEqual(outside.status, Booking.StatusChoices.CONFIRMED)
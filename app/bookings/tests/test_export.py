@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from model_bakery import baker
+
+from ..export import iter_export
+from ..models import Booking, BookingTableRelationship
+
+
+class ExportTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', site_name='Site 1')
+        self.table_1 = baker.make('sites.Table', site=self.site, table_name='T1')
+        self.table_2 = baker.make('sites.Table', site=self.site, table_name='T2')
+
+        self.booking_1 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.now() + timezone.timedelta(days=1),
+            client__client_phone='07700900123',
+        )
+        self.booking_2 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.now() + timezone.timedelta(days=2),
+            status=Booking.StatusChoices.CANCELLED,
+        )
+
+        for table in [self.table_1, self.table_2]:
+            BookingTableRelationship.objects.create(booking=self.booking_1, table=table)
+
+    def test_iter_export_csv(self):
+        rows = list(csv.DictReader(iter_export(Booking.objects.all(), 'csv')))
+
+        self.assertEqual(
+            [row['reference'] for row in rows],
+            [self.booking_1.reference, self.booking_2.reference],
+        )
+        self.assertEqual(rows[0]['site'], 'Site 1')
+        self.assertEqual(sorted(rows[0]['tables'].split(', ')), ['T1', 'T2'])
+        self.assertEqual(rows[0]['client_phone'], '07700900123')
+        self.assertEqual(rows[1]['tables'], '')
+        self.assertEqual(rows[1]['status'], 'Cancelled')
+
+    def test_iter_export_jsonl(self):
+        lines = list(iter_export(Booking.objects.all(), 'jsonl'))
+        row = json.loads(lines[0])
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(row['reference'], self.booking_1.reference)
+        self.assertEqual(
+            row['booking_date'], timezone.localtime(self.booking_1.booking_date).isoformat()
+        )
+        self.assertEqual(row['status'], 'Confirmed')
+
+    def test_iter_export_queries(self):
+        # Test the Tables are aggregated in the same query as the Bookings.
+        with self.assertNumQueries(1):
+            list(iter_export(Booking.objects.all(), 'csv'))
+
+
+class ExportBookingsCommandTest(TestCase):
+    def setUp(self):
+        self.booking_1 = baker.make(
+            'bookings.Booking', booking_date=timezone.now() - timezone.timedelta(days=30)
+        )
+        self.booking_2 = baker.make(
+            'bookings.Booking', booking_date=timezone.now() + timezone.timedelta(days=1)
+        )
+
+    def test_export_bookings(self):
+        # Test all dates are exported by default.
+        stdout = io.StringIO()
+        call_command('export_bookings', stdout=stdout)
+        rows = list(csv.DictReader(io.StringIO(stdout.getvalue())))
+
+        self.assertEqual(len(rows), 2)
+
+    def test_export_bookings_filtered(self):
+        stdout = io.StringIO()
+        date_from = (timezone.localdate() - timezone.timedelta(days=1)).isoformat()
+        call_command('export_bookings', '--format', 'jsonl', '--from', date_from, stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['reference'], self.booking_2.reference)
+
+    def test_export_bookings_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bookings.csv')
+            call_command('export_bookings', '--output', path)
+
+            with open(path, newline='') as output:
+                self.assertEqual(len(list(csv.DictReader(output))), 2)
@@ -1,4 +1,5 @@
 from django.test import TestCase
+from django.utils import timezone
 
 from model_bakery import baker
 
@@ -24,6 +25,46 @@ class ClientManagerTest(TestCase):
 
         self.assertEqual(queryset.count(), 1)
 
+    def test_get_clients_with_stats(self):
+        last_visit = timezone.now() - timezone.timedelta(days=7)
+        next_visit = timezone.now() + timezone.timedelta(days=7)
+        Booking.objects.filter(id=self.booking.id).update(
+            booking_date=next_visit + timezone.timedelta(days=1)
+        )
+        baker.make('bookings.Booking', client=self.clients[0], booking_date=last_visit)
+        baker.make(
+            'bookings.Booking',
+            client=self.clients[0],
+            site=self.site,
+            booking_date=next_visit,
+        )
+        baker.make(
+            'bookings.Booking',
+            client=self.clients[0],
+            site=self.site,
+            booking_date=next_visit - timezone.timedelta(days=1),
+            status=Booking.StatusChoices.CANCELLED,
+        )
+
+        # Test when user is a manager.
+        client = Client.objects.get_clients_with_stats(self.manager).get(id=self.clients[0].id)
+
+        self.assertEqual(client.booking_count, 4)
+        self.assertEqual(client.last_visit, last_visit)
+        self.assertEqual(client.next_visit, next_visit)
+        self.assertEqual(
+            Client.objects.get_clients_with_stats(self.manager)
+            .get(id=self.clients[1].id)
+            .booking_count,
+            0,
+        )
+
+        # Test when user is not a manager, only Bookings of their Site are counted.
+        client = Client.objects.get_clients_with_stats(self.user).get()
+
+        self.assertEqual(client.booking_count, 3)
+        self.assertEqual(client.next_visit, next_visit)
+
 
 class BookingManagerTest(TestCase):
     def setUp(self):
@@ -35,6 +35,28 @@ class ClientTest(TestCase):
 
         self.assertEqual(queryset.count(), 1)
 
+    def test_get_booking_stats(self):
+        manager = baker.make('accounts.User', is_manager=True)
+        Booking.objects.filter(id=self.bookings[0].id).update(
+            booking_date=timezone.now() - timezone.timedelta(days=1), party=2
+        )
+        Booking.objects.filter(id=self.bookings[1].id).update(
+            booking_date=timezone.now() + timezone.timedelta(days=1), party=4
+        )
+        Booking.objects.filter(id=self.bookings[2].id).update(
+            status=Booking.StatusChoices.CANCELLED
+        )
+
+        stats = self.client.get_booking_stats(manager)
+
+        self.assertEqual(stats['total'], 3)
+        self.assertEqual(stats['cancelled'], 1)
+        self.assertEqual(stats['visits'], 1)
+        self.assertEqual(stats['upcoming'], 1)
+        self.assertEqual(stats['average_party'], 3)
+        self.bookings[0].refresh_from_db()
+        self.assertEqual(stats['last_visit'], self.bookings[0].booking_date)
+
 
 class BookingTest(TestCase):
     def setUp(self):
@@ -0,0 +1,92 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from ..models import OutboxEvent
+from ..outbox import RELAY_LOCK_KEY, compact_events, record_event, relay_events
+
+
+@override_settings(OUTBOX_BATCH_SIZE=2, OUTBOX_MAX_ATTEMPTS=3)
+class RelayEventsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.consumer = Mock()
+        patcher = patch.dict('bookings.outbox._consumers', {'test': self.consumer})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_events_relayed_in_order(self):
+        for x in range(5):
+            record_event('test', {'x': x})
+
+        self.assertEqual(relay_events(), 5)
+
+        self.assertEqual(
+            [call.args[0] for call in self.consumer.call_args_list],
+            [{'x': x} for x in range(5)],
+        )
+        self.assertFalse(OutboxEvent.objects.filter(delivered_at__isnull=True).exists())
+
+    def test_failed_event_retried(self):
+        event = record_event('test', {})
+        self.consumer.side_effect = ValueError
+
+        self.assertEqual(relay_events(), 0)
+
+        event.refresh_from_db()
+        self.assertEqual(event.attempts, 1)
+        self.assertIsNone(event.delivered_at)
+
+        self.consumer.side_effect = None
+        self.assertEqual(relay_events(), 1)
+
+        event.refresh_from_db()
+        self.assertIsNotNone(event.delivered_at)
+
+    def test_failed_event_given_up_on(self):
+        event = record_event('test', {})
+        self.consumer.side_effect = ValueError
+
+        for x in range(3):
+            relay_events()
+
+        event.refresh_from_db()
+        self.assertEqual(self.consumer.call_count, 3)
+        self.assertIsNotNone(event.delivered_at)
+
+    def test_event_without_consumer_delivered(self):
+        event = record_event('unknown', {})
+
+        relay_events()
+
+        event.refresh_from_db()
+        self.assertIsNotNone(event.delivered_at)
+
+    def test_one_relay_at_a_time(self):
+        record_event('test', {})
+        cache.set(RELAY_LOCK_KEY, 'token')
+
+        self.assertEqual(relay_events(), 0)
+
+        self.consumer.assert_not_called()
+        self.assertEqual(cache.get(RELAY_LOCK_KEY), 'token')
+
+
+@override_settings(OUTBOX_RETENTION=60 * 60)
+class CompactEventsTest(TestCase):
+    def test_delivered_events_deleted(self):
+        now = timezone.now()
+        old = record_event('test', {})
+        recent = record_event('test', {})
+        pending = record_event('test', {})
+        OutboxEvent.objects.filter(id=old.id).update(delivered_at=now - timedelta(hours=2))
+        OutboxEvent.objects.filter(id=recent.id).update(delivered_at=now)
+
+        self.assertEqual(compact_events(), 1)
+
+        self.assertFalse(OutboxEvent.objects.filter(id=old.id).exists())
+        self.assertEqual(OutboxEvent.objects.filter(id__in=[recent.id, pending.id]).count(), 2)
@@ -0,0 +1,133 @@
+import io
+from datetime import date, datetime, timedelta
+from unittest import skipIf, skipUnless
+
+from django.core.management import CommandError, call_command
+from django.db import NotSupportedError, connection
+from django.test import TestCase
+from django.utils import timezone
+
+from model_bakery import baker
+
+from ..models import Booking
+from ..partitioning import (
+    add_months,
+    create_partitions,
+    get_month_bounds,
+    get_partition_name,
+    is_partitioned,
+    partition_table,
+)
+
+
+class PartitioningTest(TestCase):
+    def test_add_months(self):
+        self.assertEqual(add_months(date(2021, 11, 15), 0), date(2021, 11, 1))
+        self.assertEqual(add_months(date(2021, 11, 15), 2), date(2022, 1, 1))
+        self.assertEqual(add_months(date(2021, 1, 31), -1), date(2020, 12, 1))
+
+    def test_get_partition_name(self):
+        self.assertEqual(get_partition_name(date(2021, 6, 1)), 'bookings_booking_y2021m06')
+
+    def test_get_month_bounds(self):
+        start, end = get_month_bounds(date(2021, 6, 1))
+
+        # Test the bounds are local midnight, in summer time.
+        self.assertEqual(timezone.localtime(start), timezone.make_aware(datetime(2021, 6, 1)))
+        self.assertEqual(timezone.localtime(end), timezone.make_aware(datetime(2021, 7, 1)))
+        self.assertEqual(start.utcoffset(), timedelta(hours=1))
+
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL supports partitioning.')
+    def test_not_supported(self):
+        # Test the tests' database is left as it is.
+        self.assertFalse(is_partitioned())
+        self.assertEqual(create_partitions(), [])
+        with self.assertRaises(NotSupportedError):
+            partition_table()
+
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL supports partitioning.')
+    def test_partition_bookings_command_not_supported(self):
+        with self.assertRaises(CommandError):
+            call_command('partition_bookings', stdout=io.StringIO())
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Only PostgreSQL supports partitioning.')
+class PartitionTableTest(TestCase):
+    def setUp(self):
+        self.this_month = timezone.localdate().replace(day=1)
+        self.booking = baker.make(
+            'bookings.Booking', booking_date=timezone.now() - timedelta(days=400)
+        )
+
+    def get_partition_ids(self, month):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT id FROM {get_partition_name(month)}')
+            return [booking_id for booking_id, in cursor.fetchall()]
+
+    def test_partition_table(self):
+        self.assertFalse(is_partitioned())
+        self.assertTrue(partition_table(months_ahead=2))
+        self.assertTrue(is_partitioned())
+
+        # The Booking is moved to the partition of its month, and is still found.
+        month = timezone.localdate(self.booking.booking_date).replace(day=1)
+        self.assertEqual(self.get_partition_ids(month), [self.booking.id])
+        self.assertEqual(Booking.objects.get().id, self.booking.id)
+
+        # The partitions up to the months ahead exist already.
+        self.assertFalse(partition_table())
+        self.assertEqual(create_partitions(months_ahead=2), [])
+        self.assertEqual(
+            create_partitions(months_ahead=3),
+            [get_partition_name(add_months(self.this_month, 3))],
+        )
+
+    def test_create_partition_moves_from_default(self):
+        partition_table(months_ahead=0)
+
+        # Bookings past the partitions are held in the default partition until created.
+        booking = baker.make(
+            'bookings.Booking', booking_date=timezone.now() + timedelta(days=45)
+        )
+        month = timezone.localdate(booking.booking_date).replace(day=1)
+        create_partitions(months_ahead=2)
+
+        self.assertEqual(self.get_partition_ids(month), [booking.id])
+        self.assertEqual(Booking.objects.count(), 2)
+
+    def test_partition_bookings_command(self):
+        stdout = io.StringIO()
+
+        call_command('partition_bookings', months_ahead=1, stdout=stdout)
+        call_command('partition_bookings', months_ahead=2, stdout=stdout)
+
+        self.assertIn('Partitioned the Booking table', stdout.getvalue())
+        self.assertIn(
+            'The Booking table is already partitioned, created 1 partitions', stdout.getvalue()
+        )
+
+
+class BenchmarkBookingsCommandTest(TestCase):
+    def test_seed_and_benchmark(self):
+        stdout = io.StringIO()
+        call_command('benchmark_bookings', seed=25, runs=2, stdout=stdout)
+        call_command('benchmark_bookings', seed=5, runs=1, stdout=stdout)
+
+        bookings = Booking.objects.filter(site__site_name='Benchmark')
+        self.assertEqual(bookings.count(), 30)
+        self.assertEqual(bookings.values('reference').distinct().count(), 30)
+        self.assertIn('30 Bookings, table not partitioned', stdout.getvalue())
+        self.assertIn('calendar: median', stdout.getvalue())
+        self.assertIn('availability: median', stdout.getvalue())
+
+    def test_site(self):
+        site = baker.make('sites.Site')
+        stdout = io.StringIO()
+
+        call_command('benchmark_bookings', site=site.id, runs=1, explain=True, stdout=stdout)
+
+        self.assertIn('list: median', stdout.getvalue())
+
+    def test_no_site(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_bookings', stdout=io.StringIO())
@@ -0,0 +1,64 @@
+from django.test import TestCase
+
+from model_bakery import baker
+
+from ..models import Booking, Client
+from ..search import SearchBackend, get_search_backend, normalize_phone
+
+
+class NormalizePhoneTest(TestCase):
+    def test_normalize_phone(self):
+        self.assertEqual(normalize_phone('+44 7700 900123'), '07700900123')
+        self.assertEqual(normalize_phone('07700 900123'), '07700900123')
+        self.assertEqual(normalize_phone('900 123'), '900123')
+        self.assertEqual(normalize_phone('Smith'), '')
+
+
+class SearchBackendTest(TestCase):
+    def setUp(self):
+        self.backend = SearchBackend()
+        self.client_1 = baker.make(
+            'bookings.Client',
+            client_name='Jane Smith',
+            client_email='jane@example.com',
+            client_phone='07700 900123',
+        )
+        self.client_2 = baker.make(
+            'bookings.Client',
+            client_name='John Jones',
+            client_email='smithy@example.com',
+            client_phone='07700 900456',
+        )
+        self.booking = baker.make('bookings.Booking', client=self.client_1, reference='AB12C')
+
+    def test_get_search_backend(self):
+        self.assertIsInstance(get_search_backend(), SearchBackend)
+
+    def test_search_clients(self):
+        clients = Client.objects.all()
+
+        self.assertEqual(list(self.backend.search_clients(clients, 'jane')), [self.client_1])
+        self.assertEqual(
+            set(self.backend.search_clients(clients, 'SMITH')), {self.client_1, self.client_2}
+        )
+        self.assertEqual(
+            list(self.backend.search_clients(clients, '+44 7700 900456')), [self.client_2]
+        )
+        self.assertEqual(list(self.backend.search_clients(clients, '900123')), [self.client_1])
+        self.assertEqual(list(self.backend.search_clients(clients, 'nobody')), [])
+
+    def test_search_bookings(self):
+        bookings = Booking.objects.all()
+
+        self.assertEqual(
+            list(self.backend.search_bookings(bookings, self.booking.reference.lower())),
+            [self.booking],
+        )
+        self.assertEqual(list(self.backend.search_bookings(bookings, 'jane')), [self.booking])
+        self.assertEqual(list(self.backend.search_bookings(bookings, 'john')), [])
+
+    def test_rank_clients(self):
+        clients = self.backend.rank_clients(Client.objects.all(), 'smith')
+
+        # A match at the start of the email ranks above one elsewhere in the name.
+        self.assertEqual(list(clients), [self.client_2, self.client_1])
@@ -1,9 +1,13 @@
+from datetime import timedelta
+from unittest.mock import patch
+
 from django.test import TestCase
 from django.utils import timezone
 
 from model_bakery import baker
 
 from ..models import Booking, BookingTableRelationship
+from ..signals import booking_changed
 
 
 class CancelFutureBookingsTest(TestCase):
@@ -64,3 +68,64 @@ class CancelFutureBookingsTest(TestCase):
         self.assertEqual(self.booking_1.tables.count(), 0)
         self.assertEqual(self.booking_2.tables.count(), 0)
         self.assertNotEqual(self.booking_3.tables.count(), 0)
+
+
+class TouchBookingTest(TestCase):
+    def setUp(self):
+        self.booking = baker.make('bookings.Booking')
+        self.table = baker.make('sites.Table', site=self.booking.site)
+
+    def test_touch_booking_on_table_added(self):
+        updated_at = self.booking.updated_at
+
+        BookingTableRelationship.objects.create(booking=self.booking, table=self.table)
+
+        self.booking.refresh_from_db()
+        self.assertGreater(self.booking.updated_at, updated_at)
+
+    def test_touch_booking_on_table_removed(self):
+        BookingTableRelationship.objects.create(booking=self.booking, table=self.table)
+        self.booking.refresh_from_db()
+        updated_at = self.booking.updated_at
+
+        self.booking.tables.clear()
+
+        self.booking.refresh_from_db()
+        self.assertGreater(self.booking.updated_at, updated_at)
+
+
+class RecomputeAvailabilityTest(TestCase):
+    def setUp(self):
+        self.booking = baker.make(
+            'bookings.Booking', booking_date=timezone.now() + timedelta(days=2)
+        )
+        self.booking = Booking.objects.get(id=self.booking.id)
+
+    def test_booking_changed_dates(self):
+        # Test the date the Booking is moved from is sent along with the new date.
+        old_date = timezone.localdate(self.booking.booking_date)
+        self.booking.booking_date += timedelta(days=1)
+
+        with patch.object(booking_changed, 'send_robust') as mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.booking.save(send_update_email=False)
+
+        self.assertEqual(
+            set(mock.call_args.kwargs['dates']), {old_date, old_date + timedelta(days=1)}
+        )
+
+    @patch('bookings.signals.warm_availability')
+    @patch('bookings.signals.invalidate_availability')
+    def test_recompute_availability(self, mock_invalidate, mock_warm):
+        today = timezone.localdate()
+        dates = [today, today + timedelta(days=1), today + timedelta(days=365)]
+
+        booking_changed.send(
+            sender=Booking, booking_id=self.booking.id, site_id=self.booking.site_id, dates=dates
+        )
+
+        # Test every date is invalidated, but only those precomputed are recomputed.
+        self.assertEqual(mock_invalidate.call_count, 3)
+        mock_warm.delay.assert_called_once_with(
+            self.booking.site_id, [dates[1].isoformat()], record_metrics=False
+        )
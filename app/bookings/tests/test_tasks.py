@@ -1,11 +1,14 @@
 from django.core import mail
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from model_bakery import baker
 
 from sites.models import Site
-from ..tasks import send_reminder_emails
+from sites.snapshot import _snapshots
+from ..availability import get_precompute_metrics
+from ..tasks import precompute_availability, send_reminder_emails, warm_availability
 
 
 class SendReminderEmailsTest(TestCase):
@@ -67,3 +70,35 @@ class SendReminderEmailsTest(TestCase):
         send_reminder_emails()
 
         self.assertEqual(len(mail.outbox), 1)
+
+
+@override_settings(AVAILABILITY_PRECOMPUTE_DAYS=3, AVAILABILITY_PRECOMPUTE_CHUNK_SIZE=12)
+class PrecomputeAvailabilityTest(TestCase):
+    def setUp(self):
+        self.site_1 = baker.make('sites.Site', min_party_num=1, max_party_num=6)
+        self.site_2 = baker.make('sites.Site', min_party_num=1, max_party_num=2)
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+    def test_precompute_availability(self):
+        metrics = precompute_availability()
+
+        # Site 1 is split into chunks of 2 dates, Site 2 fits in one.
+        self.assertEqual(metrics['sites'], 2)
+        self.assertEqual(metrics['dates'], 6)
+        self.assertEqual(metrics['chunks'], 3)
+        self.assertEqual(metrics['entries_expected'], 24)
+
+        # The chunks are run eagerly in tests, so all entries are computed.
+        metrics = get_precompute_metrics()
+
+        self.assertEqual(metrics['entries_computed'], 24)
+        self.assertEqual(metrics['coverage'], 1.0)
+
+    def test_warm_availability_site_deleted(self):
+        site_id = self.site_2.id
+        self.site_2.delete()
+
+        self.assertEqual(warm_availability(site_id, [timezone.localdate().isoformat()]), 0)
@@ -1,4 +1,4 @@
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 from unittest.mock import patch
 
 from django.test import TestCase
@@ -1216,6 +1216,37 @@ class BookingSystemTest(TestCase):
 
         self.assertEqual(all_time_slots, expected_time_slots)
 
+    def test_generate_booking_times_schedule_override(self):
+        # Test the opening times of a date are replaced by its override.
+        booking_date = timezone.localdate() + timedelta(days=7)
+        override = baker.make(
+            'sites.ScheduleOverride',
+            site=self.site,
+            date=booking_date,
+            is_closed=False,
+            opening_hour=time(18, 0),
+            closing_hour=time(19, 0),
+        )
+
+        booking_system = BookingSystem(self.site, booking_date, self.party_size)
+        booking_system.generate_booking_times()
+
+        self.assertEqual(booking_system.opening_hour, time(18, 0))
+        self.assertEqual(
+            booking_system.all_time_slots,
+            [time(18, 0), time(18, 15), time(18, 30), time(18, 45), time(19, 0)],
+        )
+
+        # Test nothing can be booked when the Site is closed.
+        override.is_closed = True
+        override.save()
+
+        booking_system = BookingSystem(self.site, booking_date, self.party_size)
+
+        self.assertEqual(booking_system.get_available_time_slots(), [])
+        self.assertEqual(booking_system.get_tables(time(18, 0)), [])
+        self.assertIsNone(booking_system.opening_hour)
+
     # create_timetable
 
     def test_create_timetable_single_table_single_party_norm(self):
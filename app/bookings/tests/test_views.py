@@ -1,15 +1,25 @@
-from datetime import datetime, time
+from datetime import date, datetime, time
+from unittest import mock
 
+from django.conf import settings
 from django.core import mail
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.timezone import make_aware
 
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
 from model_bakery import baker
 
+from config.asgi import application, is_threaded
+from core.ratelimit import LocalTokenBuckets
+from core.tests.test_timeouts import make_timeout_error
 from sites.models import Site
+from ..availability import get_availability_cache_key
 from ..models import Booking
+from ..views import BookingListView, ClientUpdateView
 
 
 class ClientListViewTest(TestCase):
@@ -77,6 +87,53 @@ class ClientListViewTest(TestCase):
         self.assertEqual(len(response.context['object_list']), 1)
 
 
+class ClientAutocompleteViewTest(TestCase):
+    def setUp(self):
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+
+        self.client_1 = baker.make('bookings.Client', client_name='Jane Smith')
+        self.client_2 = baker.make('bookings.Client', client_name='Janet Jones')
+        self.booking = baker.make('bookings.Booking', client=self.client_1)
+
+    def test_view_url_exists_at_desired_location(self):
+        response = self.client.get('/clients/autocomplete/')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_unauthenticated_request(self):
+        self.client.logout()
+
+        response = self.client.get(reverse('client-autocomplete'))
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_get(self):
+        # Test when the query is too short.
+        response = self.client.get(reverse('client-autocomplete') + '?q=j')
+
+        self.assertEqual(response.json(), {'results': []})
+
+        response = self.client.get(reverse('client-autocomplete') + '?q=jane')
+        results = response.json()['results']
+
+        self.assertEqual(
+            [result['id'] for result in results], [self.client_1.id, self.client_2.id]
+        )
+        self.assertEqual(results[0]['url'], reverse('client-detail', args=[self.client_1.id]))
+
+        # Test when user is not a manager.
+        self.user.is_manager = False
+        self.user.site = self.booking.site
+        self.user.save()
+
+        response = self.client.get(reverse('client-autocomplete') + '?q=jane')
+
+        self.assertEqual(
+            [result['id'] for result in response.json()['results']], [self.client_1.id]
+        )
+
+
 class ClientUpdateViewTest(TestCase):
     def setUp(self):
         self.user = baker.make('accounts.User', is_manager=True)
@@ -129,6 +186,18 @@ class ClientUpdateViewTest(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertNotEqual(len(response.context['bookings']), 0)
+        self.assertEqual(response.context['stats']['total'], 3)
+
+    @mock.patch.object(ClientUpdateView, 'bookings_paginate_by', 2)
+    def test_get_context_data_paginated(self):
+        response = self.client.get(reverse('client-detail', args=[self.client_.id]))
+
+        self.assertEqual(len(response.context['bookings']), 2)
+        self.assertTrue(response.context['bookings'].has_next())
+
+        response = self.client.get(reverse('client-detail', args=[self.client_.id]) + '?page=2')
+
+        self.assertEqual(len(response.context['bookings']), 1)
 
     def test_post(self):
         data = {
@@ -283,6 +352,153 @@ class BookingListViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['object_list']), 2)
 
+    @mock.patch.object(BookingListView, 'paginate_by', 3)
+    def test_keyset_pagination(self):
+        query = '?booking_date_filter=all'
+        response = self.client.get(reverse('booking-list') + query)
+        page = response.context['page_obj']
+
+        self.assertEqual(len(response.context['object_list']), 3)
+        self.assertTrue(page.has_next())
+        self.assertContains(response, 'cursor=')
+
+        response = self.client.get(reverse('booking-list') + f'{query}&cursor={page.next_cursor}')
+
+        self.assertEqual(len(response.context['object_list']), 1)
+        self.assertFalse(response.context['page_obj'].has_next())
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('booking-list') + '?cursor=invalid')
+
+        self.assertEqual(response.status_code, 404)
+
+
+class BookingExportViewTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.user = baker.make('accounts.User', is_manager=False, site=self.site)
+        self.client.force_login(self.user)
+
+        self.booking_1 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.now() + timezone.timedelta(hours=72),
+        )
+        self.booking_2 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.now() - timezone.timedelta(hours=72),
+        )
+        self.booking_3 = baker.make(
+            'bookings.Booking',
+            booking_date=timezone.now() + timezone.timedelta(hours=72),
+        )
+
+    def get_content(self, response):
+        return b''.join(response.streaming_content).decode()
+
+    def test_view_url_exists_at_desired_location(self):
+        response = self.client.get('/bookings/export/')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_view_url_accessible_by_name(self):
+        response = self.client.get(reverse('booking-export'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('attachment', response['Content-Disposition'])
+
+    def test_unauthenticated_request(self):
+        self.client.logout()
+
+        response = self.client.get(reverse('booking-export'))
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_invalid_format(self):
+        response = self.client.get(reverse('booking-export') + '?format=xml')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_filtered(self):
+        # Test the Bookings are filtered as in the list, to the User's Site.
+        content = self.get_content(self.client.get(reverse('booking-export')))
+
+        self.assertIn(self.booking_1.reference, content)
+        self.assertNotIn(self.booking_2.reference, content)
+        self.assertNotIn(self.booking_3.reference, content)
+
+        content = self.get_content(
+            self.client.get(reverse('booking-export') + '?format=jsonl&booking_date_filter=all')
+        )
+
+        self.assertEqual(len(content.splitlines()), 2)
+        self.assertIn(self.booking_2.reference, content)
+
+
+class ASGIApplicationTest(TransactionTestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.user = baker.make('accounts.User', is_manager=False, site=self.site)
+        self.client.force_login(self.user)
+        self.cookie = f'{settings.SESSION_COOKIE_NAME}={self.client.session.session_key}'
+
+        self.booking = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.now() + timezone.timedelta(hours=72),
+        )
+
+    @async_to_sync
+    async def get(self, path, query_string=b''):
+        scope = {
+            'type': 'http',
+            'http_version': '1.1',
+            'method': 'GET',
+            'path': path,
+            'query_string': query_string,
+            'headers': [(b'cookie', self.cookie.encode())],
+        }
+        communicator = ApplicationCommunicator(application, scope)
+        await communicator.send_input({'type': 'http.request'})
+
+        start = await communicator.receive_output(timeout=5)
+        body = b''
+        while True:
+            message = await communicator.receive_output(timeout=5)
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+
+        await communicator.wait(timeout=5)
+        return start, body
+
+    def test_export(self):
+        # Test the export is streamed through the ASGI application, queries and all.
+        start, body = self.get(reverse('booking-export'))
+
+        self.assertEqual(start['status'], 200)
+        self.assertIn((b'content-type', b'text/csv'), start['headers'])
+        self.assertIn(self.booking.reference, body.decode())
+
+    def test_availability(self):
+        start, body = self.get(
+            reverse('booking-create-get-availability', args=[self.site.id]),
+            b'date=2021-06-11&party_size=2',
+        )
+
+        self.assertEqual(start['status'], 200)
+
+    def test_threaded_views(self):
+        # Test the views which block or stream are served in a thread of their own.
+        self.assertTrue(is_threaded(reverse('booking-export')))
+        self.assertTrue(
+            is_threaded(reverse('booking-create-get-availability', args=[self.site.id]))
+        )
+        self.assertFalse(is_threaded(reverse('booking-list')))
+        self.assertFalse(is_threaded('/unknown/'))
+
 
 class BookingSelectSiteViewTest(TestCase):
     def setUp(self):
@@ -448,6 +664,59 @@ class BookingCreateGetTimesViewTest(TestCase):
 
         self.assertEqual(response.status_code, 404)
 
+    def test_statement_timeout_stale_times(self):
+        key = get_availability_cache_key(self.site.id, date(2021, 6, 11), 6)
+        cache.set(key, ('old-version', 'old-generation', [time(12)]))
+        self.addCleanup(cache.delete, key)
+
+        with mock.patch(
+            'bookings.views.get_available_time_slots', side_effect=make_timeout_error()
+        ), self.assertLogs('core.mixins', 'WARNING'):
+            response = self.client.get(
+                reverse('booking-create-get-availability', args=[self.site.id])
+                + '?date=2021-06-11&party_size=6'
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '12:00')
+
+    def test_statement_timeout_without_stale_times(self):
+        with mock.patch(
+            'bookings.views.get_available_time_slots', side_effect=make_timeout_error()
+        ), self.assertLogs('core.mixins', 'WARNING'):
+            response = self.client.get(
+                reverse('booking-create-get-availability', args=[self.site.id])
+                + '?date=2021-06-11&party_size=6'
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertTemplateUsed(response, 'bookings/widgets/select_time_unavailable.html')
+
+    @override_settings(
+        RATE_LIMIT_ENABLED=True,
+        AVAILABILITY_IP_RATE_LIMIT=(0.1, 2),
+        AVAILABILITY_SITE_RATE_LIMIT=(0.1, 3),
+    )
+    @mock.patch('core.ratelimit.local_buckets', new_callable=LocalTokenBuckets)
+    def test_rate_limited(self, local_buckets):
+        url = (
+            reverse('booking-create-get-availability', args=[self.site.id])
+            + '?date=2021-06-11&party_size=6'
+        )
+
+        for _ in range(2):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        # Test the client is limited by its IP, then others by the Site.
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+
+        response = self.client.get(url, REMOTE_ADDR='10.0.0.2')
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(url, REMOTE_ADDR='10.0.0.3')
+        self.assertEqual(response.status_code, 429)
+
     def test_get_context_data_backend(self):
         response = self.client.get(
             reverse('booking-create-get-availability', args=[self.site.id])
@@ -1,6 +1,6 @@
 from django.urls import path
 
-from . import views
+from . import api, views
 
 urlpatterns = [
     path(
@@ -8,16 +8,31 @@ urlpatterns = [
         views.ClientListView.as_view(),
         name='client-list',
     ),
+    path(
+        'clients/autocomplete/',
+        views.ClientAutocompleteView.as_view(),
+        name='client-autocomplete',
+    ),
     path(
         'clients/<pk>/',
         views.ClientUpdateView.as_view(),
         name='client-detail',
     ),
+    path(
+        'clients/<pk>/archive/',
+        views.ClientArchiveView.as_view(),
+        name='client-archive',
+    ),
     path(
         'bookings/',
         views.BookingListView.as_view(),
         name='booking-list',
     ),
+    path(
+        'bookings/export/',
+        views.BookingExportView.as_view(),
+        name='booking-export',
+    ),
     path(
         'bookings/select-site/',
         views.BookingSelectSiteView.as_view(),
@@ -48,4 +63,29 @@ urlpatterns = [
         views.BookingEmailClientView.as_view(),
         name='booking-email-client',
     ),
+    path(
+        'api/bookings/',
+        api.BookingListAPIView.as_view(),
+        name='api-booking-list',
+    ),
+    path(
+        'api/bookings/<pk>/',
+        api.BookingDetailAPIView.as_view(),
+        name='api-booking-detail',
+    ),
+    path(
+        'api/availability/',
+        api.AvailabilityBatchAPIView.as_view(),
+        name='api-availability',
+    ),
+    path(
+        'api/clients/',
+        api.ClientListAPIView.as_view(),
+        name='api-client-list',
+    ),
+    path(
+        'api/clients/<pk>/',
+        api.ClientDetailAPIView.as_view(),
+        name='api-client-detail',
+    ),
 ]
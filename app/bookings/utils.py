@@ -3,9 +3,11 @@ from datetime import date, datetime, timedelta
 
 from django.utils import timezone
 
+from bookings.filters import get_date_range_filter
 from bookings.models import Booking, BookingTableRelationship
 from frontend.utils import get_last_booking_date
 from sites.models import Site
+from sites.snapshot import get_site_snapshot
 
 
 def round_time(date):
@@ -31,6 +33,24 @@ def round_time(date):
         return date.replace(hour=hour, minute=0)
 
 
+def get_booked_tables(site_id, booking_date):
+    """
+    Return the BookingTableRelationships of the confirmed Bookings of a Site on the
+    given date, in the order they were allocated.
+    """
+    return (
+        BookingTableRelationship.objects.filter(
+            booking_id__in=Booking.objects.filter(
+                get_date_range_filter('booking_date', booking_date, booking_date),
+                site_id=site_id,
+                status=Booking.StatusChoices.CONFIRMED,
+            ).values_list('id', flat=True),
+        )
+        .select_related('booking', 'table')
+        .order_by('created_at')
+    )
+
+
 class BookingSystem:
     """
     This class contains the methods for the complete booking system.
@@ -54,9 +74,10 @@ class BookingSystem:
         frontend=False,
         duration=None,
         exclude_booking_id=None,
+        booked_tables=None,
     ):
         self.frontend = frontend
-        self.site = site
+        self.site = get_site_snapshot(site)
 
         self.booking_date = date
         self.booking_day = date.weekday()
@@ -69,6 +90,9 @@ class BookingSystem:
 
         self.exclude_booking_id = exclude_booking_id
 
+        # The booked Tables of the date, when loaded once for several BookingSystems.
+        self.booked_tables = booked_tables
+
         # Fields populated by class.
         self.opening_hour = None
         self.closing_hour = None
@@ -116,6 +140,10 @@ class BookingSystem:
         if not self.timetable:
             self.get_available_time_slots()
 
+        # No Tables can be booked on a day the Site is closed.
+        if not self.all_time_slots:
+            return []
+
         for potential_table in self.normalised_party_size:
             tables = []
             valid_time_slot = [False for _ in range(len(potential_table))]
@@ -155,11 +183,7 @@ class BookingSystem:
         party_size is greater than the largest Table, the remainder after division only
         has this process applied for it.
         """
-        seat_choices = list(
-            self.site.tables.all()
-            .values_list('number_of_seats', flat=True)
-            .order_by('number_of_seats')
-        )
+        seat_choices = self.site.get_seat_choices()
 
         # Ensure there are Tables for the Site.
         if not seat_choices:
@@ -201,9 +225,18 @@ class BookingSystem:
 
     def generate_booking_times(self):
         """Generate all of the theoretical time slots that could be booked."""
+        day = self.site.get_day(self.booking_date)
+        self.opening_hour = opening_hour = day.opening_hour
+        self.closing_hour = closing_hour = day.closing_hour
+
+        # The time slots of the day are compiled with the Site's schedule.
+        self.all_time_slots = list(day.times)
+
+        # Nothing can be booked when the Site is closed.
+        if day.is_closed:
+            return
+
         # Calculate the minimum and maximum range a booking can be made for.
-        opening_hour = getattr(self.site, self.DAY_MAPPINGS[self.booking_day] + '_opening_hour')
-        closing_hour = getattr(self.site, self.DAY_MAPPINGS[self.booking_day] + '_closing_hour')
         first_booking_time = opening_hour
         last_booking_time = (
             datetime.combine(date.today(), closing_hour)
@@ -221,23 +254,12 @@ class BookingSystem:
             else:
                 first_booking_time = round_time(now).time().replace(second=0, microsecond=0)
 
-        self.opening_hour = opening_hour
-        self.closing_hour = closing_hour
         self.min_booking_hour = first_booking_time
         self.max_booking_hour = last_booking_time
 
-        # Create a list of all the possible time slots.
-        all_time_slots = []
-        temp_date = datetime.combine(date.today(), self.opening_hour)
-        while temp_date.time() <= self.closing_hour:
-            all_time_slots.append(temp_date.time())
-            temp_date += timedelta(minutes=15)
-
-        self.all_time_slots = all_time_slots
-
     def create_timetable(self):
         """Create a timetable containing the time slots for each "table"."""
-        tables = self.site.tables.filter(number_of_seats__in=self.flat_party_size)
+        tables = self.site.get_tables(self.flat_party_size)
 
         timetable = {
             x.id: {
@@ -256,19 +278,20 @@ class BookingSystem:
         from the timeable of it's corresponding Table/s.
         """
         # Remove the time slots that have already been booked.
-        tables = self.already_booked_tables = (  # For testing purposes
-            BookingTableRelationship.objects.filter(
-                booking_id__in=Booking.objects.filter(
-                    site=self.site,
-                    booking_date__date=self.booking_date,
-                    status=Booking.StatusChoices.CONFIRMED,
-                ).values_list('id', flat=True),
-                table__number_of_seats__in=self.flat_party_size,
+        if self.booked_tables is None:
+            tables = (
+                get_booked_tables(self.site.id, self.booking_date)
+                .filter(table__number_of_seats__in=self.flat_party_size)
+                .exclude(booking_id=self.exclude_booking_id)
             )
-            .exclude(booking_id=self.exclude_booking_id)
-            .select_related('booking', 'table')
-            .order_by('created_at')
-        )
+        else:
+            tables = [
+                x
+                for x in self.booked_tables
+                if x.table.number_of_seats in self.flat_party_size
+                and x.booking_id != self.exclude_booking_id
+            ]
+        self.already_booked_tables = tables  # For testing purposes
 
         for table in tables:
             # Remove this tables time slot from the timetable.
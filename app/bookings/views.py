@@ -1,44 +1,83 @@
 from datetime import datetime
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
 from django.core.exceptions import SuspiciousOperation
-from django.db.models import Q
-from django.http.response import Http404
+from django.core.paginator import Paginator
+from django.http.response import Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.urls.base import reverse_lazy
 from django.utils import timezone
-from django.views.generic import DetailView, FormView, ListView, UpdateView
+from django.views.generic import DetailView, FormView, ListView, UpdateView, View
 
+from core.mixins import RateLimitMixin, ReplicaReadMixin, StatementTimeoutMixin
+from core.pagination import KeysetPaginationMixin
+from core.ratelimit import get_client_ip
 from sites.models import Site
+from .archive import restore_bookings
+from .availability import get_available_time_slots, get_stale_time_slots
 from .email import send_client_email
+from .export import EXPORT_FORMATS, iter_export
+from .filters import filter_bookings
 from .forms import CreateBookingForm, SendEmailForm, UpdateBookingForm
 from .models import Booking, Client
+from .search import get_search_backend
 from .utils import BookingSystem
 
 
-class ClientListView(LoginRequiredMixin, ListView):
+class ClientListView(LoginRequiredMixin, ReplicaReadMixin, KeysetPaginationMixin, ListView):
     """
     View to list the Clients.
     """
 
     template_name = 'bookings/client_list.html'
     paginate_by = 50
+    keyset_ordering = ('client_name', 'id')
+    estimate_count = True
 
     def get_queryset(self):
         """Perform filtering based on optionally passed query parameter."""
-        queryset = Client.objects.get_clients(self.request.user).order_by('client_name')
+        queryset = Client.objects.get_clients_with_stats(self.request.user).order_by(
+            'client_name', 'id'
+        )
 
         if query := self.request.GET.get('q'):
-            queryset = queryset.filter(
-                Q(client_name__icontains=query) | Q(client_email__icontains=query)
-            )
+            queryset = get_search_backend(queryset.db).search_clients(queryset, query)
 
         return queryset
 
 
+class ClientAutocompleteView(LoginRequiredMixin, View):
+    """
+    View to return the Clients best matching the search query as JSON.
+    """
+
+    min_length = 2
+    limit = 10
+
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get('q', '').strip()
+        if len(query) < self.min_length:
+            return JsonResponse({'results': []})
+
+        queryset = Client.objects.get_clients(request.user)
+        clients = get_search_backend(queryset.db).rank_clients(queryset, query)
+        clients = clients.only('id', 'client_name', 'client_email')
+        results = [
+            {
+                'id': client.id,
+                'client_name': client.client_name,
+                'client_email': client.client_email,
+                'url': reverse('client-detail', args=[client.id]),
+            }
+            for client in clients[: self.limit]
+        ]
+        return JsonResponse({'results': results})
+
+
 class ClientUpdateView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
     """
     View to display and update a Client's details.
@@ -55,27 +94,63 @@ class ClientUpdateView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
     def get_queryset(self):
         return Client.objects.get_clients(self.request.user)
 
+    bookings_paginate_by = 10
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['bookings'] = self.object.get_bookings(self.request.user)
+        bookings = self.object.get_bookings(self.request.user)
+        paginator = Paginator(bookings, self.bookings_paginate_by)
+        context['bookings'] = paginator.get_page(self.request.GET.get('page'))
+        context['stats'] = self.object.get_booking_stats(self.request.user)
         return context
 
     def get_success_url(self):
         return reverse('client-detail', args=[self.object.id])
 
 
-class BookingListView(LoginRequiredMixin, ListView):
+class ClientArchiveView(LoginRequiredMixin, DetailView):
+    """
+    View to list the archived Bookings of a Client, and restore them to the Booking table.
+    """
+
+    template_name = 'bookings/client_archive.html'
+    paginate_by = 50
+
+    def get_queryset(self):
+        return Client.objects.get_clients(self.request.user)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        bookings = self.object.get_archived_bookings(self.request.user)
+        paginator = Paginator(bookings, self.paginate_by)
+        context['bookings'] = paginator.get_page(self.request.GET.get('page'))
+        return context
+
+    def post(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        count = restore_bookings(self.object.get_archived_bookings(request.user))
+        messages.success(request, f'{count} archived bookings successfully restored')
+        return redirect('client-detail', self.object.id)
+
+
+class BookingListView(
+    LoginRequiredMixin, ReplicaReadMixin, StatementTimeoutMixin, KeysetPaginationMixin, ListView
+):
     """
     View to list the Bookings. Query parameters can be passed to filter the results.
     """
 
     template_name = 'bookings/booking_list.html'
     paginate_by = 50
+    keyset_ordering = ('booking_date', 'id')
+    estimate_count = True
+    statement_timeout = 5000
+    atomic_requests = False
 
     def get_queryset(self):
         """Perform filtering based on optionally passed query parameter."""
         queryset = Booking.objects.get_bookings(self.request.user)
-        return self.filter_queryset(queryset).order_by('booking_date')
+        return self.filter_queryset(queryset).order_by('booking_date', 'id')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -84,38 +159,30 @@ class BookingListView(LoginRequiredMixin, ListView):
         return context
 
     def filter_queryset(self, queryset):
-        # Filter based on search query.
-        if query := self.request.GET.get('q'):
-            queryset = queryset.filter(
-                Q(reference__iexact=query)
-                | Q(client__client_name__icontains=query)
-                | Q(client__client_email__icontains=query)
-            )
-
-        # Filter based on date range of bookings.
-        today_and_future_bookings = queryset.filter(booking_date__date__gte=timezone.now().date())
-        if query := self.request.GET.get('booking_date_filter'):
-            today = timezone.now().date()
-            if query == 'today':
-                queryset = queryset.filter(booking_date__date=today)
-            elif query == 'future':
-                queryset = queryset.filter(booking_date__date__gt=today)
-            elif query == 'all':
-                queryset = queryset
-            else:
-                queryset = today_and_future_bookings
-        else:
-            queryset = today_and_future_bookings
-
-        # Filter based on Site.
-        if site_id := self.request.GET.get('booking_site'):
-            queryset = queryset.filter(site=site_id)
-
-        # Filter based on booking date.
-        if booking_date := self.request.GET.get('booking_date'):
-            queryset = queryset.filter(booking_date__date=booking_date)
+        return filter_bookings(queryset, self.request.GET)
 
-        return queryset
+
+class BookingExportView(LoginRequiredMixin, View):
+    """
+    View to export the Bookings matching the filters of the Booking list as CSV or JSON
+    lines. The export is streamed as it is read from the database, so under ASGI it is
+    served in a thread, see config.asgi.
+    """
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get('format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+
+        queryset = filter_bookings(Booking.objects.get_bookings(request.user), request.GET)
+        content_type, extension = EXPORT_FORMATS[export_format]
+
+        response = StreamingHttpResponse(
+            iter_export(queryset, export_format), content_type=content_type
+        )
+        filename = f'bookings-{timezone.localdate().isoformat()}.{extension}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
 
 
 class BookingSelectSiteView(LoginRequiredMixin, ListView):
@@ -171,13 +238,29 @@ class BookingCreateView(LoginRequiredMixin, SuccessMessageMixin, FormView):
         return super().form_valid(form)
 
 
-class BookingCreateGetTimesView(FormView):
+class BookingCreateGetTimesView(
+    RateLimitMixin, ReplicaReadMixin, StatementTimeoutMixin, FormView
+):
     """
-    View that is called via ajax and returns html of the times select widget.
+    View that is called via ajax and returns html of the times select widget. As it is
+    public, requests are rate limited per client IP and per Site, and the times last
+    cached are returned if they cannot be computed within the time budget.
     """
 
     template_name = 'bookings/widgets/select_time_widget.html'
     form_class = CreateBookingForm
+    statement_timeout = 2000
+    atomic_requests = False
+    statement_timeout_template_name = 'bookings/widgets/select_time_unavailable.html'
+
+    def get_rate_limits(self):
+        return [
+            (
+                f'availability.ip.{get_client_ip(self.request)}',
+                *settings.AVAILABILITY_IP_RATE_LIMIT,
+            ),
+            (f'availability.site.{self.kwargs["pk"]}', *settings.AVAILABILITY_SITE_RATE_LIMIT),
+        ]
 
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
@@ -199,9 +282,9 @@ class BookingCreateGetTimesView(FormView):
         context = super().get_context_data(**kwargs)
         frontend = self.request.GET.get('f') == 'true'
         context['booking_system'] = booking_system = BookingSystem(
-            self.object, *self._get_params(), frontend=frontend
+            context['form'].snapshot, *self._get_params(), frontend=frontend
         )  #  For testing.
-        context['available_time_slots'] = booking_system.get_available_time_slots()
+        context['available_time_slots'] = get_available_time_slots(booking_system)
         return context
 
     def _get_params(self):
@@ -223,6 +306,18 @@ class BookingCreateGetTimesView(FormView):
 
         return date, party_size
 
+    def statement_timeout_exceeded(self, exc):
+        date, party_size = self._get_params()
+        available_time_slots = get_stale_time_slots(self.kwargs['pk'], date, party_size)
+        if available_time_slots is None:
+            return super().statement_timeout_exceeded(exc)
+
+        return self.response_class(
+            self.request,
+            self.get_template_names(),
+            {'available_time_slots': available_time_slots},
+        )
+
 
 class BookingUpdateView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
     """
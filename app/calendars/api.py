@@ -1,30 +1,89 @@
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.utils import timezone
+
 from dateutil import parser
 from rest_framework.generics import ListAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from bookings.filters import get_date_range_filter
 from bookings.models import Booking
+from core.mixins import ReplicaReadMixin, StatementTimeoutMixin
+from core.replicas import get_replica
+from sites.models import Site
 from .serializers import BookingSerializer
+from .utils import get_resources
+
+# Changes are re-sent for this long before the cursor to cover transactions that were
+# still in flight when the previous response was generated.
+DELTA_SYNC_OVERLAP = timezone.timedelta(seconds=5)
 
 
-class CalendarAPIView(ListAPIView):
+class CalendarAPIView(ReplicaReadMixin, StatementTimeoutMixin, ListAPIView):
     """
-    API view to return the Bookings for a given time period.
+    API view to return the Bookings for a given time period. When a `since` cursor is
+    passed, only the Bookings changed after it are returned along with the ids of the
+    Bookings which should be removed from the calendar.
     """
 
     serializer_class = BookingSerializer
+    statement_timeout = 5000
+    atomic_requests = False
+
+    def list(self, request, *args, **kwargs):
+        cursor = timezone.now()
+
+        if since := self.request.GET.get('since'):
+            response = self.delta_list(parser.isoparse(since))
+        else:
+            response = super().list(request, *args, **kwargs)
+
+        response['X-Sync-Cursor'] = cursor.isoformat()
+        return response
+
+    def delta_list(self, since):
+        """
+        Return the Bookings created, changed or cancelled after the given cursor. Changed
+        Bookings no longer matching the filters are returned as tombstones.
+        """
+        changed_since = since - DELTA_SYNC_OVERLAP
+        if get_replica():
+            # Changes may reach the replica this long after the cursor was taken.
+            changed_since -= timezone.timedelta(seconds=settings.REPLICA_STICKY_SECONDS)
+
+        bookings = self.get_queryset().filter(updated_at__gte=changed_since)
+        events = self.get_serializer(bookings, many=True).data
+
+        removed = (
+            self.get_site_queryset()
+            .filter(updated_at__gte=changed_since)
+            .exclude(id__in=[event['id'] for event in events])
+            .values_list('id', flat=True)
+        )
+
+        return Response({'events': events, 'removed': list(removed)})
+
+    def get_site_queryset(self):
+        """Return the Bookings the User can see for the selected Site."""
+        bookings = Booking.objects.get_bookings(self.request.user)
+
+        if site := self.request.GET.get('booking_site'):
+            bookings = bookings.filter(site=site)
+
+        return bookings
 
     def get_queryset(self):
         start = parser.isoparse(self.request.GET.get('start'))
         end = parser.isoparse(self.request.GET.get('end'))
 
         bookings = (
-            Booking.objects.get_bookings(self.request.user)
-            .filter(booking_date__date__gte=start, booking_date__date__lte=end)
+            self.get_site_queryset()
+            .filter(get_date_range_filter('booking_date', start.date(), end.date()))
             .select_related('site', 'client')
+            .prefetch_related('tables')
         )
 
-        if site := self.request.GET.get('booking_site'):
-            bookings = bookings.filter(site=site)
-
         default_status = bookings.filter(status=Booking.StatusChoices.CONFIRMED)
         if status := self.request.GET.get('booking_status'):
             if status == 'cancelled':
@@ -37,3 +96,28 @@ class CalendarAPIView(ListAPIView):
             bookings = default_status
 
         return bookings
+
+
+class CalendarResourcesAPIView(APIView):
+    """
+    API view to return the calendar resources (Tables) of the Sites the User can see, a
+    page of Sites at a time.
+    """
+
+    page_size = 10
+
+    def get(self, request, *args, **kwargs):
+        sites = Site.objects.get_sites(request.user).order_by('site_name')
+
+        if site := request.GET.get('booking_site'):
+            sites = sites.filter(id=site)
+
+        paginator = Paginator(sites.values_list('id', flat=True), self.page_size)
+        page = paginator.get_page(request.GET.get('page'))
+
+        return Response(
+            {
+                'resources': get_resources(list(page)),
+                'next': page.next_page_number() if page.has_next() else None,
+            }
+        )
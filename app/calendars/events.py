@@ -0,0 +1,221 @@
+import asyncio
+import json
+import logging
+import queue
+import select
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+
+import psycopg2
+import redis
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'calendar.site.'
+POSTGRES_CHANNEL = 'calendar_bookings'
+
+
+def encode_message(booking_id, site_id, cursor):
+    return json.dumps({'id': booking_id, 'site': site_id, 'cursor': cursor})
+
+
+def decode_message(data):
+    if isinstance(data, bytes):
+        data = data.decode()
+    return json.loads(data)
+
+
+class RedisBackend:
+    """
+    Publish booking changes with Redis pub/sub. Each Site has its own channel and
+    listeners subscribe to all of them with a single pattern subscription.
+    """
+
+    def __init__(self, url=None):
+        self.url = url or settings.CALENDAR_EVENTS_REDIS_URL
+
+    def get_client(self):
+        return redis.Redis.from_url(self.url)
+
+    def publish(self, site_id, message):
+        self.get_client().publish(f'{CHANNEL_PREFIX}{site_id}', message)
+
+    def listen(self, stop_event, timeout=1.0):
+        pubsub = self.get_client().pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(f'{CHANNEL_PREFIX}*')
+
+        try:
+            while not stop_event.is_set():
+                message = pubsub.get_message(timeout=timeout)
+                if message is not None and message['type'] == 'pmessage':
+                    yield decode_message(message['data'])
+        finally:
+            pubsub.close()
+
+
+class PostgresBackend:
+    """
+    Publish booking changes with PostgreSQL LISTEN/NOTIFY. Useful in development where
+    Redis may not be running. All Sites share a single channel.
+    """
+
+    def publish(self, site_id, message):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [POSTGRES_CHANNEL, message])
+
+    def get_connection(self):
+        db = settings.DATABASES['default']
+        conn = psycopg2.connect(
+            dbname=db['NAME'],
+            user=db['USER'],
+            password=db['PASSWORD'],
+            host=db['HOST'],
+            port=db['PORT'],
+        )
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def listen(self, stop_event, timeout=1.0):
+        conn = self.get_connection()
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN {POSTGRES_CHANNEL}')
+
+            while not stop_event.is_set():
+                if select.select([conn], [], [], timeout) == ([], [], []):
+                    continue
+
+                conn.poll()
+                while conn.notifies:
+                    yield decode_message(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+
+
+class LocalBackend:
+    """
+    In-process backend for tests and single process deployments.
+    """
+
+    messages = queue.Queue()
+
+    def publish(self, site_id, message):
+        self.messages.put(message)
+
+    def listen(self, stop_event, timeout=1.0):
+        while not stop_event.is_set():
+            try:
+                yield decode_message(self.messages.get(timeout=timeout))
+            except queue.Empty:
+                continue
+
+
+BACKENDS = {
+    'redis': 'calendars.events.RedisBackend',
+    'postgres': 'calendars.events.PostgresBackend',
+    'local': 'calendars.events.LocalBackend',
+}
+
+
+def get_backend():
+    backend = settings.CALENDAR_EVENTS_BACKEND
+    return import_string(BACKENDS.get(backend, backend))()
+
+
+def publish_booking_change(booking_id, site_id, cursor):
+    """
+    Publish a change to a Booking to the listeners of its Site. Failures are logged
+    rather than raised as clients recover missed changes when they next sync.
+    """
+    try:
+        get_backend().publish(site_id, encode_message(booking_id, site_id, cursor))
+    except Exception:
+        logger.exception('Failed to publish change to booking %s', booking_id)
+
+
+class Subscription:
+    """
+    A bounded queue of booking changes for a single client connection. If the client
+    cannot keep up, queued changes are dropped and the client is asked to resync.
+    """
+
+    def __init__(self, site_ids, loop, queue):
+        self.site_ids = set(site_ids)
+        self.loop = loop
+        self.queue = queue
+        self.overflowed = False
+
+    def push(self, message):
+        if self.overflowed:
+            return
+
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Queue is full. Discard the backlog and wake the consumer to resync.
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class EventHub:
+    """
+    Share a single broker subscription between all of the client connections of a
+    process, dispatching each change to the subscriptions of the changed Site.
+    """
+
+    def __init__(self, backend_factory=get_backend, retry_delay=5):
+        self.backend_factory = backend_factory
+        self.retry_delay = retry_delay
+        self.subscriptions = defaultdict(set)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def subscribe(self, subscription):
+        with self.lock:
+            for site_id in subscription.site_ids:
+                self.subscriptions[site_id].add(subscription)
+
+            # The listener is started with the first subscription and then kept running
+            # for the lifetime of the process.
+            if self.thread is None or not self.thread.is_alive():
+                self.stop_event.clear()
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            for site_id in subscription.site_ids:
+                self.subscriptions[site_id].discard(subscription)
+                if not self.subscriptions[site_id]:
+                    del self.subscriptions[site_id]
+
+    def stop(self):
+        self.stop_event.set()
+
+    def dispatch(self, message):
+        with self.lock:
+            subscriptions = list(self.subscriptions.get(message['site'], []))
+
+        for subscription in subscriptions:
+            subscription.loop.call_soon_threadsafe(subscription.push, message)
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                for message in self.backend_factory().listen(self.stop_event):
+                    self.dispatch(message)
+            except Exception:
+                logger.exception('Calendar event listener failed, reconnecting')
+                time.sleep(self.retry_delay)
+
+
+hub = EventHub()
@@ -39,7 +39,7 @@ class BookingSerializer(serializers.ModelSerializer):
         return obj.booking_date + timezone.timedelta(minutes=obj.duration)
 
     def get_resourceIds(self, obj):
-        return obj.tables.values_list('id', flat=True)
+        return [table.id for table in obj.tables.all()]
 
     def get_allDay(self, obj):
         return obj.duration == Site.BookingDurationChoices.ALL
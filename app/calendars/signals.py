@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch.dispatcher import receiver
+from django.utils import timezone
+
+from bookings.signals import booking_changed
+from sites.models import ScheduleOverride, Site, Table
+from .events import publish_booking_change
+from .utils import invalidate_resources
+
+
+@receiver(booking_changed)
+def push_booking_change(sender, booking_id, site_id, **kwargs):
+    """
+    Push the change to the calendars listening for changes to the Booking's Site.
+    """
+    publish_booking_change(booking_id, site_id, timezone.now().isoformat())
+
+
+@receiver(post_save, sender=Site)
+def invalidate_site_resources(sender, instance, *args, **kwargs):
+    """
+    Invalidate the Site's calendar resources when its name or schedule may have changed.
+    """
+    invalidate_resources(instance.id)
+
+
+@receiver(post_save, sender=Table)
+@receiver(post_delete, sender=Table)
+def invalidate_table_resources(sender, instance, *args, **kwargs):
+    """
+    Invalidate the calendar resources of a Table's Site when the Table changes.
+    """
+    invalidate_resources(instance.site_id)
+
+
+@receiver(post_save, sender=ScheduleOverride)
+@receiver(post_delete, sender=ScheduleOverride)
+def invalidate_schedule_override_resources(sender, instance, *args, **kwargs):
+    """
+    Invalidate the calendar resources of a ScheduleOverride's Site when the override
+    changes.
+    """
+    invalidate_resources(instance.site_id)
@@ -0,0 +1,208 @@
+import asyncio
+import functools
+import json
+from http.cookies import SimpleCookie
+from importlib import import_module
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.db import close_old_connections
+
+from asgiref.sync import sync_to_async
+from dateutil import parser
+
+from bookings.models import Booking
+from sites.models import Site
+from .api import DELTA_SYNC_OVERLAP
+from .events import Subscription, hub
+
+EVENTS_PATH = '/api/calendar/events/'
+
+# Milliseconds a client waits before reconnecting after the stream drops.
+RECONNECT_DELAY = 5000
+
+
+def database_sync_to_async(func):
+    """
+    Run the given function in a thread, closing the database connections it leaves
+    behind as there is no request cycle to do it.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(wrapper, thread_sensitive=True)
+
+
+@database_sync_to_async
+def get_scope_user(headers):
+    """Return the User of the session cookie sent with the request."""
+    cookie = SimpleCookie(headers.get('cookie', ''))
+    session_key = cookie.get(settings.SESSION_COOKIE_NAME)
+
+    engine = import_module(settings.SESSION_ENGINE)
+    session = engine.SessionStore(session_key.value if session_key else None)
+    return get_user(SimpleNamespace(session=session))
+
+
+@database_sync_to_async
+def get_site_ids(user, site_id=None):
+    sites = Site.objects.get_sites(user)
+
+    if site_id:
+        sites = sites.filter(id=site_id)
+
+    return list(sites.values_list('id', flat=True))
+
+
+@database_sync_to_async
+def get_missed_changes(site_ids, since, limit):
+    """Return the changes to the given Sites' Bookings after the given cursor."""
+    return list(
+        Booking.objects.filter(site_id__in=site_ids, updated_at__gte=since - DELTA_SYNC_OVERLAP)
+        .order_by('updated_at')
+        .values_list('id', 'site_id', 'updated_at')[:limit]
+    )
+
+
+def format_event(data=None, event=None, event_id=None, comment=None):
+    """Format a server-sent event."""
+    lines = []
+
+    if comment is not None:
+        lines.append(f': {comment}')
+    if event is not None:
+        lines.append(f'event: {event}')
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    if data is not None:
+        lines.append(f'data: {json.dumps(data)}')
+
+    return ('\n'.join(lines) + '\n\n').encode()
+
+
+class CalendarEventStream:
+    """
+    ASGI application streaming changes to the Bookings of the Sites the User can see as
+    server-sent events. Reconnecting clients are sent the changes made since the
+    `Last-Event-ID` they last received.
+    """
+
+    def __init__(self, heartbeat=None, queue_size=None):
+        self.heartbeat = heartbeat or settings.CALENDAR_EVENTS_HEARTBEAT
+        self.queue_size = queue_size or settings.CALENDAR_EVENTS_QUEUE_SIZE
+
+    async def __call__(self, scope, receive, send):
+        headers = {key.decode().lower(): value.decode() for key, value in scope['headers']}
+        query = parse_qs(scope.get('query_string', b'').decode())
+
+        user = await get_scope_user(headers)
+        if not user.is_authenticated:
+            await self.send_forbidden(send)
+            return
+
+        site_ids = await get_site_ids(user, query.get('booking_site', [None])[0])
+        last_event_id = headers.get('last-event-id') or query.get('last_event_id', [None])[0]
+
+        subscription = Subscription(
+            site_ids, asyncio.get_event_loop(), asyncio.Queue(maxsize=self.queue_size)
+        )
+        hub.subscribe(subscription)
+
+        try:
+            await send(
+                {
+                    'type': 'http.response.start',
+                    'status': 200,
+                    'headers': [
+                        (b'content-type', b'text/event-stream'),
+                        (b'cache-control', b'no-cache'),
+                        (b'x-accel-buffering', b'no'),
+                    ],
+                }
+            )
+            await self.send_event(send, f'retry: {RECONNECT_DELAY}\n\n'.encode())
+
+            if last_event_id:
+                await self.replay(send, site_ids, last_event_id)
+
+            await self.stream(subscription, receive, send)
+        finally:
+            hub.unsubscribe(subscription)
+
+    async def replay(self, send, site_ids, last_event_id):
+        """Send the changes missed since the given event id."""
+        try:
+            since = parser.isoparse(last_event_id)
+        except ValueError:
+            await self.send_event(send, format_event(data={}, event='resync'))
+            return
+
+        changes = await get_missed_changes(site_ids, since, self.queue_size + 1)
+
+        # Too many changes to replay, let the client fetch them in one go instead.
+        if len(changes) > self.queue_size:
+            await self.send_event(send, format_event(data={}, event='resync'))
+            return
+
+        for booking_id, site_id, updated_at in changes:
+            cursor = updated_at.isoformat()
+            data = {'id': booking_id, 'site': site_id, 'cursor': cursor}
+            await self.send_event(send, format_event(data=data, event_id=cursor))
+
+    async def stream(self, subscription, receive, send):
+        """Send changes as they arrive, with a heartbeat when there are none."""
+        disconnect = asyncio.ensure_future(self.wait_for_disconnect(receive))
+
+        try:
+            while not disconnect.done():
+                message = asyncio.ensure_future(subscription.queue.get())
+                done, _ = await asyncio.wait(
+                    [message, disconnect],
+                    timeout=self.heartbeat,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if message not in done:
+                    message.cancel()
+                    if not disconnect.done():
+                        await self.send_event(send, format_event(comment='heartbeat'))
+                    continue
+
+                message = message.result()
+                if message is None:
+                    # The subscription overflowed, the client needs to resync.
+                    subscription.overflowed = False
+                    await self.send_event(send, format_event(data={}, event='resync'))
+                else:
+                    await self.send_event(
+                        send, format_event(data=message, event_id=message['cursor'])
+                    )
+        finally:
+            disconnect.cancel()
+
+    async def wait_for_disconnect(self, receive):
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+
+    async def send_event(self, send, body):
+        await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+
+    async def send_forbidden(self, send):
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': 403,
+                'headers': [(b'content-type', b'text/plain')],
+            }
+        )
+        await send({'type': 'http.response.body', 'body': b'Forbidden'})
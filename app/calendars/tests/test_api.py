@@ -1,6 +1,9 @@
 from datetime import datetime
+from unittest import mock
 
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils import timezone
 
 from model_bakery import baker
 from rest_framework import status
@@ -94,3 +97,87 @@ class CalendarAPIViewTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 3)
+
+    def test_get_queryset_sets_sync_cursor(self):
+        today = '2021-06-01T00:00:00%2B01:00'
+        tomorrow = '2021-06-02T00:00:00%2B01:00'
+        url = reverse('api-calendar-bookings') + f'?start={today}&end={tomorrow}'
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('X-Sync-Cursor', response)
+
+    def test_delta_list_changed_bookings(self):
+        today = '2021-06-01T00:00:00%2B01:00'
+        tomorrow = '2021-06-02T00:00:00%2B01:00'
+        since = (timezone.now() - timezone.timedelta(hours=1)).isoformat().replace('+', '%2B')
+        url = reverse('api-calendar-bookings') + f'?start={today}&end={tomorrow}&since={since}'
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['events']), 2)
+        self.assertEqual(response.data['removed'], [self.booking_3.id])
+
+    def test_delta_list_no_changes(self):
+        today = '2021-06-01T00:00:00%2B01:00'
+        tomorrow = '2021-06-02T00:00:00%2B01:00'
+        since = (timezone.now() + timezone.timedelta(hours=1)).isoformat().replace('+', '%2B')
+        url = reverse('api-calendar-bookings') + f'?start={today}&end={tomorrow}&since={since}'
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['events'], [])
+        self.assertEqual(response.data['removed'], [])
+
+
+class CalendarResourcesAPIViewTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+
+        self.sites = baker.make('sites.Site', _quantity=3)
+        for site in self.sites:
+            baker.make('sites.Table', site=site, _quantity=2)
+
+    def test_get(self):
+        response = self.client.get(reverse('api-calendar-resources'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['resources']), 6)
+        self.assertIsNone(response.data['next'])
+
+    def test_get_with_site_passed(self):
+        site = self.sites[0]
+        url = reverse('api-calendar-resources') + f'?booking_site={site.id}'
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['resources']), 2)
+        self.assertEqual(response.data['resources'][0]['siteId'], site.site_name)
+
+    @mock.patch('calendars.api.CalendarResourcesAPIView.page_size', 2)
+    def test_get_paginated(self):
+        response = self.client.get(reverse('api-calendar-resources'))
+
+        self.assertEqual(len(response.data['resources']), 4)
+        self.assertEqual(response.data['next'], 2)
+
+        response = self.client.get(reverse('api-calendar-resources') + '?page=2')
+
+        self.assertEqual(len(response.data['resources']), 2)
+        self.assertIsNone(response.data['next'])
+
+    def test_get_is_not_manager(self):
+        self.user.is_manager = False
+        self.user.site = self.sites[1]
+        self.user.save()
+
+        response = self.client.get(reverse('api-calendar-resources'))
+
+        self.assertEqual(len(response.data['resources']), 2)
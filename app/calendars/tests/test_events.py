@@ -0,0 +1,109 @@
+import asyncio
+from unittest import mock
+
+from django.test import TestCase
+
+from model_bakery import baker
+
+from bookings.signals import booking_changed
+from ..events import EventHub, Subscription, decode_message, encode_message
+
+
+class MessageTest(TestCase):
+    def test_encode_decode_message(self):
+        message = encode_message(1, 2, '2021-06-01T00:00:00+00:00')
+
+        self.assertEqual(
+            decode_message(message.encode()),
+            {'id': 1, 'site': 2, 'cursor': '2021-06-01T00:00:00+00:00'},
+        )
+
+
+def make_subscription(site_ids, loop, maxsize=0):
+    # The queue is created inside the running loop, which it binds to.
+    async def make_queue():
+        return asyncio.Queue(maxsize=maxsize)
+
+    return Subscription(site_ids, loop, loop.run_until_complete(make_queue()))
+
+
+class SubscriptionTest(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_push(self):
+        subscription = make_subscription([1], self.loop, maxsize=2)
+
+        subscription.push({'id': 1})
+
+        self.assertEqual(subscription.queue.qsize(), 1)
+        self.assertFalse(subscription.overflowed)
+
+    def test_push_overflow(self):
+        subscription = make_subscription([1], self.loop, maxsize=2)
+
+        for x in range(3):
+            subscription.push({'id': x})
+
+        # The backlog is replaced with a single resync marker.
+        self.assertTrue(subscription.overflowed)
+        self.assertEqual(subscription.queue.qsize(), 1)
+        self.assertIsNone(subscription.queue.get_nowait())
+
+
+class IdleBackend:
+    def listen(self, stop_event, timeout=1.0):
+        stop_event.wait()
+        return iter([])
+
+
+class EventHubTest(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.hub = EventHub(backend_factory=IdleBackend)
+
+    def tearDown(self):
+        self.hub.stop()
+        self.loop.close()
+
+    def test_dispatch_to_site_subscriptions(self):
+        subscription_1 = make_subscription([1], self.loop)
+        subscription_2 = make_subscription([2], self.loop)
+        self.hub.subscribe(subscription_1)
+        self.hub.subscribe(subscription_2)
+
+        self.hub.dispatch({'id': 1, 'site': 1, 'cursor': ''})
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.assertEqual(subscription_1.queue.qsize(), 1)
+        self.assertEqual(subscription_2.queue.qsize(), 0)
+
+    def test_unsubscribe(self):
+        subscription = make_subscription([1], self.loop)
+        self.hub.subscribe(subscription)
+        self.hub.unsubscribe(subscription)
+
+        self.hub.dispatch({'id': 1, 'site': 1, 'cursor': ''})
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.assertEqual(subscription.queue.qsize(), 0)
+        self.assertEqual(self.hub.subscriptions, {})
+
+
+class PushBookingChangeTest(TestCase):
+    @mock.patch('calendars.signals.publish_booking_change')
+    def test_push_booking_change(self, publish_booking_change):
+        booking_changed.send(sender=None, booking_id=1, site_id=2)
+
+        publish_booking_change.assert_called_once()
+        self.assertEqual(publish_booking_change.call_args[0][:2], (1, 2))
+
+    @mock.patch('calendars.signals.publish_booking_change')
+    def test_booking_saved_pushes_change_on_commit(self, publish_booking_change):
+        with self.captureOnCommitCallbacks(execute=True):
+            booking = baker.make('bookings.Booking')
+
+        publish_booking_change.assert_called_with(booking.id, booking.site_id, mock.ANY)
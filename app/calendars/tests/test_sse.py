@@ -0,0 +1,97 @@
+import json
+
+from django.conf import settings
+from django.test import SimpleTestCase, TransactionTestCase
+
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from model_bakery import baker
+
+from ..events import encode_message, get_backend
+from ..sse import EVENTS_PATH, CalendarEventStream, format_event
+
+
+def get_scope(cookie=None, query_string=b'', headers=None):
+    headers = list(headers or [])
+    if cookie is not None:
+        headers.append((b'cookie', cookie.encode()))
+
+    return {
+        'type': 'http',
+        'method': 'GET',
+        'path': EVENTS_PATH,
+        'query_string': query_string,
+        'headers': headers,
+    }
+
+
+class FormatEventTest(SimpleTestCase):
+    def test_format_event(self):
+        self.assertEqual(
+            format_event(data={'id': 1}, event='resync', event_id='a'),
+            b'event: resync\nid: a\ndata: {"id": 1}\n\n',
+        )
+
+    def test_format_comment(self):
+        self.assertEqual(format_event(comment='heartbeat'), b': heartbeat\n\n')
+
+
+class CalendarEventStreamTest(TransactionTestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+        self.cookie = f'{settings.SESSION_COOKIE_NAME}={self.client.session.session_key}'
+
+    @async_to_sync
+    async def run_stream(self, scope, publish=None, messages=2, heartbeat=5):
+        communicator = ApplicationCommunicator(CalendarEventStream(heartbeat=heartbeat), scope)
+        await communicator.send_input({'type': 'http.request'})
+
+        start = await communicator.receive_output(timeout=5)
+        bodies = []
+
+        if start['status'] == 200:
+            # Discard the reconnection delay.
+            await communicator.receive_output(timeout=5)
+
+            if publish is not None:
+                get_backend().publish(self.site.id, publish)
+
+            for _ in range(messages):
+                bodies.append((await communicator.receive_output(timeout=5))['body'])
+
+        await communicator.send_input({'type': 'http.disconnect'})
+        await communicator.wait(timeout=5)
+        return start, bodies
+
+    def test_unauthenticated_request(self):
+        start, _ = self.run_stream(get_scope())
+
+        self.assertEqual(start['status'], 403)
+
+    def test_stream_booking_change(self):
+        message = encode_message(1, self.site.id, '2021-06-01T00:00:00+00:00')
+
+        start, bodies = self.run_stream(get_scope(self.cookie), publish=message, messages=1)
+
+        self.assertEqual(start['status'], 200)
+        self.assertIn((b'content-type', b'text/event-stream'), start['headers'])
+        self.assertEqual(
+            bodies[0],
+            format_event(data=json.loads(message), event_id='2021-06-01T00:00:00+00:00'),
+        )
+
+    def test_stream_heartbeat(self):
+        start, bodies = self.run_stream(get_scope(self.cookie), messages=1, heartbeat=1)
+
+        self.assertEqual(bodies[0], format_event(comment='heartbeat'))
+
+    def test_replay_missed_changes(self):
+        booking = baker.make('bookings.Booking', site=self.site)
+        headers = [(b'last-event-id', b'2021-06-01T00:00:00+00:00')]
+
+        start, bodies = self.run_stream(get_scope(self.cookie, headers=headers), messages=1)
+
+        data = json.loads(bodies[0].decode().split('data: ')[1])
+        self.assertEqual(data['id'], booking.id)
@@ -1,8 +1,12 @@
+import datetime
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
 
 from model_bakery import baker
 
-from ..utils import get_business_hours, get_resources
+from ..utils import get_business_hours, get_resources, get_resources_cache_key
 
 
 class GetBusinessHoursTest(TestCase):
@@ -52,9 +56,43 @@ class GetBusinessHoursTest(TestCase):
 
         self.assertEqual(expected_business_hours, business_hours)
 
+    def test_get_business_hours_overrides(self):
+        # Test the weekly hours recur around the overrides, which have hours of their own
+        # unless closed.
+        today = timezone.localdate()
+        closed = today + datetime.timedelta(days=7)
+        extended = today + datetime.timedelta(days=14)
+        baker.make('sites.ScheduleOverride', site=self.site, date=closed, is_closed=True)
+        baker.make(
+            'sites.ScheduleOverride',
+            site=self.site,
+            date=extended,
+            is_closed=False,
+            opening_hour=datetime.time(9),
+            closing_hour=datetime.time(23, 30),
+        )
+
+        business_hours = get_business_hours(self.site)
+        weekday = [x for x in business_hours if x['daysOfWeek'] == [(today.weekday() + 1) % 7]]
+
+        self.assertEqual(len(business_hours), 7 + 2 + 1)
+        self.assertEqual(
+            [(x.get('startRecur'), x.get('endRecur')) for x in weekday],
+            [
+                (None, closed.isoformat()),
+                ((closed + datetime.timedelta(days=1)).isoformat(), extended.isoformat()),
+                ((extended + datetime.timedelta(days=1)).isoformat(), None),
+                (extended.isoformat(), (extended + datetime.timedelta(days=1)).isoformat()),
+            ],
+        )
+        self.assertEqual(weekday[-1]['startTime'], '09:00')
+        self.assertEqual(weekday[-1]['endTime'], '23:30')
+
 
 class GetResourcesTest(TestCase):
     def setUp(self):
+        cache.clear()
+
         self.site_1 = baker.make('sites.Site', site_name='a')
         self.site_2 = baker.make('sites.Site', site_name='b')
         self.site_1_table_1 = baker.make('sites.Table', site=self.site_1, table_name='a')
@@ -63,7 +101,7 @@ class GetResourcesTest(TestCase):
         self.site_2_table_2 = baker.make('sites.Table', site=self.site_2, table_name='b')
 
     def test_get_resources(self):
-        resources = get_resources([self.site_1, self.site_2])
+        resources = get_resources([self.site_1.id, self.site_2.id])
 
         expected_result = [
             {
@@ -92,4 +130,50 @@ class GetResourcesTest(TestCase):
             },
         ]
 
-        self.assertJSONEqual(resources, expected_result)
+        self.assertEqual(resources, expected_result)
+
+    def test_get_resources_cached(self):
+        get_resources([self.site_1.id, self.site_2.id])
+
+        self.assertIsNotNone(cache.get(get_resources_cache_key(self.site_1.id)))
+        self.assertIsNotNone(cache.get(get_resources_cache_key(self.site_2.id)))
+
+        with self.assertNumQueries(0):
+            resources = get_resources([self.site_1.id, self.site_2.id])
+
+        self.assertEqual(len(resources), 4)
+
+    def test_get_resources_invalidated_on_table_change(self):
+        get_resources([self.site_1.id])
+
+        table = baker.make('sites.Table', site=self.site_1, table_name='c')
+
+        self.assertIsNone(cache.get(get_resources_cache_key(self.site_1.id)))
+        self.assertEqual(len(get_resources([self.site_1.id])), 3)
+
+        get_resources([self.site_1.id])
+        table.delete()
+
+        self.assertEqual(len(get_resources([self.site_1.id])), 2)
+
+    def test_get_resources_invalidated_on_site_change(self):
+        get_resources([self.site_1.id])
+
+        self.site_1.mon_opening_hour = datetime.time(9, 0)
+        self.site_1.save()
+
+        resources = get_resources([self.site_1.id])
+
+        self.assertEqual(resources[0]['businessHours'][0]['startTime'], '09:00')
+
+    def test_get_resources_invalidated_on_override_change(self):
+        get_resources([self.site_1.id])
+
+        override = baker.make('sites.ScheduleOverride', site=self.site_1)
+
+        self.assertIsNone(cache.get(get_resources_cache_key(self.site_1.id)))
+
+        get_resources([self.site_1.id])
+        override.delete()
+
+        self.assertIsNone(cache.get(get_resources_cache_key(self.site_1.id)))
@@ -38,6 +38,6 @@ class CalendarViewTest(TestCase):
         response = self.client.get(reverse('calendar'))
 
         self.assertEqual(response.status_code, 200)
-        self.assertTrue('resources' in response.context)
+        self.assertFalse('resources' in response.context)
         self.assertTrue('sites' in response.context)
         self.assertEqual(len(response.context['sites']), 5)
@@ -13,4 +13,9 @@ urlpatterns = [
         api.CalendarAPIView.as_view(),
         name='api-calendar-bookings',
     ),
+    path(
+        'api/calendar/resources/',
+        api.CalendarResourcesAPIView.as_view(),
+        name='api-calendar-resources',
+    ),
 ]
@@ -1,37 +1,119 @@
-import json
+from datetime import timedelta
+from itertools import chain
 
-from sites.models import Site
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from sites.models import ScheduleOverride, Site
+from sites.schedule import compile_schedule
+
+# Resources are invalidated when a Site, its Tables or its ScheduleOverrides change, the
+# timeout only bounds how long the resources of a deleted Site linger in the cache.
+RESOURCES_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_upcoming_overrides():
+    """Return the ScheduleOverrides shown on the calendar, from yesterday on."""
+    return ScheduleOverride.objects.filter(date__gte=timezone.localdate() - timedelta(days=1))
+
+
+def get_day_business_hours(day, weekday, **recurrence):
+    return {
+        'startTime': day.opening_hour.strftime("%H:%M"),
+        'endTime': day.closing_hour.strftime("%H:%M"),
+        'daysOfWeek': [(weekday + 1) % 7],  # Sunday=0
+        **recurrence,
+    }
 
 
 def get_business_hours(site):
-    business_hours = [
+    """
+    Return the business hours of a Site for the calendar. The hours of each weekday
+    recur around the dates of the Site's upcoming ScheduleOverrides, which have hours of
+    their own for the date unless closed. The overrides are read from the Site's
+    `upcoming_overrides` if prefetched.
+    """
+    overrides = getattr(site, 'upcoming_overrides', None)
+    if overrides is None:
+        overrides = get_upcoming_overrides().filter(site=site)
+
+    schedule = compile_schedule(site, overrides)
+    business_hours = []
+
+    for weekday, day in enumerate(schedule.weekly):
+        if day.is_closed:
+            continue
+
+        # The recurrence is split around each override, its end date being exclusive.
+        start = None
+        for date in sorted(x for x in schedule.overrides if x.weekday() == weekday):
+            recurrence = {'endRecur': date.isoformat()}
+            if start is not None:
+                recurrence['startRecur'] = start.isoformat()
+            business_hours.append(get_day_business_hours(day, weekday, **recurrence))
+            start = date + timedelta(days=1)
+
+        recurrence = {'startRecur': start.isoformat()} if start is not None else {}
+        business_hours.append(get_day_business_hours(day, weekday, **recurrence))
+
+    for date, day in sorted(schedule.overrides.items()):
+        if not day.is_closed:
+            business_hours.append(
+                get_day_business_hours(
+                    day,
+                    date.weekday(),
+                    startRecur=date.isoformat(),
+                    endRecur=(date + timedelta(days=1)).isoformat(),
+                )
+            )
+
+    return business_hours
+
+
+def get_resources_cache_key(site_id):
+    return f'calendar-resources-{site_id}'
+
+
+def get_site_resources(site):
+    """Create list containing the table info of a Site for calendar resources."""
+    business_hours = get_business_hours(site)
+
+    return [
         {
-            'startTime': getattr(site, f'{day}_opening_hour').strftime("%H:%M"),
-            'endTime': getattr(site, f'{day}_closing_hour').strftime("%H:%M"),
-            'daysOfWeek': [(index + 1) % 7],  # Sunday=0
+            'id': table.id,
+            'title': table.__str__(),
+            'siteId': site.site_name,
+            'businessHours': business_hours,
         }
-        for index, day in enumerate(Site.DAY_PREFIXES)
+        for table in sorted(site.tables.all(), key=lambda table: table.table_name)
     ]
-    return business_hours
 
 
-def get_resources(sites):
-    """Create dict containing table info for calendar resources."""
-    resources = []
+def get_resources(site_ids):
+    """
+    Return the calendar resources for the given Site ids. Resources are cached per
+    Site, only the Sites missing from the cache are queried.
+    """
+    cache_keys = {site_id: get_resources_cache_key(site_id) for site_id in site_ids}
+    resources = cache.get_many(cache_keys.values())
 
-    for site in sites:
-        # Create site business hours.
-        business_hours = get_business_hours(site)
+    if missing_site_ids := [x for x in site_ids if cache_keys[x] not in resources]:
+        sites = Site.objects.filter(id__in=missing_site_ids).prefetch_related(
+            'tables',
+            Prefetch(
+                'schedule_overrides',
+                queryset=get_upcoming_overrides(),
+                to_attr='upcoming_overrides',
+            ),
+        )
+        missing_resources = {cache_keys[site.id]: get_site_resources(site) for site in sites}
+        cache.set_many(missing_resources, RESOURCES_CACHE_TIMEOUT)
+        resources.update(missing_resources)
+
+    return list(chain.from_iterable(resources.get(cache_keys[x], []) for x in site_ids))
 
-        tables = site.tables.order_by('table_name')
-        for table in tables:
-            resources.append(
-                {
-                    'id': table.id,
-                    'title': table.__str__(),
-                    'siteId': site.site_name,
-                    'businessHours': business_hours,
-                }
-            )
 
-    return json.dumps(resources)
+def invalidate_resources(site_id):
+    """Remove the cached calendar resources of a Site."""
+    cache.delete(get_resources_cache_key(site_id))
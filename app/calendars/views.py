@@ -2,7 +2,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic.base import TemplateView
 
 from sites.models import Site
-from .utils import get_resources
+from .sse import EVENTS_PATH
 
 
 class CalendarView(LoginRequiredMixin, TemplateView):
@@ -15,12 +15,9 @@ class CalendarView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        sites = (
-            Site.objects.get_sites(self.request.user)
-            .order_by('site_name')
-            .prefetch_related('tables')
-        )
+        # Resources are fetched separately from the calendar resources API.
+        sites = Site.objects.get_sites(self.request.user).order_by('site_name')
 
-        context['resources'] = get_resources(sites)
-        context['sites'] = sites
+        context['sites'] = sites.only('id', 'site_name')
+        context['events_url'] = EVENTS_PATH
         return context
@@ -9,8 +9,47 @@ https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
+from django.core.wsgi import get_wsgi_application
+from django.urls import Resolver404, resolve
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.prod')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+if settings.DEBUG:
+    from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
+
+    django_application = ASGIStaticFilesHandler(django_application)
+
+# Imported once Django has been set up.
+from calendars.sse import EVENTS_PATH, CalendarEventStream  # noqa: E402
+from core.asgi import ThreadedWsgiToAsgi  # noqa: E402
+
+calendar_event_stream = CalendarEventStream()
+
+# Views served in a thread of their own rather than the one shared by the sync views:
+# streamed exports, which query the database as they are read, and availability, which
+# waits for an identical computation in progress.
+THREADED_VIEWS = {'booking-export', 'booking-create-get-availability'}
+threaded_application = ThreadedWsgiToAsgi(get_wsgi_application())
+
+
+def is_threaded(path):
+    try:
+        return resolve(path).url_name in THREADED_VIEWS
+    except Resolver404:
+        return False
+
+
+async def application(scope, receive, send):
+    """
+    Route the calendar event stream to its streaming application, the threaded views to
+    Django in a thread and everything else to Django.
+    """
+    if scope['type'] == 'http' and scope['path'] == EVENTS_PATH:
+        return await calendar_event_stream(scope, receive, send)
+    if scope['type'] == 'http' and is_threaded(scope['path']):
+        return await threaded_application(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -8,10 +8,3 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.prod')
 app = Celery('core')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
-
-app.conf.beat_schedule = {
-    'send-queued-mail': {
-        'task': 'post_office.tasks.send_queued_mail',
-        'schedule': 600.0,
-    },
-}
@@ -31,8 +31,10 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.humanize',
+    'django.contrib.postgres',
     # Third-party
     'rest_framework',
+    'rest_framework.authtoken',
     'post_office',
     'phonenumber_field',
     'widget_tweaks',
@@ -44,11 +46,14 @@ INSTALLED_APPS = [
     'calendars',
     'core',
     'frontend',
+    'reports',
     'sites',
+    'waitlist',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ReplicaMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -127,6 +132,16 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'mediafiles')
 DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
 
 
+# Cache
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://redis:6379/1',
+    }
+}
+
+
 # Auth Settings
 
 AUTH_USER_MODEL = 'accounts.User'
@@ -140,6 +155,8 @@ LOGOUT_REDIRECT_URL = '/accounts/login/'
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
+        # Integrations authenticate with a Token created in the admin.
+        'rest_framework.authentication.TokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -155,10 +172,38 @@ CELERY_BROKER_URL = 'redis://redis:6379'
 CELERY_RESULT_BACKEND = 'redis://redis:6379'
 CELERY_TIMEZONE = 'Europe/London'
 CELERY_BEAT_SCHEDULE = {
+    'send-queued-mail': {
+        'task': 'post_office.tasks.send_queued_mail',
+        'schedule': 600.0,
+    },
     'send_reminder_emails': {
         'task': 'bookings.tasks.send_reminder_emails',
         'schedule': crontab(minute=0, hour='*/1'),
-    }
+    },
+    'precompute_availability': {
+        'task': 'bookings.tasks.precompute_availability',
+        'schedule': crontab(minute=0, hour=3),
+    },
+    'relay-outbox': {
+        'task': 'bookings.tasks.relay_outbox',
+        'schedule': 30.0,
+    },
+    'compact-outbox': {
+        'task': 'bookings.tasks.compact_outbox',
+        'schedule': crontab(minute=30),
+    },
+    'create-booking-partitions': {
+        'task': 'bookings.tasks.create_booking_partitions',
+        'schedule': crontab(minute=0, hour=2),
+    },
+    'archive-bookings': {
+        'task': 'bookings.tasks.archive_old_bookings',
+        'schedule': crontab(minute=30, hour=4),
+    },
+    'purge-old-emails': {
+        'task': 'core.tasks.purge_old_emails',
+        'schedule': crontab(minute=0, hour=5),
+    },
 }
 
 
@@ -171,6 +216,17 @@ POST_OFFICE = {
     'RETRY_INTERVAL': datetime.timedelta(minutes=5),
     'CELERY_ENABLED': True,
 }
+EMAIL_RETENTION = {  # Days Emails are kept for by status, None to keep them
+    'sent': 90,
+    'failed': 180,
+    'queued': None,
+    'requeued': None,
+}
+EMAIL_STRIP_BODIES_AFTER = 14  # Days after which sent Emails lose their bodies, None to keep
+EMAIL_LOG_RETENTION = 90  # Days delivery Logs are kept for, None to keep them
+EMAIL_PURGE_CHUNK_SIZE = 1000  # Rows purged per transaction
+EMAIL_PURGE_MAX_CHUNKS = 500  # Chunks purged per run
+EMAIL_PURGE_PAUSE = 0.1  # Seconds between chunks
 
 
 # Phone Number Settings
@@ -179,6 +235,75 @@ PHONENUMBER_DB_FORMAT = 'NATIONAL'
 PHONENUMBER_DEFAULT_REGION = 'GB'
 
 
+# Availability Settings
+
+AVAILABILITY_CACHE_TIMEOUT = 60 * 60 * 48  # Seconds
+AVAILABILITY_PRECOMPUTE_DAYS = 14
+AVAILABILITY_PRECOMPUTE_CHUNK_SIZE = 60  # Availability computations per task
+AVAILABILITY_BATCH_MAX_QUERIES = 500
+AVAILABILITY_BATCH_WORKERS = 4
+AVAILABILITY_BATCH_TIMEOUT = 5  # Seconds
+AVAILABILITY_COALESCE_TIMEOUT = 5  # Seconds identical computations are shared for
+AVAILABILITY_COALESCE_WAIT = 1  # Seconds a request waits for an identical computation
+AVAILABILITY_IP_RATE_LIMIT = (1, 30)  # Requests per second, burst per client IP
+AVAILABILITY_SITE_RATE_LIMIT = (20, 200)  # Requests per second, burst per Site
+
+
+# Archive Settings
+
+BOOKING_ARCHIVE_AFTER = 365 * 2  # Days after which Bookings are archived
+BOOKING_ARCHIVE_CHUNK_SIZE = 500  # Bookings archived per transaction
+BOOKING_ARCHIVE_MAX_CHUNKS = 200  # Chunks archived per run
+BOOKING_ARCHIVE_PAUSE = 0.5  # Seconds between chunks
+
+
+# Partitioning Settings
+
+BOOKING_PARTITION_MONTHS_AHEAD = 6  # Months partitions are created ahead of, if partitioned
+
+
+# Outbox Settings
+
+OUTBOX_BATCH_SIZE = 100  # Events relayed at a time
+OUTBOX_MAX_ATTEMPTS = 5  # Deliveries of an event before it is given up on
+OUTBOX_RELAY_TIMEOUT = 60  # Seconds a relay holds its lock for
+OUTBOX_RETENTION = 60 * 60 * 24  # Seconds delivered events are kept for
+
+
+# Replica Settings
+
+DATABASE_ROUTERS = ['core.replicas.ReplicaRouter']
+REPLICA_DATABASES = []  # Aliases of the DATABASES reads of selected views and tasks are sent to
+REPLICA_STICKY_SECONDS = 5  # Seconds reads stay on the primary after a write, above replica lag
+REPLICA_PRIMARY_FOR_VALIDATION = True  # Check a Booking's time slot is free on the primary
+
+
+# Rate Limit Settings
+
+RATE_LIMIT_ENABLED = True
+RATE_LIMIT_IP_HEADER = None  # META key of the client IP set by a proxy, if any
+
+
+# Site Logo Settings
+
+SITE_LOGO_WIDTHS = (160, 320, 640)  # Pixels, the logo is resized to each it is wider than
+SITE_LOGO_QUALITY = 80
+
+
+# Frontend Settings
+
+FRONTEND_PAGE_CACHE_TIMEOUT = 60 * 60 * 24  # Seconds, until purged sooner
+FRONTEND_PAGE_MAX_AGE = 60  # Seconds proxies may serve a page for
+
+
+# Calendar Event Settings
+
+CALENDAR_EVENTS_BACKEND = 'redis'
+CALENDAR_EVENTS_REDIS_URL = 'redis://redis:6379'
+CALENDAR_EVENTS_HEARTBEAT = 15  # Seconds
+CALENDAR_EVENTS_QUEUE_SIZE = 100
+
+
 # App Settings
 
 ADMIN_NOTIFICATION_EMAIL = os.environ.get('ADMIN_NOTIFICATION_EMAIL')
@@ -53,3 +53,8 @@ POST_OFFICE['BACKENDS'] = {
 }
 
 DEFAULT_FROM_EMAIL = 'noreply@email.com'
+
+
+# Calendar Event Settings
+
+CALENDAR_EVENTS_BACKEND = 'postgres'
@@ -26,10 +26,17 @@ DATABASES = {
     }
 }
 
+# Read replicas, each a copy of the default database on another host.
+for x, host in enumerate(os.environ.get('DB_REPLICA_HOSTS', '').replace(',', ' ').split()):
+    DATABASES[f'replica{x + 1}'] = {**DATABASES['default'], 'HOST': host}
+
+REPLICA_DATABASES = [alias for alias in DATABASES if alias != 'default']
+
 
 # Prod Settings
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+RATE_LIMIT_IP_HEADER = 'HTTP_X_REAL_IP'
 
 
 # Email Settings
@@ -26,6 +26,9 @@ DATABASES = {
     }
 }
 
+# A replica for tests overriding REPLICA_DATABASES, mirroring the database under test.
+DATABASES['replica'] = {**DATABASES['default'], 'TEST': {'MIRROR': 'default'}}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -35,11 +38,45 @@ PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.MD5PasswordHasher',
 ]
 
+# Cache
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Celery Settings
+
+CELERY_TASK_ALWAYS_EAGER = True
+
+# Availability Settings
+
+# Worker threads cannot see the data of a test's transaction.
+AVAILABILITY_BATCH_WORKERS = 1
+
+# Archive Settings
+
+BOOKING_ARCHIVE_PAUSE = 0
+
+# Rate Limit Settings
+
+RATE_LIMIT_ENABLED = False
+
 # Email Settings
 
 POST_OFFICE['BACKENDS'] = {
     'default': 'django.core.mail.backends.locmem.EmailBackend',
 }
 POST_OFFICE['DEFAULT_PRIORITY'] = 'now'
+# Tasks run eagerly, and post_office's task closes the database connection.
+POST_OFFICE['CELERY_ENABLED'] = False
 
 DEFAULT_FROM_EMAIL = 'noreply@email.com'
+
+EMAIL_PURGE_PAUSE = 0
+
+
+# Calendar Event Settings
+
+CALENDAR_EVENTS_BACKEND = 'local'
@@ -8,6 +8,8 @@ urlpatterns = [
     path('', include('accounts.urls')),
     path('', include('bookings.urls')),
     path('', include('calendars.urls')),
+    path('', include('reports.urls')),
+    path('', include('sites.api_urls')),
     path('sites/', include('sites.urls')),
     path('f/', include('frontend.urls')),
 ]
@@ -0,0 +1,89 @@
+from django.db.models import Prefetch
+
+from rest_framework.exceptions import ValidationError
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Serializer mixin to only return the fields named in the `fields` of its context.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields := self.context.get('fields'):
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsMixin:
+    """
+    Mixin for API views to return only the fields requested with the `fields` query
+    parameter, e.g. `?fields=id,reference`, and select only the columns they need.
+
+    The `field_plans` map each field of the serializer to the model fields it reads.
+    Fields of related models, e.g. `client__client_name`, are joined with
+    select_related() and Prefetch objects are prefetched, so the queries of a page do
+    not depend on its size.
+    """
+
+    fields_query_param = 'fields'
+    field_plans = {}
+
+    def get_requested_fields(self):
+        """Return the fields requested, or all the fields of the plans if none are."""
+        value = self.request.query_params.get(self.fields_query_param)
+        if not value:
+            return list(self.field_plans)
+
+        fields = [field.strip() for field in value.split(',') if field.strip()]
+        if unknown := [field for field in fields if field not in self.field_plans]:
+            message = f'Unknown fields: {", ".join(unknown)}'
+            raise ValidationError({self.fields_query_param: message})
+
+        return fields
+
+    def get_query_plan(self, fields):
+        """
+        Return the columns, relations to join and lookups to prefetch to serialize the
+        given fields. The ordering of the view is always loaded for its cursors.
+        """
+        only = {'id', *getattr(self, 'keyset_ordering', ())}
+        select_related = set()
+        prefetch = []
+
+        for field in fields:
+            for source in self.field_plans[field]:
+                if isinstance(source, Prefetch):
+                    prefetch.append(source)
+                    continue
+
+                only.add(source)
+                # Deferring a relation while joining it is not allowed.
+                relation = source.rpartition('__')[0]
+                if relation:
+                    select_related.add(relation)
+                    only.add(relation)
+
+        return sorted(only), sorted(select_related), prefetch
+
+    def plan_queryset(self, queryset):
+        """Return the queryset loading only what the requested fields need."""
+        only, select_related, prefetch = self.get_query_plan(self.requested_fields)
+
+        queryset = queryset.select_related(None)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+
+        return queryset.only(*only)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.requested_fields = self.get_requested_fields()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = getattr(self, 'requested_fields', None)
+        return context
@@ -0,0 +1,35 @@
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+
+class ThreadedWsgiToAsgiInstance(WsgiToAsgiInstance):
+    def run_wsgi_app(self, body):
+        # A thread of its own rather than the one shared by the sync views, which a long
+        # response would hold up for as long as it is streamed.
+        return sync_to_async(self.serve, thread_sensitive=False)(body)
+
+    def serve(self, body):
+        response = self.wsgi_application(self.build_environ(self.scope, body), self.start_response)
+        try:
+            self.sync_send(self.response_start)
+            for output in response:
+                if output:
+                    self.sync_send(
+                        {'type': 'http.response.body', 'body': output, 'more_body': True}
+                    )
+            self.sync_send({'type': 'http.response.body'})
+        finally:
+            # Sends request_finished, closing the database connection of the thread.
+            response.close()
+
+
+class ThreadedWsgiToAsgi(WsgiToAsgi):
+    """
+    ASGI application serving requests with a WSGI application in a worker thread, for
+    views streaming a response which queries the database as it is read. Django's ASGI
+    handler iterates a streaming response within the event loop, where queries raise
+    SynchronousOnlyOperation.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await ThreadedWsgiToAsgiInstance(self.wsgi_application)(scope, receive, send)
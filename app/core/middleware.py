@@ -0,0 +1,38 @@
+from django.conf import settings
+
+from .replicas import has_written, track_writes, use_primary
+
+PRIMARY_READS_COOKIE = 'primary_reads'
+
+
+class ReplicaMiddleware:
+    """
+    Middleware keeping the reads of a visitor on the primary for REPLICA_STICKY_SECONDS
+    after a request which wrote, so they see their change even while the replicas lag.
+    The window is kept in a cookie, as writing it to the session would itself be a write.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REPLICA_DATABASES:
+            return self.get_response(request)
+
+        with track_writes():
+            if PRIMARY_READS_COOKIE in request.COOKIES:
+                with use_primary():
+                    response = self.get_response(request)
+            else:
+                response = self.get_response(request)
+
+            if has_written():
+                response.set_cookie(
+                    PRIMARY_READS_COOKIE,
+                    '1',
+                    max_age=settings.REPLICA_STICKY_SECONDS,
+                    httponly=True,
+                    samesite='Lax',
+                )
+
+        return response
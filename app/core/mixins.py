@@ -1,4 +1,17 @@
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, transaction
+from django.http import HttpResponse
 from django.shortcuts import redirect
+from django.template.response import SimpleTemplateResponse, TemplateResponse
+
+from .ratelimit import get_retry_after, take_token
+from .replicas import get_replica, use_replica
+from .timeouts import is_statement_timeout, statement_timeout
+
+logger = logging.getLogger(__name__)
 
 
 class ManagerAccessMixin(object):
@@ -13,3 +26,102 @@ class ManagerAccessMixin(object):
         if not request.user.is_manager:
             return redirect(self.redirect_url)
         return super().post(request, *args, **kwargs)
+
+
+class RateLimitMixin:
+    """
+    Mixin to limit the rate of requests to a view with token buckets. A request takes a
+    token from each bucket of get_rate_limits() in turn, and is refused if one is empty.
+    """
+
+    rate_limited_message = 'Too many requests, please try again shortly.'
+
+    def get_rate_limits(self):
+        """Return the key, refill rate per second and capacity of each bucket."""
+        return []
+
+    def dispatch(self, request, *args, **kwargs):
+        if settings.RATE_LIMIT_ENABLED:
+            for key, rate, capacity in self.get_rate_limits():
+                allowed, retry_after = take_token(key, rate, capacity)
+                if not allowed:
+                    response = HttpResponse(self.rate_limited_message, status=429)
+                    response['Retry-After'] = get_retry_after(retry_after)
+                    return response
+
+        return super().dispatch(request, *args, **kwargs)
+
+
+class ReplicaReadMixin:
+    """
+    Mixin to send the reads of a view to a replica, including those run as its response
+    is rendered. Only for views which can show data a moment old, and best placed after
+    LoginRequiredMixin so the User is read from the primary.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        with use_replica():
+            response = super().dispatch(request, *args, **kwargs)
+            if isinstance(response, SimpleTemplateResponse):
+                response.render()
+            return response
+
+
+class StatementTimeoutMixin:
+    """
+    Mixin to bound the time of each database statement of a view to `statement_timeout`
+    milliseconds, including those run as its response is rendered. The bound applies to
+    the replica its reads are sent to as well, if any.
+
+    Read-only views can set `atomic_requests` to False to run outside the transaction
+    of ATOMIC_REQUESTS. Public views can set `statement_timeout_template_name` to answer
+    with a page asking the visitor to try again, rather than an error, when a statement
+    is cancelled, or override statement_timeout_exceeded() to fall back on a cached
+    result.
+    """
+
+    statement_timeout = None
+    atomic_requests = True
+    statement_timeout_template_name = None
+    statement_timeout_retry_after = 5
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        if not cls.atomic_requests:
+            view = transaction.non_atomic_requests(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.statement_timeout:
+            return super().dispatch(request, *args, **kwargs)
+
+        try:
+            with ExitStack() as stack:
+                for using in {DEFAULT_DB_ALIAS, get_replica() or DEFAULT_DB_ALIAS}:
+                    stack.enter_context(statement_timeout(self.statement_timeout, using))
+                response = super().dispatch(request, *args, **kwargs)
+                if isinstance(response, SimpleTemplateResponse):
+                    response.render()
+                return response
+        except OperationalError as exc:
+            if not is_statement_timeout(exc):
+                raise
+            logger.warning(
+                'Statement timeout of %s ms exceeded by %s', self.statement_timeout, request.path
+            )
+            return self.statement_timeout_exceeded(exc)
+
+    def statement_timeout_exceeded(self, exc):
+        """
+        Return the response to a request for which a statement was cancelled, the page of
+        `statement_timeout_template_name` if set, otherwise the error is raised.
+        """
+        if self.statement_timeout_template_name is None:
+            raise exc
+
+        response = TemplateResponse(
+            self.request, self.statement_timeout_template_name, status=503
+        )
+        response['Retry-After'] = str(self.statement_timeout_retry_after)
+        return response
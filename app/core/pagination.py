@@ -0,0 +1,237 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.http.response import Http404
+
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    Encoder keeping the full precision of datetimes, which DjangoJSONEncoder truncates
+    to milliseconds. A truncated value would skip or repeat results on the next page.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values, previous=False):
+    data = json.dumps({'p': previous, 'v': values}, cls=CursorEncoder)
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return the ordering values and direction encoded in the cursor."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return data['v'], data['p']
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise Http404('Invalid cursor')
+
+
+def estimate_count(queryset):
+    """
+    Return the planner's estimate of the number of rows the queryset returns. Falls back
+    to an exact count on databases that cannot provide one cheaply.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    # QuerySet.explain() returns the plan formatted as text, so EXPLAIN is run directly
+    # and psycopg2 decodes the JSON plan.
+    sql, params = queryset.order_by().query.get_compiler(queryset.db).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        return cursor.fetchone()[0][0]['Plan']['Plan Rows']
+
+
+def filter_keyset(queryset, ordering, values, previous=False):
+    """
+    Filter the queryset to the results after (or before) the given ordering values.
+    e.g. for an ordering of (a, id): a > x OR (a = x AND id > y).
+    """
+    model = queryset.model
+    lookup = 'lt' if previous else 'gt'
+
+    # The values come from the client, so a cursor that has been tampered with is treated
+    # as invalid rather than failing in the query.
+    if not isinstance(values, list) or len(values) != len(ordering) or None in values:
+        raise Http404('Invalid cursor')
+
+    try:
+        values = [
+            model._meta.get_field(field).to_python(value)
+            for field, value in zip(ordering, values)
+        ]
+    except (ValidationError, TypeError, ValueError):
+        raise Http404('Invalid cursor')
+
+    keyset_filter = Q()
+    for index, field in enumerate(ordering):
+        condition = Q(**{f'{field}__{lookup}': values[index]})
+        for previous_field, value in zip(ordering[:index], values):
+            condition &= Q(**{previous_field: value})
+        keyset_filter |= condition
+
+    queryset = queryset.filter(keyset_filter)
+
+    if previous:
+        queryset = queryset.order_by(*[f'-{field}' for field in ordering])
+
+    return queryset
+
+
+def get_cursor(obj, ordering, previous=False):
+    return encode_cursor([getattr(obj, field) for field in ordering], previous)
+
+
+def get_keyset_page(queryset, ordering, cursor, page_size):
+    """
+    Return the results of the page at the given cursor, or the first page, along with
+    the cursors of the next and previous pages if there are any.
+    """
+    previous = False
+    page_queryset = queryset.order_by(*ordering)
+
+    if cursor:
+        values, previous = decode_cursor(cursor)
+        page_queryset = filter_keyset(page_queryset, ordering, values, previous)
+
+    # Fetch one extra result to know whether there is another page.
+    object_list = list(page_queryset[: page_size + 1])
+    has_more = len(object_list) > page_size
+    object_list = object_list[:page_size]
+
+    if previous:
+        object_list.reverse()
+
+    has_next = has_more if not previous else True
+    has_previous = bool(cursor) if not previous else has_more
+
+    return (
+        object_list,
+        get_cursor(object_list[-1], ordering) if object_list and has_next else None,
+        get_cursor(object_list[0], ordering, True) if object_list and has_previous else None,
+    )
+
+
+class KeysetPage:
+    """
+    A page of results from keyset pagination. Mirrors the parts of Django's Page used
+    by the templates, with cursors in place of page numbers.
+    """
+
+    is_keyset = True
+
+    def __init__(self, object_list, next_cursor, previous_cursor, queryset, count=False):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.queryset = queryset
+        self.count = count
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def estimated_count(self):
+        """Return the estimated total number of results, if enabled."""
+        if self.count:
+            return estimate_count(self.queryset)
+        return None
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin for a ListView to paginate by keyset rather than offset. Pages are found by
+    filtering on the ordering of the last (or first) result of the previous page, so
+    deep pages cost the same as the first and no COUNT(*) is needed.
+    """
+
+    keyset_ordering = ('id',)
+    cursor_kwarg = 'cursor'
+    estimate_count = False
+
+    def paginate_queryset(self, queryset, page_size):
+        object_list, next_cursor, previous_cursor = get_keyset_page(
+            queryset,
+            self.keyset_ordering,
+            self.request.GET.get(self.cursor_kwarg),
+            page_size,
+        )
+
+        page = KeysetPage(
+            object_list,
+            next_cursor,
+            previous_cursor,
+            queryset,
+            count=self.estimate_count,
+        )
+        return (None, page, object_list, page.has_other_pages())
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset pagination for API views, ordered by the `keyset_ordering` of the view. Each
+    page is a single query however deep it is, with no COUNT(*).
+    """
+
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        object_list, self.next_cursor, self.previous_cursor = get_keyset_page(
+            queryset,
+            view.keyset_ordering,
+            request.query_params.get(self.cursor_query_param),
+            self.get_page_size(request),
+        )
+        return object_list
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                'next': self.get_link(self.next_cursor),
+                'previous': self.get_link(self.previous_cursor),
+                'results': data,
+            }
+        )
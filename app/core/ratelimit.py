@@ -0,0 +1,114 @@
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+
+import redis
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'ratelimit.'
+
+# Refill the bucket for the time since it was last taken from, then take a token if it
+# has one. Returns whether a token was taken and the seconds until the next is added,
+# as a string since Lua numbers are truncated to integers when returned.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - updated, 0) * rate)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring((1 - tokens) / rate)}
+"""
+
+
+class LocalTokenBuckets:
+    """
+    In-process token buckets, used when Redis is not the cache or is unavailable. Each
+    process then limits on its own, so the limits are only approximate.
+    """
+
+    max_buckets = 10000
+
+    def __init__(self):
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def take(self, key, rate, capacity, now):
+        with self.lock:
+            tokens, updated, _ = self.buckets.get(key, (capacity, now, None))
+            tokens = min(capacity, tokens + max(now - updated, 0) * rate)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+
+            # Buckets refilled by now are dropped, as a new bucket starts full.
+            if len(self.buckets) >= self.max_buckets:
+                self.buckets = {k: v for k, v in self.buckets.items() if v[2] > now}
+
+            self.buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+            return allowed, (1 - tokens) / rate
+
+
+local_buckets = LocalTokenBuckets()
+
+
+def get_redis_client():
+    """Return the Redis client of the cache, or None if the cache is not Redis."""
+    try:
+        return get_redis_connection('default')
+    except NotImplementedError:
+        return None
+
+
+def take_token(key, rate, capacity):
+    """
+    Take a token from the bucket of the given key, refilled with `rate` tokens a second
+    up to `capacity`. Returns whether a token was taken and, if not, the seconds until
+    one can be.
+    """
+    key = f'{KEY_PREFIX}{key}'
+    now = time.time()
+
+    client = get_redis_client()
+    if client is not None:
+        try:
+            script = client.register_script(TOKEN_BUCKET_SCRIPT)
+            allowed, retry_after = script(keys=[key], args=[rate, capacity, now])
+            return bool(allowed), max(float(retry_after), 0)
+        except redis.RedisError:
+            logger.warning('Redis is unavailable, rate limiting locally', exc_info=True)
+
+    allowed, retry_after = local_buckets.take(key, rate, capacity, now)
+    return allowed, max(retry_after, 0)
+
+
+def get_client_ip(request):
+    """
+    Return the IP address of the client of a request, read from the header set by the
+    proxy in front of the app if there is one.
+    """
+    if settings.RATE_LIMIT_IP_HEADER:
+        if value := request.META.get(settings.RATE_LIMIT_IP_HEADER):
+            return value.split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def get_retry_after(seconds):
+    return str(max(math.ceil(seconds), 1))
@@ -0,0 +1,140 @@
+import functools
+import random
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# The replica the reads of the current block are sent to, chosen once so they are
+# consistent with each other, or None.
+_replica = ContextVar('replica', default=None)
+# Whether the reads of the current block are forced to the primary.
+_primary = ContextVar('primary', default=False)
+# Whether the current request has written, after which its reads stay on the primary.
+# None outside track_writes(), when writes are not tracked.
+_written = ContextVar('written', default=None)
+
+
+def _pin():
+    """Marks a transaction which has written, in the callbacks run once it commits."""
+
+
+def is_pinned():
+    """Return True if the current transaction on the primary has written."""
+    connection = connections[DEFAULT_DB_ALIAS]
+    return connection.in_atomic_block and any(
+        callback[1] is _pin for callback in connection.run_on_commit
+    )
+
+
+def get_replica():
+    """Return the alias of the replica reads are currently sent to, otherwise None."""
+    alias = _replica.get()
+    if alias is None or _primary.get() or _written.get() or is_pinned():
+        return None
+    return alias
+
+
+def has_written():
+    """Return True if the current request has written to the primary."""
+    return bool(_written.get())
+
+
+@contextmanager
+def track_writes():
+    """
+    Track the writes of the block, a request, keeping its reads on the primary once it
+    has written so it sees its own changes.
+    """
+    token = _written.set(False)
+    try:
+        yield
+    finally:
+        _written.reset(token)
+
+
+@contextmanager
+def use_replica(alias=None):
+    """
+    Send the reads of the block to the given replica, by default one of
+    REPLICA_DATABASES picked at random. Reads stay on the primary once written to, and
+    in a use_primary() block. Without replicas the block runs as is.
+    """
+    if alias is None:
+        alias = _replica.get()
+    if alias is None and settings.REPLICA_DATABASES:
+        alias = random.choice(settings.REPLICA_DATABASES)
+
+    token = _replica.set(alias)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Send the reads of the block to the primary, even within a use_replica() block."""
+    token = _primary.set(True)
+    try:
+        yield
+    finally:
+        _primary.reset(token)
+
+
+def use_primary_for_validation():
+    """
+    Return the context in which a Booking is validated before it is committed, on the
+    primary if REPLICA_PRIMARY_FOR_VALIDATION, so a lagging replica cannot let a table
+    be booked twice.
+    """
+    return use_primary() if settings.REPLICA_PRIMARY_FOR_VALIDATION else nullcontext()
+
+
+def replica_reads(func):
+    """
+    Decorator to send the reads of a task to a replica, see use_replica(). Its writes
+    only keep the reads of the transaction they are in on the primary.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with use_replica():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """
+    Database router sending reads to a replica within a use_replica() block, unless the
+    transaction or request has written, and all else to the primary. Reads outside a
+    block are sent to the primary explicitly, rather than to the database an instance
+    they relate to was read from.
+    """
+
+    def db_for_read(self, model, **hints):
+        return get_replica() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        if _written.get() is False:
+            _written.set(True)
+
+        # The rest of the transaction reads what it has written, until it ends.
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.in_atomic_block and not is_pinned():
+            connection.on_commit(_pin)
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.REPLICA_DATABASES}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.REPLICA_DATABASES:
+            return False
+        return None
@@ -0,0 +1,137 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from post_office.models import STATUS, Email, Log
+
+logger = logging.getLogger(__name__)
+
+PURGE_METRICS_CACHE_KEY = 'core.retention.purge'
+
+
+def iter_id_chunks(queryset, chunk_size):
+    """
+    Yield the ids of the given queryset in ascending chunks. Each chunk is read after
+    the last is processed, continuing from its last id, so rows already processed are
+    never scanned again.
+    """
+    last_id = 0
+    while True:
+        ids = list(
+            queryset.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', flat=True)[:chunk_size]
+        )
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def delete_emails(ids):
+    """Delete the Emails of the given ids along with their Logs."""
+    _, deleted = Email.objects.filter(id__in=ids).delete()
+    return deleted.get(Email._meta.label, 0)
+
+
+def strip_email_bodies(ids):
+    """Empty the bodies of the Emails of the given ids, keeping when and to whom sent."""
+    return Email.objects.filter(id__in=ids).update(message='', html_message='')
+
+
+def delete_logs(ids):
+    _, deleted = Log.objects.filter(id__in=ids).delete()
+    return deleted.get(Log._meta.label, 0)
+
+
+def get_purge_jobs():
+    """
+    Return the purges to run, as the metric each counts towards, the queryset of the
+    rows to purge and the function purging a chunk of their ids.
+    """
+    now = timezone.now()
+    jobs = []
+
+    for name, days in settings.EMAIL_RETENTION.items():
+        if days is not None:
+            emails = Email.objects.filter(
+                status=getattr(STATUS, name), created__lt=now - timedelta(days=days)
+            )
+            jobs.append(('emails_deleted', emails, delete_emails))
+
+    if (days := settings.EMAIL_STRIP_BODIES_AFTER) is not None:
+        emails = Email.objects.filter(
+            status=STATUS.sent, created__lt=now - timedelta(days=days)
+        ).exclude(message='', html_message='')
+        jobs.append(('bodies_stripped', emails, strip_email_bodies))
+
+    if (days := settings.EMAIL_LOG_RETENTION) is not None:
+        logs = Log.objects.filter(date__lt=now - timedelta(days=days))
+        jobs.append(('logs_deleted', logs, delete_logs))
+
+    return jobs
+
+
+def purge_emails(chunk_size=None, max_chunks=None, pause=None):
+    """
+    Delete the Emails older than their retention by status in EMAIL_RETENTION, strip
+    the bodies of sent Emails older than EMAIL_STRIP_BODIES_AFTER days, and delete
+    the Logs older than EMAIL_LOG_RETENTION days. Rows are purged in chunks of short
+    transactions with a pause between each, so no lock is held for long, and the run
+    stops after max_chunks. Progress is recorded after every chunk, see
+    get_purge_metrics(). Returns the metrics of the run.
+    """
+    chunk_size = chunk_size or settings.EMAIL_PURGE_CHUNK_SIZE
+    max_chunks = max_chunks or settings.EMAIL_PURGE_MAX_CHUNKS
+    pause = settings.EMAIL_PURGE_PAUSE if pause is None else pause
+
+    start = time.monotonic()
+    metrics = {
+        'started_at': timezone.now(),
+        'finished_at': None,
+        'chunks': 0,
+        'emails_deleted': 0,
+        'bodies_stripped': 0,
+        'logs_deleted': 0,
+        'runtime_ms': 0,
+    }
+    cache.set(PURGE_METRICS_CACHE_KEY, metrics, None)
+
+    for metric, queryset, purge in get_purge_jobs():
+        for ids in iter_id_chunks(queryset, chunk_size):
+            if metrics['chunks'] >= max_chunks:
+                break
+            if metrics['chunks'] and pause:
+                time.sleep(pause)
+
+            with transaction.atomic():
+                metrics[metric] += purge(ids)
+            metrics['chunks'] += 1
+            metrics['runtime_ms'] = int((time.monotonic() - start) * 1000)
+            cache.set(PURGE_METRICS_CACHE_KEY, metrics, None)
+
+    metrics['finished_at'] = timezone.now()
+    metrics['runtime_ms'] = int((time.monotonic() - start) * 1000)
+    cache.set(PURGE_METRICS_CACHE_KEY, metrics, None)
+
+    logger.info(
+        'Purged %s emails, stripped %s bodies and purged %s logs in %s chunks',
+        metrics['emails_deleted'],
+        metrics['bodies_stripped'],
+        metrics['logs_deleted'],
+        metrics['chunks'],
+    )
+    return metrics
+
+
+def get_purge_metrics():
+    """
+    Return the metrics of the last purge, updated as it runs. Its finished_at is None
+    until it has finished.
+    """
+    return cache.get(PURGE_METRICS_CACHE_KEY)
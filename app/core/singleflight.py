@@ -0,0 +1,49 @@
+import time
+import uuid
+
+from django.core.cache import cache
+
+KEY_PREFIX = 'singleflight.'
+MISSING = object()
+
+
+def single_flight(key, compute, timeout, max_wait=None, poll_interval=0.05):
+    """
+    Return the result of compute() for the given key, computed once for the concurrent
+    callers of every process. The first caller computes it and shares the result in
+    the cache for `timeout` seconds, the others wait for it up to `max_wait` seconds,
+    by default as long. Waiting callers compute the result themselves if the first
+    fails or takes too long.
+    """
+    result_key = f'{KEY_PREFIX}{key}.result'
+    lock_key = f'{KEY_PREFIX}{key}.lock'
+
+    result = cache.get(result_key, MISSING)
+    if result is not MISSING:
+        return result
+
+    token = uuid.uuid4().hex
+    if cache.add(lock_key, token, timeout):
+        try:
+            result = compute()
+            cache.set(result_key, result, timeout)
+            return result
+        finally:
+            # The lock may have expired and been taken by another caller since.
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    deadline = time.monotonic() + (timeout if max_wait is None else max_wait)
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+
+        # The lock is read first, as the result is shared before it is released.
+        locked = cache.get(lock_key) is not None
+        result = cache.get(result_key, MISSING)
+        if result is not MISSING:
+            return result
+        if not locked:
+            # The first caller failed without a result.
+            break
+
+    return compute()
@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from .retention import purge_emails
+
+
+@shared_task
+def purge_old_emails():
+    """
+    Purge the post_office Emails and Logs past their retention. Runs daily, stopping
+    after EMAIL_PURGE_MAX_CHUNKS so a backlog is worked through over several runs.
+    """
+    metrics = purge_emails()
+    return {
+        name: metrics[name] for name in ('emails_deleted', 'bodies_stripped', 'logs_deleted')
+    }
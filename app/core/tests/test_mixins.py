@@ -1,11 +1,18 @@
+from unittest.mock import patch
+
+from django.db import OperationalError
+from django.http import HttpResponse
 from django.shortcuts import redirect
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from django.urls.base import reverse_lazy
+from django.views import View
 
 from model_bakery import baker
 
-from ..mixins import ManagerAccessMixin
+from ..mixins import ManagerAccessMixin, RateLimitMixin, StatementTimeoutMixin
+from ..ratelimit import LocalTokenBuckets
+from .test_timeouts import make_timeout_error
 
 
 class ManagerAccessMixinTest(TestCase):
@@ -70,3 +77,94 @@ class ManagerAccessMixinTest(TestCase):
         self.assertRedirects(
             response, expected_url=reverse('settings'), fetch_redirect_response=False
         )
+
+
+@override_settings(RATE_LIMIT_ENABLED=True)
+@patch('core.ratelimit.local_buckets', new_callable=LocalTokenBuckets)
+class RateLimitMixinTest(TestCase):
+    class MockCBV:
+        def dispatch(self, request, *args, **kwargs):
+            return HttpResponse()
+
+    class MockImplementerClass(RateLimitMixin, MockCBV):
+        def get_rate_limits(self):
+            return [('ip', 0.1, 2), ('site', 0.1, 1)]
+
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+        self.mixin = self.MockImplementerClass()
+
+    def test_requests_limited(self, local_buckets):
+        self.assertEqual(self.mixin.dispatch(self.request).status_code, 200)
+
+        response = self.mixin.dispatch(self.request)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '10')
+
+    @override_settings(RATE_LIMIT_ENABLED=False)
+    def test_disabled(self, local_buckets):
+        for _ in range(3):
+            self.assertEqual(self.mixin.dispatch(self.request).status_code, 200)
+
+
+class StatementTimeoutMixinTest(TestCase):
+    class MockView(StatementTimeoutMixin, View):
+        statement_timeout = 100
+        error = None
+
+        def get(self, request, *args, **kwargs):
+            if self.error is not None:
+                raise self.error
+            return HttpResponse()
+
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+        self.request.user = baker.make('accounts.User')
+
+    def test_response(self):
+        response = self.MockView.as_view()(self.request)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_timeout_raised(self):
+        with self.assertLogs('core.mixins', 'WARNING'), self.assertRaises(OperationalError):
+            self.MockView.as_view(error=make_timeout_error())(self.request)
+
+    def test_timeout_template(self):
+        view = self.MockView.as_view(
+            error=make_timeout_error(), statement_timeout_template_name='frontend/try_again.html'
+        )
+
+        with self.assertLogs('core.mixins', 'WARNING'):
+            response = view(self.request)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '5')
+        self.assertContains(response, 'Please Try Again', status_code=503)
+
+    def test_other_errors_raised(self):
+        view = self.MockView.as_view(
+            error=OperationalError(), statement_timeout_template_name='frontend/try_again.html'
+        )
+
+        with self.assertRaises(OperationalError):
+            view(self.request)
+
+    def test_atomic_requests(self):
+        class ReadOnlyView(self.MockView):
+            atomic_requests = False
+
+        self.assertFalse(hasattr(self.MockView.as_view(), '_non_atomic_requests'))
+        self.assertEqual(ReadOnlyView.as_view()._non_atomic_requests, {'default'})
+
+    def test_replica(self):
+        # Test statements on the replica the view reads from are bounded as well.
+        with patch('core.mixins.get_replica', return_value='replica'), patch(
+            'core.mixins.statement_timeout'
+        ) as mock:
+            self.MockView.as_view()(self.request)
+
+        self.assertCountEqual(
+            [call.args for call in mock.call_args_list], [(100, 'default'), (100, 'replica')]
+        )
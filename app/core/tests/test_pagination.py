@@ -0,0 +1,108 @@
+from unittest import skipIf, skipUnless
+
+from django.db import connection
+from django.http.response import Http404
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from django.views.generic import ListView
+
+from model_bakery import baker
+
+from bookings.models import Booking
+from ..pagination import KeysetPaginationMixin, decode_cursor, encode_cursor, estimate_count
+
+
+class CursorTest(TestCase):
+    def test_encode_decode_cursor(self):
+        cursor = encode_cursor(['a', 1], previous=True)
+
+        self.assertEqual(decode_cursor(cursor), (['a', 1], True))
+
+    def test_decode_invalid_cursor(self):
+        with self.assertRaises(Http404):
+            decode_cursor('invalid')
+
+
+class EstimateCountTest(TestCase):
+    def setUp(self):
+        baker.make('bookings.Booking', _quantity=3)
+
+    @skipIf(connection.vendor == 'postgresql', 'The count is estimated on PostgreSQL.')
+    def test_exact_count(self):
+        self.assertEqual(estimate_count(Booking.objects.all()), 3)
+
+    @skipUnless(connection.vendor == 'postgresql', 'The count is estimated on PostgreSQL.')
+    def test_planner_estimate(self):
+        with self.assertNumQueries(1):
+            count = estimate_count(Booking.objects.filter(party__gte=1).order_by('-id'))
+
+        self.assertIsInstance(count, int)
+        self.assertGreaterEqual(count, 0)
+
+
+class KeysetPaginationMixinTest(TestCase):
+    class BookingListView(KeysetPaginationMixin, ListView):
+        model = Booking
+        paginate_by = 2
+        keyset_ordering = ('booking_date', 'id')
+        estimate_count = True
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        now = timezone.now()
+
+        # Two Bookings share a booking_date to check ties are broken by id.
+        self.bookings = [
+            baker.make('bookings.Booking', booking_date=now),
+            baker.make('bookings.Booking', booking_date=now),
+            baker.make('bookings.Booking', booking_date=now + timezone.timedelta(hours=1)),
+            baker.make('bookings.Booking', booking_date=now + timezone.timedelta(hours=2)),
+            baker.make('bookings.Booking', booking_date=now + timezone.timedelta(hours=3)),
+        ]
+
+    def get_context(self, cursor=None):
+        params = {'cursor': cursor} if cursor else {}
+        response = self.BookingListView.as_view()(self.factory.get('/', params))
+        return response.context_data
+
+    def test_first_page(self):
+        context = self.get_context()
+        page = context['page_obj']
+
+        self.assertEqual(list(context['object_list']), self.bookings[:2])
+        self.assertTrue(context['is_paginated'])
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertIsInstance(page.estimated_count(), int)
+
+    def test_next_and_previous_pages(self):
+        page = self.get_context()['page_obj']
+
+        context = self.get_context(page.next_cursor)
+        page = context['page_obj']
+        self.assertEqual(list(context['object_list']), self.bookings[2:4])
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+
+        context = self.get_context(page.next_cursor)
+        page = context['page_obj']
+        self.assertEqual(list(context['object_list']), self.bookings[4:])
+        self.assertFalse(page.has_next())
+        self.assertTrue(page.has_previous())
+
+        context = self.get_context(page.previous_cursor)
+        page = context['page_obj']
+        self.assertEqual(list(context['object_list']), self.bookings[2:4])
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+
+        context = self.get_context(page.previous_cursor)
+        page = context['page_obj']
+        self.assertEqual(list(context['object_list']), self.bookings[:2])
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+
+    def test_tampered_cursor(self):
+        for values in (['garbage', 1], [[1], 1], [None, None], ['2021-06-01T00:00:00'], 5):
+            with self.subTest(values=values), self.assertRaises(Http404):
+                self.get_context(encode_cursor(values))
@@ -0,0 +1,82 @@
+from unittest.mock import Mock, patch
+
+from django.test import RequestFactory, TestCase, override_settings
+
+import redis
+
+from ..ratelimit import LocalTokenBuckets, get_client_ip, take_token
+
+
+class LocalTokenBucketsTest(TestCase):
+    def setUp(self):
+        self.buckets = LocalTokenBuckets()
+
+    def test_take_until_empty(self):
+        self.assertEqual(self.buckets.take('key', 1, 2, 100), (True, 0))
+        self.assertTrue(self.buckets.take('key', 1, 2, 100)[0])
+
+        allowed, retry_after = self.buckets.take('key', 1, 2, 100)
+
+        self.assertFalse(allowed)
+        self.assertEqual(retry_after, 1)
+
+    def test_refilled_over_time(self):
+        self.buckets.take('key', 2, 1, 100)
+        self.assertFalse(self.buckets.take('key', 2, 1, 100.1)[0])
+
+        self.assertTrue(self.buckets.take('key', 2, 1, 100.6)[0])
+
+    def test_buckets_separate(self):
+        self.buckets.take('key', 1, 1, 100)
+
+        self.assertTrue(self.buckets.take('other', 1, 1, 100)[0])
+
+    def test_full_buckets_dropped(self):
+        self.buckets.max_buckets = 2
+        self.buckets.take('a', 1, 1, 100)
+        self.buckets.take('b', 1, 1, 100)
+
+        self.buckets.take('c', 1, 1, 105)
+
+        self.assertEqual(set(self.buckets.buckets), {'c'})
+
+
+@patch('core.ratelimit.local_buckets', new_callable=LocalTokenBuckets)
+class TakeTokenTest(TestCase):
+    def test_local_without_redis(self, local_buckets):
+        self.assertTrue(take_token('key', 1, 1)[0])
+        self.assertFalse(take_token('key', 1, 1)[0])
+        self.assertIn('ratelimit.key', local_buckets.buckets)
+
+    def test_redis(self, local_buckets):
+        client = Mock()
+        client.register_script.return_value.return_value = [0, b'0.5']
+
+        with patch('core.ratelimit.get_redis_client', return_value=client):
+            self.assertEqual(take_token('key', 1, 1), (False, 0.5))
+
+        self.assertEqual(local_buckets.buckets, {})
+
+    def test_local_when_redis_unavailable(self, local_buckets):
+        client = Mock()
+        client.register_script.return_value.side_effect = redis.ConnectionError
+
+        with patch('core.ratelimit.get_redis_client', return_value=client):
+            with self.assertLogs('core.ratelimit', 'WARNING'):
+                self.assertTrue(take_token('key', 1, 1)[0])
+
+        self.assertIn('ratelimit.key', local_buckets.buckets)
+
+
+class GetClientIpTest(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get(
+            '/', REMOTE_ADDR='10.0.0.1', HTTP_X_REAL_IP='203.0.113.5'
+        )
+
+    def test_remote_addr(self):
+        self.assertEqual(get_client_ip(self.request), '10.0.0.1')
+
+    @override_settings(RATE_LIMIT_IP_HEADER='HTTP_X_REAL_IP')
+    def test_proxy_header(self):
+        self.assertEqual(get_client_ip(self.request), '203.0.113.5')
@@ -0,0 +1,160 @@
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.views import View
+
+from model_bakery import baker
+
+from accounts.models import User
+from ..middleware import PRIMARY_READS_COOKIE, ReplicaMiddleware
+from ..mixins import ReplicaReadMixin
+from ..replicas import (
+    ReplicaRouter,
+    get_replica,
+    has_written,
+    is_pinned,
+    replica_reads,
+    track_writes,
+    use_primary,
+    use_primary_for_validation,
+    use_replica,
+)
+
+
+@override_settings(REPLICA_DATABASES=['replica'])
+class ReplicaRouterTest(TestCase):
+    def test_reads(self):
+        self.assertEqual(User.objects.all().db, 'default')
+
+        with use_replica():
+            self.assertEqual(get_replica(), 'replica')
+            self.assertEqual(User.objects.all().db, 'replica')
+
+        self.assertIsNone(get_replica())
+
+    @override_settings(REPLICA_DATABASES=[])
+    def test_reads_without_replicas(self):
+        with use_replica():
+            self.assertIsNone(get_replica())
+            self.assertEqual(User.objects.all().db, 'default')
+
+    def test_writes(self):
+        with use_replica():
+            self.assertEqual(User.objects.select_for_update().db, 'default')
+            self.assertEqual(ReplicaRouter().db_for_write(User), 'default')
+
+    def test_use_primary(self):
+        with use_replica(), use_primary():
+            self.assertEqual(User.objects.all().db, 'default')
+
+    def test_pinned_in_transaction(self):
+        # Test the reads of a transaction which has written stay on the primary until it
+        # ends, and those of the transaction it is part of if it is committed.
+        with use_replica():
+            with transaction.atomic():
+                baker.make('accounts.User')
+                self.assertTrue(is_pinned())
+                self.assertEqual(User.objects.all().db, 'default')
+
+            self.assertTrue(is_pinned())
+
+    def test_unpinned_on_rollback(self):
+        with use_replica():
+            try:
+                with transaction.atomic():
+                    baker.make('accounts.User')
+                    raise ValueError
+            except ValueError:
+                pass
+
+            self.assertFalse(is_pinned())
+            self.assertEqual(User.objects.all().db, 'replica')
+
+    def test_pinned_in_request(self):
+        # Test the reads of a request stay on the primary once it has written.
+        with track_writes(), use_replica():
+            self.assertFalse(has_written())
+            ReplicaRouter().db_for_write(User)
+
+            self.assertTrue(has_written())
+            self.assertEqual(User.objects.all().db, 'default')
+
+        self.assertFalse(has_written())
+
+    def test_replica_reads(self):
+        @replica_reads
+        def task():
+            return get_replica()
+
+        self.assertEqual(task(), 'replica')
+
+    def test_allow_relation(self):
+        user = User(username='user')
+        user._state.db = 'replica'
+        other = User(username='other')
+        other._state.db = 'default'
+
+        self.assertTrue(ReplicaRouter().allow_relation(user, other))
+
+    def test_allow_migrate(self):
+        self.assertFalse(ReplicaRouter().allow_migrate('replica', 'bookings'))
+        self.assertIsNone(ReplicaRouter().allow_migrate('default', 'bookings'))
+
+    def test_primary_for_validation(self):
+        with use_replica():
+            with use_primary_for_validation():
+                self.assertIsNone(get_replica())
+
+            with self.settings(REPLICA_PRIMARY_FOR_VALIDATION=False):
+                with use_primary_for_validation():
+                    self.assertEqual(get_replica(), 'replica')
+
+
+@override_settings(REPLICA_DATABASES=['replica'], REPLICA_STICKY_SECONDS=5)
+class ReplicaMiddlewareTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def get_response(self, request):
+        if request.method == 'POST':
+            ReplicaRouter().db_for_write(User)
+        with use_replica():
+            return HttpResponse(get_replica() or 'default')
+
+    def test_read(self):
+        response = ReplicaMiddleware(self.get_response)(self.factory.get('/'))
+
+        self.assertEqual(response.content, b'replica')
+        self.assertNotIn(PRIMARY_READS_COOKIE, response.cookies)
+
+    def test_write(self):
+        response = ReplicaMiddleware(self.get_response)(self.factory.post('/'))
+
+        self.assertEqual(response.content, b'default')
+        self.assertEqual(response.cookies[PRIMARY_READS_COOKIE]['max-age'], 5)
+
+    def test_read_after_write(self):
+        request = self.factory.get('/')
+        request.COOKIES[PRIMARY_READS_COOKIE] = '1'
+        response = ReplicaMiddleware(self.get_response)(request)
+
+        self.assertEqual(response.content, b'default')
+
+    @override_settings(REPLICA_DATABASES=[])
+    def test_without_replicas(self):
+        response = ReplicaMiddleware(self.get_response)(self.factory.post('/'))
+
+        self.assertNotIn(PRIMARY_READS_COOKIE, response.cookies)
+
+
+@override_settings(REPLICA_DATABASES=['replica'])
+class ReplicaReadMixinTest(TestCase):
+    class MockView(ReplicaReadMixin, View):
+        def get(self, request, *args, **kwargs):
+            return HttpResponse(get_replica())
+
+    def test_response(self):
+        response = self.MockView.as_view()(RequestFactory().get('/'))
+
+        self.assertEqual(response.content, b'replica')
+        self.assertIsNone(get_replica())
@@ -0,0 +1,99 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from post_office.models import STATUS, Email, Log
+
+from ..retention import get_purge_metrics, purge_emails
+from ..tasks import purge_old_emails
+
+
+def make_email(status, days_old, **kwargs):
+    email = Email.objects.create(
+        from_email='noreply@email.com',
+        to=['client@email.com'],
+        subject='Booking',
+        message='Message',
+        html_message='<p>Message</p>',
+        status=status,
+        **kwargs,
+    )
+    Email.objects.filter(id=email.id).update(created=timezone.now() - timedelta(days=days_old))
+    return email
+
+
+@override_settings(
+    EMAIL_RETENTION={'sent': 90, 'failed': 180, 'queued': None, 'requeued': None},
+    EMAIL_STRIP_BODIES_AFTER=14,
+    EMAIL_LOG_RETENTION=90,
+)
+class PurgeEmailsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_emails_purged_by_status_and_age(self):
+        old_sent = make_email(STATUS.sent, 100)
+        recent_sent = make_email(STATUS.sent, 30)
+        old_failed = make_email(STATUS.failed, 100)
+        expired_failed = make_email(STATUS.failed, 200)
+        old_queued = make_email(STATUS.queued, 365)
+        Log.objects.create(email=old_sent, status=STATUS.sent, message='')
+
+        metrics = purge_emails()
+
+        self.assertEqual(metrics['emails_deleted'], 2)
+        self.assertEqual(
+            set(Email.objects.values_list('id', flat=True)),
+            {recent_sent.id, old_failed.id, old_queued.id},
+        )
+        self.assertFalse(Log.objects.exists())
+        self.assertFalse(Email.objects.filter(id=expired_failed.id).exists())
+
+    def test_sent_bodies_stripped(self):
+        stale = make_email(STATUS.sent, 30)
+        fresh = make_email(STATUS.sent, 1)
+        failed = make_email(STATUS.failed, 30)
+
+        metrics = purge_emails()
+
+        self.assertEqual(metrics['bodies_stripped'], 1)
+        stale.refresh_from_db()
+        self.assertEqual((stale.message, stale.html_message), ('', ''))
+        self.assertEqual(stale.subject, 'Booking')
+        self.assertEqual(Email.objects.get(id=fresh.id).message, 'Message')
+        self.assertEqual(Email.objects.get(id=failed.id).message, 'Message')
+
+    def test_logs_purged(self):
+        email = make_email(STATUS.failed, 1)
+        old_log = Log.objects.create(email=email, status=STATUS.failed, message='')
+        Log.objects.filter(id=old_log.id).update(date=timezone.now() - timedelta(days=100))
+        log = Log.objects.create(email=email, status=STATUS.failed, message='')
+
+        self.assertEqual(purge_emails()['logs_deleted'], 1)
+        self.assertEqual(list(Log.objects.all()), [log])
+
+    @override_settings(EMAIL_STRIP_BODIES_AFTER=None, EMAIL_LOG_RETENTION=None)
+    def test_chunks(self):
+        for _ in range(5):
+            make_email(STATUS.sent, 100)
+
+        # Test the run stops after its chunks, pausing between each.
+        with patch('core.retention.time.sleep') as mock_sleep:
+            metrics = purge_emails(chunk_size=2, max_chunks=2, pause=1)
+
+        self.assertEqual(metrics['chunks'], 2)
+        self.assertEqual(metrics['emails_deleted'], 4)
+        self.assertEqual(Email.objects.count(), 1)
+        mock_sleep.assert_called_once_with(1)
+
+    def test_metrics(self):
+        make_email(STATUS.sent, 100)
+
+        purge_old_emails.delay()
+
+        metrics = get_purge_metrics()
+        self.assertEqual(metrics['emails_deleted'], 1)
+        self.assertIsNotNone(metrics['finished_at'])
@@ -0,0 +1,63 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from ..singleflight import single_flight
+
+
+class SingleFlightTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_result_shared(self):
+        compute = Mock(return_value=[1, 2])
+
+        self.assertEqual(single_flight('key', compute, 5), [1, 2])
+        self.assertEqual(single_flight('key', compute, 5), [1, 2])
+        compute.assert_called_once()
+
+    def test_waits_for_first_caller(self):
+        # Another caller holds the lock and shares its result while this one waits.
+        cache.set('singleflight.key.lock', 'token')
+        compute = Mock(return_value='own')
+
+        def share_result(seconds):
+            cache.set('singleflight.key.result', 'shared')
+            cache.delete('singleflight.key.lock')
+
+        with patch('core.singleflight.time.sleep', side_effect=share_result):
+            self.assertEqual(single_flight('key', compute, 5), 'shared')
+
+        compute.assert_not_called()
+
+    def test_computes_when_first_caller_fails(self):
+        cache.set('singleflight.key.lock', 'token')
+        compute = Mock(return_value='own')
+
+        with patch(
+            'core.singleflight.time.sleep',
+            side_effect=lambda seconds: cache.delete('singleflight.key.lock'),
+        ):
+            self.assertEqual(single_flight('key', compute, 5), 'own')
+
+        compute.assert_called_once()
+
+    def test_computes_after_max_wait(self):
+        # The first caller is still computing once this one has waited long enough.
+        cache.set('singleflight.key.lock', 'token')
+        compute = Mock(return_value='own')
+
+        with patch('core.singleflight.time.sleep'), patch(
+            'core.singleflight.time.monotonic', side_effect=[0, 0.5, 1]
+        ):
+            self.assertEqual(single_flight('key', compute, 5, max_wait=1), 'own')
+
+        compute.assert_called_once()
+        self.assertEqual(cache.get('singleflight.key.lock'), 'token')
+
+    def test_lock_released_on_error(self):
+        with self.assertRaises(ValueError):
+            single_flight('key', Mock(side_effect=ValueError), 5)
+
+        self.assertIsNone(cache.get('singleflight.key.lock'))
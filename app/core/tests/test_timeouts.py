@@ -0,0 +1,64 @@
+from unittest import skipIf
+from unittest.mock import MagicMock, patch
+
+from django.db import OperationalError, connection
+from django.test import TestCase
+
+from ..timeouts import QUERY_CANCELED, is_statement_timeout, statement_timeout
+
+
+class QueryCanceled(Exception):
+    pgcode = QUERY_CANCELED
+
+
+def make_timeout_error():
+    """Return an OperationalError as raised for a statement cancelled by PostgreSQL."""
+    error = OperationalError('canceling statement due to statement timeout')
+    error.__cause__ = QueryCanceled()
+    return error
+
+
+class IsStatementTimeoutTest(TestCase):
+    def test_statement_timeout(self):
+        self.assertTrue(is_statement_timeout(make_timeout_error()))
+
+    def test_other_errors(self):
+        self.assertFalse(is_statement_timeout(OperationalError('connection lost')))
+        self.assertFalse(is_statement_timeout(ValueError()))
+
+
+class StatementTimeoutTest(TestCase):
+    def get_connection(self, in_atomic_block):
+        connection = MagicMock(vendor='postgresql', in_atomic_block=in_atomic_block)
+        cursor = connection.cursor.return_value.__enter__.return_value
+        return connection, cursor
+
+    @skipIf(connection.vendor == 'postgresql', 'Tests the databases other than PostgreSQL.')
+    def test_other_databases(self):
+        with self.assertNumQueries(0):
+            with statement_timeout(100):
+                pass
+
+    def test_in_transaction(self):
+        connection, cursor = self.get_connection(in_atomic_block=True)
+
+        with patch('core.timeouts.connections', {'default': connection}), patch(
+            'core.timeouts.transaction'
+        ) as transaction:
+            with statement_timeout(100):
+                transaction.atomic.assert_called_once_with(using='default')
+
+        cursor.execute.assert_called_once_with('SET LOCAL statement_timeout = %s', [100])
+
+    def test_autocommit(self):
+        connection, cursor = self.get_connection(in_atomic_block=False)
+
+        with patch('core.timeouts.connections', {'default': connection}):
+            with self.assertRaises(ValueError):
+                with statement_timeout(100):
+                    raise ValueError
+
+        self.assertEqual(
+            [call.args for call in cursor.execute.call_args_list],
+            [('SET statement_timeout = %s', [100]), ('RESET statement_timeout',)],
+        )
@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, OperationalError, connections, transaction
+
+# The SQLSTATE of a statement cancelled by PostgreSQL, including by statement_timeout.
+QUERY_CANCELED = '57014'
+
+
+def is_statement_timeout(exc):
+    """Return True if the given database error is a statement cancelled by a timeout."""
+    return (
+        isinstance(exc, OperationalError)
+        and getattr(exc.__cause__, 'pgcode', None) == QUERY_CANCELED
+    )
+
+
+@contextmanager
+def statement_timeout(milliseconds, using=DEFAULT_DB_ALIAS):
+    """
+    Cancel any statement run within the block that takes longer than the given time.
+
+    In a transaction, the timeout is set with SET LOCAL for the rest of the transaction
+    and the block runs in a savepoint, so the transaction is still usable once a
+    statement is cancelled. Otherwise it is set for the session and reset after the
+    block. Only PostgreSQL is supported, on other databases the block runs as is.
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql' or not milliseconds:
+        yield
+        return
+
+    if connection.in_atomic_block:
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL statement_timeout = %s', [int(milliseconds)])
+        with transaction.atomic(using=using):
+            yield
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute('SET statement_timeout = %s', [int(milliseconds)])
+    try:
+        yield
+    finally:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('RESET statement_timeout')
+        except DatabaseError:
+            # The connection was lost, and the setting with it.
+            pass
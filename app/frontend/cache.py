@@ -0,0 +1,89 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+
+# The fields of a Site shown on the public pages, the pages are purged when they change.
+SITE_PAGE_FIELDS = (
+    'site_name',
+    'slug',
+    'site_logo',
+    'site_logo_variants',
+    'min_party_num',
+    'max_party_num',
+    'early_booking',
+    'last_booking',
+)
+
+# Surrogate key of the pages listing every Site.
+SITES_KEY = 'sites'
+
+
+def get_site_key(slug):
+    """Return the surrogate key of the pages of a single Site."""
+    return f'site-{slug}'
+
+
+def get_surrogate_cache_key(key):
+    return f'frontend.surrogate.{key}'
+
+
+def get_surrogate_versions(keys):
+    """
+    Return the current version of each surrogate key, creating those missing. Pages are
+    cached under the versions of their keys, so purging a key replaces its version.
+    """
+    cache_keys = [get_surrogate_cache_key(key) for key in keys]
+    versions = cache.get_many(cache_keys)
+
+    for cache_key in cache_keys:
+        if cache_key not in versions:
+            cache.add(cache_key, uuid.uuid4().hex, None)
+            versions[cache_key] = cache.get(cache_key)
+
+    return [versions[cache_key] for cache_key in cache_keys]
+
+
+def purge_surrogate_keys(*keys):
+    """
+    Purge the pages cached with any of the given surrogate keys, once the current
+    transaction is committed.
+    """
+    keys = [key for key in keys if key]
+    transaction.on_commit(
+        lambda: cache.set_many(
+            {get_surrogate_cache_key(key): uuid.uuid4().hex for key in keys}, None
+        )
+    )
+
+
+def get_page_cache_key(path, keys):
+    """
+    Return the cache key of the page at the given path. The booking horizon of the
+    pages moves with the time, so the key does too.
+    """
+    path = hashlib.md5(path.encode()).hexdigest()
+    hour = timezone.localtime().strftime('%Y%m%d%H')
+    versions = '.'.join(get_surrogate_versions(keys))
+    return f'frontend.page.{path}.{hour}.{versions}'
+
+
+def get_site_page_values(site):
+    """Return the values of the fields of a Site shown on the public pages."""
+    values = {name: getattr(site, name) for name in SITE_PAGE_FIELDS}
+    values['site_logo'] = values['site_logo'].name if values['site_logo'] else ''
+    return values
+
+
+def patch_page_headers(response, keys):
+    """
+    Let proxies in front of the app, such as nginx, cache the page for a short time, and
+    tag it with its surrogate keys.
+    """
+    patch_cache_control(response, public=True, max_age=settings.FRONTEND_PAGE_MAX_AGE)
+    response['Surrogate-Key'] = ' '.join(keys)
+    return response
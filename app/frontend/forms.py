@@ -6,6 +6,9 @@ from phonenumber_field.formfields import PhoneNumberField
 from bookings.forms import BookingBaseForm
 from bookings.models import Booking, BookingTableRelationship, Client
 from bookings.utils import BookingSystem
+from core.replicas import use_primary_for_validation
+from sites.snapshot import get_site_snapshot
+from waitlist.models import WaitlistEntry
 from .utils import get_early_booking_date, get_last_booking_date
 
 
@@ -39,8 +42,8 @@ class FrontendCreateBookingForm(BookingBaseForm):
         booking_date = self.create_booking_date()
 
         # Ensure that the date of the Booking is in the Site's acceptable time scale.
-        early_booking_date = get_early_booking_date(self.site)
-        last_booking_date = get_last_booking_date(self.site)
+        early_booking_date = get_early_booking_date(self.snapshot)
+        last_booking_date = get_last_booking_date(self.snapshot)
 
         # Date must not be past the early_booking period.
         if date > early_booking_date:
@@ -51,8 +54,9 @@ class FrontendCreateBookingForm(BookingBaseForm):
             raise ValidationError('The date selected is not available for booking at this time.')
 
         # Ensure that the requested time slot is still available.
-        self.booking_system = BookingSystem(self.site, date, party_size, frontend=True)
-        time_slot_available = self.booking_system.check_time_slot_available(time)
+        self.booking_system = BookingSystem(self.snapshot, date, party_size, frontend=True)
+        with use_primary_for_validation():
+            time_slot_available = self.booking_system.check_time_slot_available(time)
 
         if not time_slot_available:
             raise ValidationError('The time slot selected is not available.')
@@ -80,7 +84,7 @@ class FrontendCreateBookingForm(BookingBaseForm):
             client=client,
             booking_date=booking_date,
             party=self.cleaned_data.get('party'),
-            duration=self.site.booking_duration,
+            duration=self.snapshot.booking_duration,
             notes=self.cleaned_data.get('notes'),
         )
 
@@ -95,3 +99,49 @@ class FrontendCreateBookingForm(BookingBaseForm):
             )
 
         return booking
+
+
+class WaitlistEntryForm(forms.ModelForm):
+    """
+    Form for a Client to join the waitlist of a Site on the frontend.
+    """
+
+    class Meta:
+        model = WaitlistEntry
+        fields = [
+            'date',
+            'party',
+            'earliest_time',
+            'latest_time',
+            'client_name',
+            'client_email',
+        ]
+
+    def __init__(self, site, *args, **kwargs):
+        self.site = site
+        self.snapshot = get_site_snapshot(site)
+        super().__init__(*args, **kwargs)
+        self.instance.site = site
+
+        party_choices = [
+            (x, x) for x in range(self.snapshot.min_party_num, self.snapshot.max_party_num + 1)
+        ]
+        self.fields['party'] = forms.TypedChoiceField(choices=party_choices, coerce=int)
+
+        for field in self.fields.values():
+            field.widget.attrs['class'] = 'form-control'
+        self.fields['date'].widget.attrs['class'] = 'flatpickrDateField form-control'
+        self.fields['party'].widget.attrs['class'] = 'form-select'
+
+    def clean_date(self):
+        date = self.cleaned_data.get('date')
+
+        # Only dates which can be booked can be waited for.
+        last_booking_date = get_last_booking_date(self.snapshot).date()
+        if not last_booking_date <= date <= get_early_booking_date(self.snapshot):
+            raise ValidationError('The date selected is not available for booking at this time.')
+
+        return date
+
+    def clean_client_name(self):
+        return self.cleaned_data['client_name'].title()
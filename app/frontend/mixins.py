@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .cache import get_page_cache_key, patch_page_headers
+
+
+class CachedPageMixin:
+    """
+    Mixin for public views to cache the page rendered for a GET, the same for every
+    visitor, until one of its surrogate keys is purged. Requests with a query string are
+    not cached. Pages must be rendered with `{% csrf_placeholder %}` in place of
+    `{% csrf_token %}`, as a token would make them unique to the visitor.
+    """
+
+    def get_surrogate_keys(self):
+        return []
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != 'GET' or request.GET:
+            return super().dispatch(request, *args, **kwargs)
+
+        keys = self.get_surrogate_keys()
+        cache_key = get_page_cache_key(request.path, keys)
+
+        content = cache.get(cache_key)
+        if content is not None:
+            return patch_page_headers(HttpResponse(content), keys)
+
+        response = super().dispatch(request, *args, **kwargs)
+
+        if response.status_code != 200:
+            return response
+
+        def cache_page(response):
+            cache.set(cache_key, response.content, settings.FRONTEND_PAGE_CACHE_TIMEOUT)
+
+        response.add_post_render_callback(cache_page)
+        return patch_page_headers(response, keys)
@@ -0,0 +1,47 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch.dispatcher import receiver
+
+from sites.models import Site
+from .cache import (
+    SITE_PAGE_FIELDS,
+    SITES_KEY,
+    get_site_key,
+    get_site_page_values,
+    purge_surrogate_keys,
+)
+
+
+@receiver(post_init, sender=Site)
+def keep_site_page_values(sender, instance, *args, **kwargs):
+    """
+    Keep the values shown on the public pages a Site is loaded with, to know whether
+    they changed when it is saved. Deferred fields are not loaded to compare.
+    """
+    if instance.pk is None or instance.get_deferred_fields() & set(SITE_PAGE_FIELDS):
+        instance._page_values = None
+    else:
+        instance._page_values = get_site_page_values(instance)
+
+
+@receiver(post_save, sender=Site)
+def purge_site_pages(sender, instance, *args, **kwargs):
+    """
+    Purge the public pages of a Site, and those listing it, when the values shown on
+    them change.
+    """
+    old_values = getattr(instance, '_page_values', None)
+    instance._page_values = get_site_page_values(instance)
+    if old_values == instance._page_values:
+        return
+
+    old_slug = old_values['slug'] if old_values else None
+    purge_surrogate_keys(
+        SITES_KEY,
+        get_site_key(instance.slug),
+        old_slug and get_site_key(old_slug),
+    )
+
+
+@receiver(post_delete, sender=Site)
+def purge_deleted_site_pages(sender, instance, *args, **kwargs):
+    purge_surrogate_keys(SITES_KEY, get_site_key(instance.slug))
@@ -0,0 +1,17 @@
+from django import template
+from django.urls import reverse
+from django.utils.html import format_html
+
+register = template.Library()
+
+
+@register.simple_tag
+def csrf_placeholder():
+    """
+    Render an empty CSRF token input, filled in by the browser from the CSRF token view,
+    so the page rendering it stays the same for every visitor and can be cached.
+    """
+    return format_html(
+        '<input type="hidden" name="csrfmiddlewaretoken" value="" data-csrf-url="{}">',
+        reverse('frontend-csrf-token'),
+    )
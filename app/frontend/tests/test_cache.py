@@ -0,0 +1,99 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from model_bakery import baker
+
+from ..cache import SITES_KEY, get_site_key, get_surrogate_versions
+
+
+class CachedPageTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', site_name='Site 1', slug='site-1')
+        self.url = reverse('frontend-booking-create', args=[self.site.slug])
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_page_cached(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+        self.assertEqual(response['Surrogate-Key'], 'site-site-1')
+        self.assertNotIn('csrftoken', response.cookies)
+        self.assertNotIn('Vary', response)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(self.url)
+
+        self.assertEqual(cached_response.content, response.content)
+        self.assertEqual(cached_response['Cache-Control'], 'public, max-age=60')
+
+    def test_page_with_query_string_not_cached(self):
+        self.client.get(self.url)
+
+        response = self.client.get(self.url, {'date': '2021-01-01'})
+
+        self.assertTemplateUsed(response, 'frontend/booking_create.html')
+
+    def test_site_change_purges_pages(self):
+        self.client.get(reverse('frontend-site-list'))
+        self.client.get(self.url)
+        versions = get_surrogate_versions([SITES_KEY, get_site_key('site-1')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.site.max_party_num = 10
+            self.site.save()
+
+        new_versions = get_surrogate_versions([SITES_KEY, get_site_key('site-1')])
+        self.assertNotEqual(new_versions[0], versions[0])
+        self.assertNotEqual(new_versions[1], versions[1])
+
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, 'frontend/booking_create.html')
+
+    def test_other_site_change_does_not_purge_pages(self):
+        versions = get_surrogate_versions([SITES_KEY, get_site_key('site-1')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            # Not shown on the public pages.
+            self.site.booking_duration = 60
+            self.site.save()
+
+        self.assertEqual(get_surrogate_versions([SITES_KEY, get_site_key('site-1')]), versions)
+
+    def test_slug_change_purges_old_pages(self):
+        version = get_surrogate_versions([get_site_key('site-1')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.site.slug = 'site-one'
+            self.site.save()
+
+        self.assertNotEqual(get_surrogate_versions([get_site_key('site-1')]), version)
+
+    def test_waitlist_page_cached(self):
+        url = reverse('frontend-waitlist-create', args=[self.site.slug])
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+
+class CSRFTokenViewTest(TestCase):
+    def tearDown(self):
+        cache.clear()
+
+    def test_csrf_placeholder_filled_by_token_view(self):
+        site = baker.make('sites.Site')
+        response = self.client.get(reverse('frontend-booking-create', args=[site.slug]))
+
+        self.assertContains(
+            response,
+            f'data-csrf-url="{reverse("frontend-csrf-token")}"',
+        )
+
+        response = self.client.get(reverse('frontend-csrf-token'))
+
+        self.assertTrue(response.json()['token'])
+        self.assertIn('csrftoken', response.cookies)
+        self.assertIn('no-cache', response['Cache-Control'])
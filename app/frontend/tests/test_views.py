@@ -1,5 +1,6 @@
 import datetime
 
+from django.core.cache import cache
 from django.utils.timezone import make_aware
 from django.utils import timezone
 from django.test import TestCase
@@ -14,6 +15,9 @@ class SiteListViewTest(TestCase):
     def setUp(self):
         self.sites = baker.make('sites.Site', _quantity=3)
 
+    def tearDown(self):
+        cache.clear()
+
     def test_view_url_exists_at_desired_location(self):
         response = self.client.get('/f/')
 
@@ -42,6 +46,9 @@ class BookingCreateViewTest(TestCase):
         self.site = baker.make('sites.Site')
         self.table = baker.make('sites.Table', site=self.site, number_of_seats=6)
 
+    def tearDown(self):
+        cache.clear()
+
     def test_view_url_exists_at_desired_location(self):
         response = self.client.get(f'/f/create/{self.site.slug}/')
 
@@ -134,4 +141,52 @@ class BookingCreateCompleteViewTest(TestCase):
             reverse('frontend-booking-create-complete', args=[self.booking.reference])
         )
 
-        self.assertEqual(response.status_code, 404)
\ No newline at end of file
+        self.assertEqual(response.status_code, 404)
+
+
+class WaitlistCreateViewTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', last_booking=1)
+        self.url = reverse('frontend-waitlist-create', args=[self.site.slug])
+        self.date = timezone.localdate() + datetime.timedelta(days=2)
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_data(self, **kwargs):
+        return {
+            'date': self.date,
+            'party': 2,
+            'earliest_time': '18:00',
+            'latest_time': '20:00',
+            'client_name': 'test name',
+            'client_email': 'test@email.com',
+            **kwargs,
+        }
+
+    def test_view_uses_correct_template(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'frontend/waitlist_create.html')
+
+    def test_create_entry(self):
+        response = self.client.post(self.url, self.get_data())
+
+        self.assertRedirects(
+            response, reverse('frontend-waitlist-create-complete', args=[self.site.slug])
+        )
+
+        entry = self.site.waitlist_entries.get()
+        self.assertEqual(entry.date, self.date)
+        self.assertEqual(entry.party, 2)
+        self.assertEqual(entry.client_name, 'Test Name')
+
+    def test_create_entry_invalid(self):
+        response = self.client.post(
+            self.url, self.get_data(earliest_time='21:00', date=timezone.localdate())
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('date', response.context['form'].errors)
+        self.assertFalse(self.site.waitlist_entries.exists())
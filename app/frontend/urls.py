@@ -18,4 +18,19 @@ urlpatterns = [
         views.BookingCreateCompleteView.as_view(),
         name='frontend-booking-create-complete',
     ),
+    path(
+        'waitlist/<slug>/',
+        views.WaitlistCreateView.as_view(),
+        name='frontend-waitlist-create',
+    ),
+    path(
+        'waitlist/<slug>/complete/',
+        views.WaitlistCreateCompleteView.as_view(),
+        name='frontend-waitlist-create-complete',
+    ),
+    path(
+        'csrf/',
+        views.CSRFTokenView.as_view(),
+        name='frontend-csrf-token',
+    ),
 ]
@@ -5,7 +5,7 @@ from django.utils import timezone
 
 def get_early_booking_date(site):
     """
-    Return the last date a Booking can be made for.
+    Return the last date a Booking can be made for. Accepts a Site or its snapshot.
     """
     early_booking = site.early_booking
     today = timezone.now().date()
@@ -15,7 +15,7 @@ def get_early_booking_date(site):
 
 def get_last_booking_date(site):
     """
-    Return the earliest date a Booking can be made for.
+    Return the earliest date a Booking can be made for. Accepts a Site or its snapshot.
     """
     last_booking = site.last_booking
     today = timezone.now()
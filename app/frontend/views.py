@@ -1,29 +1,49 @@
+from django.http import JsonResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
-from django.views.generic import DetailView, FormView, ListView
+from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
+from django.views import View
+from django.views.decorators.cache import never_cache
+from django.views.generic import CreateView, DetailView, FormView, ListView, TemplateView
 
 from bookings.models import Booking
+from core.mixins import StatementTimeoutMixin
 from sites.models import Site
-from .forms import FrontendCreateBookingForm
+from .cache import SITES_KEY, get_site_key
+from .forms import FrontendCreateBookingForm, WaitlistEntryForm
+from .mixins import CachedPageMixin
 from .utils import get_early_booking_date, get_last_booking_date
 
 
-class SiteListView(ListView):
+class SiteListView(CachedPageMixin, StatementTimeoutMixin, ListView):
     """
     View to select the relevant Site to create a Booking for.
     """
 
     template_name = 'frontend/site_list.html'
     queryset = Site.objects.order_by('site_name')
+    statement_timeout = 2000
+    atomic_requests = False
+    statement_timeout_template_name = 'frontend/try_again.html'
 
+    def get_surrogate_keys(self):
+        return [SITES_KEY]
 
-class BookingCreateView(FormView):
+
+class BookingCreateView(CachedPageMixin, StatementTimeoutMixin, FormView):
     """
     View to select the relevant Site to create a Booking for.
     """
 
     template_name = 'frontend/booking_create.html'
     form_class = FrontendCreateBookingForm
+    statement_timeout = 3000
+    statement_timeout_template_name = 'frontend/try_again.html'
+
+    def get_surrogate_keys(self):
+        return [get_site_key(self.kwargs['slug'])]
 
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
@@ -44,9 +64,10 @@ class BookingCreateView(FormView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        snapshot = context['form'].snapshot
         context['site'] = self.object
-        context['min_booking_date'] = get_last_booking_date(self.object).date()
-        context['max_booking_date'] = get_early_booking_date(self.object)
+        context['min_booking_date'] = get_last_booking_date(snapshot).date()
+        context['max_booking_date'] = get_early_booking_date(snapshot)
         return context
 
     def form_valid(self, form):
@@ -67,3 +88,57 @@ class BookingCreateCompleteView(DetailView):
     def get_object(self, queryset=None):
         queryset = Booking.objects.filter(status=Booking.StatusChoices.CONFIRMED)
         return get_object_or_404(queryset, reference=self.kwargs['reference'])
+
+
+class WaitlistCreateView(CachedPageMixin, StatementTimeoutMixin, CreateView):
+    """
+    View for a Client to join the waitlist of a Site, to be emailed when a time is free
+    rather than checking back for one.
+    """
+
+    template_name = 'frontend/waitlist_create.html'
+    form_class = WaitlistEntryForm
+    statement_timeout = 3000
+    statement_timeout_template_name = 'frontend/try_again.html'
+
+    def get_surrogate_keys(self):
+        return [get_site_key(self.kwargs['slug'])]
+
+    @cached_property
+    def site(self):
+        return get_object_or_404(Site, slug=self.kwargs['slug'])
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs['site'] = self.site
+        return kwargs
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        snapshot = context['form'].snapshot
+        context['site'] = self.site
+        context['min_booking_date'] = get_last_booking_date(snapshot).date()
+        context['max_booking_date'] = get_early_booking_date(snapshot)
+        return context
+
+    def get_success_url(self):
+        return reverse('frontend-waitlist-create-complete', args=[self.site.slug])
+
+
+class WaitlistCreateCompleteView(TemplateView):
+    """
+    View to confirm the Client has joined the waitlist.
+    """
+
+    template_name = 'frontend/waitlist_create_complete.html'
+
+
+@method_decorator(never_cache, name='dispatch')
+class CSRFTokenView(View):
+    """
+    View to return a CSRF token for the forms of cached pages, which are rendered
+    without one.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse({'token': get_token(request)})
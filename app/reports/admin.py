@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import DailySiteStats
+
+
+@admin.register(DailySiteStats)
+class DailySiteStatsAdmin(admin.ModelAdmin):
+    list_display = ['site', 'date', 'bookings', 'cancellations', 'covers']
+    list_filter = ['site']
+    date_hierarchy = 'date'
@@ -0,0 +1,32 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.mixins import ReplicaReadMixin
+from .serializers import DailySiteStatsSerializer
+from .views import ReportMixin
+
+
+class ReportAPIView(ReplicaReadMixin, ReportMixin, APIView):
+    """
+    API view to return the report of a Site's Bookings over a range of dates, with the
+    stats of each day.
+    """
+
+    def get(self, request, *args, **kwargs):
+        report = self.get_report(self.get_sites())
+        if report is None:
+            return Response({'site': None, 'days': []})
+
+        return Response(
+            {
+                'site': report['site'].id,
+                'date_from': report['start'],
+                'date_to': report['end'],
+                'totals': report['totals'],
+                'cancellation_rate': report['cancellation_rate'],
+                'utilization': report['utilization'],
+                'covers_by_hour': report['covers_by_hour'],
+                'party_sizes': report['party_sizes'],
+                'days': DailySiteStatsSerializer(report['days'], many=True).data,
+            }
+        )
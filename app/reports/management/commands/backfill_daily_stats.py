@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from bookings.models import Booking
+from sites.models import Site
+from ...stats import backfill_daily_stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the DailySiteStats of each Site from its Bookings. Covers every date '
+        'with Bookings unless a range is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--site', type=int, help='Id of the Site to backfill.')
+        parser.add_argument('--from', dest='date_from', help='First date, YYYY-MM-DD.')
+        parser.add_argument('--to', dest='date_to', help='Last date, YYYY-MM-DD.')
+
+    def handle(self, *args, **options):
+        sites = Site.objects.order_by('id')
+        if options['site']:
+            sites = sites.filter(id=options['site'])
+
+        date_from = self.parse_date(options['date_from'])
+        date_to = self.parse_date(options['date_to'])
+
+        for site in sites:
+            dates = Booking.objects.filter(site=site).aggregate(
+                first=Min('booking_date'), last=Max('booking_date')
+            )
+            if dates['first'] is None and not (date_from and date_to):
+                continue
+
+            start = date_from or timezone.localdate(dates['first'])
+            end = date_to or timezone.localdate(dates['last'])
+            count = backfill_daily_stats(site.id, start, end)
+
+            self.stdout.write(f'{site}: {count} days from {start} to {end}')
+
+    def parse_date(self, value):
+        if value is None:
+            return None
+        try:
+            if (date := parse_date(value)) is not None:
+                return date
+        except ValueError:
+            pass
+        raise CommandError(f'"{value}" is not a valid date, use YYYY-MM-DD')
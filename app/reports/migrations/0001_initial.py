@@ -0,0 +1,40 @@
+# Generated by Django 3.2 on 2026-10-19 00:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('sites', '0003_schedule_override'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailySiteStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('bookings', models.PositiveIntegerField(default=0)),
+                ('cancellations', models.PositiveIntegerField(default=0)),
+                ('covers', models.PositiveIntegerField(default=0)),
+                ('covers_by_hour', models.JSONField(default=dict)),
+                ('party_sizes', models.JSONField(default=dict)),
+                ('table_minutes', models.PositiveIntegerField(default=0)),
+                ('available_table_minutes', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='sites.site')),
+            ],
+            options={
+                'verbose_name_plural': 'daily site stats',
+                'ordering': ['date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailysitestats',
+            constraint=models.UniqueConstraint(fields=('site', 'date'), name='unique_site_daily_stats'),
+        ),
+    ]
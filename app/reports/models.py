@@ -0,0 +1,53 @@
+from django.db import models
+
+from sites.models import Site
+
+
+class DailySiteStats(models.Model):
+    """
+    Model to store the rollup of a Site's Bookings on a single date, so reports over
+    any range read one row per day rather than every Booking.
+    """
+
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+    )
+    date = models.DateField()
+
+    # Confirmed Bookings and their covers, cancelled Bookings are only counted.
+    bookings = models.PositiveIntegerField(default=0)
+    cancellations = models.PositiveIntegerField(default=0)
+    covers = models.PositiveIntegerField(default=0)
+
+    # Covers by the hour the Bookings start, and Bookings by party size.
+    covers_by_hour = models.JSONField(default=dict)
+    party_sizes = models.JSONField(default=dict)
+
+    # Minutes the Tables are booked for, and could have been while open.
+    table_minutes = models.PositiveIntegerField(default=0)
+    available_table_minutes = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['date']
+        verbose_name_plural = 'daily site stats'
+        constraints = [
+            models.UniqueConstraint(fields=['site', 'date'], name='unique_site_daily_stats')
+        ]
+
+    def __str__(self):
+        return f'{self.site} [{self.date}]'
+
+    @property
+    def cancellation_rate(self):
+        total = self.bookings + self.cancellations
+        return self.cancellations / total if total else 0
+
+    @property
+    def utilization(self):
+        if not self.available_table_minutes:
+            return 0
+        return self.table_minutes / self.available_table_minutes
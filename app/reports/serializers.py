@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from .models import DailySiteStats
+
+
+class DailySiteStatsSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the DailySiteStats model.
+    """
+
+    cancellation_rate = serializers.ReadOnlyField()
+    utilization = serializers.ReadOnlyField()
+
+    class Meta:
+        model = DailySiteStats
+        fields = [
+            'date',
+            'bookings',
+            'cancellations',
+            'covers',
+            'covers_by_hour',
+            'party_sizes',
+            'table_minutes',
+            'available_table_minutes',
+            'cancellation_rate',
+            'utilization',
+        ]
@@ -0,0 +1,13 @@
+from django.dispatch.dispatcher import receiver
+
+from bookings.signals import booking_changed
+from .tasks import refresh_site_daily_stats
+
+
+@receiver(booking_changed)
+def refresh_booking_daily_stats(sender, site_id, dates=(), **kwargs):
+    """
+    Recompute the DailySiteStats of the Booking's Site on the dates it changed.
+    """
+    if dates:
+        refresh_site_daily_stats.delay(site_id, [date.isoformat() for date in dates])
@@ -0,0 +1,154 @@
+from collections import Counter
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from bookings.models import Booking
+from sites.models import Site
+from sites.schedule import compile_schedule
+from .models import DailySiteStats
+
+TOTAL_FIELDS = (
+    'bookings',
+    'cancellations',
+    'covers',
+    'table_minutes',
+    'available_table_minutes',
+)
+
+# Dates rolled up at a time by the backfill, bounding the Bookings held in memory.
+BACKFILL_WINDOW_DAYS = 31
+
+
+def get_open_minutes(day):
+    """Return the minutes the Site is open for on the given compiled day."""
+    if day.is_closed or not day.is_valid:
+        return 0
+    opening = datetime.combine(datetime.min, day.opening_hour)
+    closing = datetime.combine(datetime.min, day.closing_hour)
+    return int((closing - opening).total_seconds() // 60)
+
+
+def get_date_range(start, end):
+    return [start + timedelta(days=x) for x in range((end - start).days + 1)]
+
+
+def compute_daily_stats(site_id, start, end):
+    """
+    Return the unsaved DailySiteStats of a Site for each date between start and end
+    inclusive, computed from its Bookings in a single query.
+    """
+    site = Site.objects.annotate(table_count=Count('tables')).get(id=site_id)
+    # The snapshot of the Site only has the overrides from yesterday on, so those of the
+    # range are loaded to compile the days in the past.
+    schedule = compile_schedule(
+        site, site.schedule_overrides.filter(date__gte=start, date__lte=end)
+    )
+    tz = timezone.get_current_timezone()
+
+    stats = {}
+    open_minutes = {}
+    for date in get_date_range(start, end):
+        open_minutes[date] = get_open_minutes(schedule.get_day(date))
+        stats[date] = DailySiteStats(
+            site_id=site_id,
+            date=date,
+            covers_by_hour={},
+            party_sizes={},
+            available_table_minutes=open_minutes[date] * site.table_count,
+        )
+
+    bookings = (
+        Booking.objects.filter(
+            site_id=site_id,
+            booking_date__gte=timezone.make_aware(datetime.combine(start, time()), tz),
+            booking_date__lt=timezone.make_aware(
+                datetime.combine(end + timedelta(days=1), time()), tz
+            ),
+        )
+        .annotate(table_count=Count('tables'))
+        .values_list('booking_date', 'status', 'party', 'duration', 'table_count')
+    )
+
+    for booking_date, status, party, duration, tables in bookings.iterator():
+        booking_date = timezone.localtime(booking_date, tz)
+        day = stats[booking_date.date()]
+
+        if status == Booking.StatusChoices.CANCELLED:
+            day.cancellations += 1
+            continue
+
+        day.bookings += 1
+        day.covers += party
+
+        hour, size = str(booking_date.hour), str(party)
+        day.covers_by_hour[hour] = day.covers_by_hour.get(hour, 0) + party
+        day.party_sizes[size] = day.party_sizes.get(size, 0) + 1
+
+        if duration == Site.BookingDurationChoices.ALL:
+            duration = open_minutes[booking_date.date()]
+        day.table_minutes += duration * tables
+
+    return list(stats.values())
+
+
+def refresh_daily_stats(site_id, start, end=None):
+    """
+    Recompute and save the DailySiteStats of a Site between start and end inclusive,
+    replacing those already saved. The Site is locked throughout, so concurrent refreshes
+    of a Site run one after the other and each recomputes from what the last committed.
+    """
+    end = end or start
+
+    with transaction.atomic():
+        Site.objects.select_for_update().only('id').get(id=site_id)
+        stats = compute_daily_stats(site_id, start, end)
+        DailySiteStats.objects.filter(site_id=site_id, date__gte=start, date__lte=end).delete()
+        DailySiteStats.objects.bulk_create(stats)
+
+    return stats
+
+
+def backfill_daily_stats(site_id, start, end):
+    """Refresh the DailySiteStats of a Site over a long range, a window at a time."""
+    count = 0
+    while start <= end:
+        window_end = min(start + timedelta(days=BACKFILL_WINDOW_DAYS - 1), end)
+        count += len(refresh_daily_stats(site_id, start, window_end))
+        start = window_end + timedelta(days=1)
+    return count
+
+
+def merge_counts(counts):
+    """Sum the given dicts of counts, sorted by their numeric keys."""
+    total = Counter()
+    for value in counts:
+        total.update(value)
+    return {key: total[key] for key in sorted(total, key=int)}
+
+
+def get_report(site, start, end):
+    """
+    Return the report of a Site between start and end inclusive, read only from the
+    DailySiteStats.
+    """
+    days = list(DailySiteStats.objects.filter(site=site, date__gte=start, date__lte=end))
+
+    # The totals of the range, as a single DailySiteStats for its rates.
+    summary = DailySiteStats(
+        **{field: sum(getattr(day, field) for day in days) for field in TOTAL_FIELDS}
+    )
+
+    return {
+        'site': site,
+        'start': start,
+        'end': end,
+        'days': days,
+        'totals': {field: getattr(summary, field) for field in TOTAL_FIELDS},
+        'cancellation_rate': summary.cancellation_rate,
+        'utilization': summary.utilization,
+        'covers_by_hour': merge_counts(day.covers_by_hour for day in days),
+        'party_sizes': merge_counts(day.party_sizes for day in days),
+    }
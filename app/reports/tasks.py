@@ -0,0 +1,19 @@
+from datetime import date
+
+from celery import shared_task
+
+from sites.models import Site
+from .stats import refresh_daily_stats
+
+
+@shared_task
+def refresh_site_daily_stats(site_id, dates):
+    """
+    Recompute the DailySiteStats of a Site on the given ISO formatted dates.
+    """
+    try:
+        for day in dates:
+            refresh_daily_stats(site_id, date.fromisoformat(day))
+    except Site.DoesNotExist:
+        # The Site was deleted since the change.
+        pass
@@ -0,0 +1,31 @@
+from django.test import TestCase
+
+from model_bakery import baker
+
+
+class DailySiteStatsTest(TestCase):
+    def setUp(self):
+        self.stats = baker.make(
+            'reports.DailySiteStats',
+            bookings=3,
+            cancellations=1,
+            table_minutes=120,
+            available_table_minutes=480,
+        )
+
+    def test_str(self):
+        self.assertEqual(f'{self.stats.site} [{self.stats.date}]', self.stats.__str__())
+
+    def test_cancellation_rate(self):
+        self.assertEqual(self.stats.cancellation_rate, 0.25)
+
+        self.stats.bookings = self.stats.cancellations = 0
+
+        self.assertEqual(self.stats.cancellation_rate, 0)
+
+    def test_utilization(self):
+        self.assertEqual(self.stats.utilization, 0.25)
+
+        self.stats.available_table_minutes = 0
+
+        self.assertEqual(self.stats.utilization, 0)
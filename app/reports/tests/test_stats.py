@@ -0,0 +1,169 @@
+import io
+from datetime import date, datetime, time
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from model_bakery import baker
+
+from bookings.models import Booking, BookingTableRelationship
+from sites.models import Site
+from sites.snapshot import _snapshots
+from ..models import DailySiteStats
+from ..stats import compute_daily_stats, get_report, refresh_daily_stats
+
+
+def make_date(day, hour):
+    return timezone.make_aware(datetime.combine(day, time(hour)))
+
+
+class DailySiteStatsTestCase(TestCase):
+    def setUp(self):
+        # Open 12:00 - 23:00 every day.
+        self.site = baker.make('sites.Site')
+        self.table_1 = baker.make('sites.Table', site=self.site, number_of_seats=2)
+        self.table_2 = baker.make('sites.Table', site=self.site, number_of_seats=4)
+        self.date = date(2021, 6, 14)
+
+        self.booking_1 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=make_date(self.date, 18),
+            party=2,
+            duration=120,
+        )
+        self.booking_2 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=make_date(self.date, 19),
+            party=6,
+            duration=60,
+        )
+        self.booking_3 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=make_date(self.date, 19),
+            party=4,
+            status=Booking.StatusChoices.CANCELLED,
+        )
+        self.booking_4 = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=make_date(date(2021, 6, 16), 12),
+            party=2,
+            duration=90,
+        )
+
+        BookingTableRelationship.objects.create(booking=self.booking_1, table=self.table_1)
+        BookingTableRelationship.objects.create(booking=self.booking_2, table=self.table_1)
+        BookingTableRelationship.objects.create(booking=self.booking_2, table=self.table_2)
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+
+class ComputeDailyStatsTest(DailySiteStatsTestCase):
+    def test_compute_daily_stats(self):
+        stats = compute_daily_stats(self.site.id, self.date, date(2021, 6, 16))
+
+        # Test a row is returned for each date, including those without Bookings.
+        self.assertEqual(
+            [day.date for day in stats], [self.date, date(2021, 6, 15), date(2021, 6, 16)]
+        )
+
+        day = stats[0]
+        self.assertEqual(day.bookings, 2)
+        self.assertEqual(day.cancellations, 1)
+        self.assertEqual(day.covers, 8)
+        self.assertEqual(day.covers_by_hour, {'18': 2, '19': 6})
+        self.assertEqual(day.party_sizes, {'2': 1, '6': 1})
+        self.assertEqual(day.table_minutes, 120 + 60 * 2)
+        self.assertEqual(day.available_table_minutes, 11 * 60 * 2)
+
+        self.assertEqual(stats[1].bookings, 0)
+        self.assertEqual(stats[2].covers, 2)
+
+    def test_compute_daily_stats_past_overrides(self):
+        # Test the overrides of days long past are applied.
+        baker.make('sites.ScheduleOverride', site=self.site, date=self.date)
+        baker.make(
+            'sites.ScheduleOverride',
+            site=self.site,
+            date=date(2021, 6, 15),
+            is_closed=False,
+            opening_hour=time(18),
+            closing_hour=time(22),
+        )
+
+        stats = compute_daily_stats(self.site.id, self.date, date(2021, 6, 16))
+
+        self.assertEqual(
+            [day.available_table_minutes for day in stats], [0, 4 * 60 * 2, 11 * 60 * 2]
+        )
+
+    def test_refresh_daily_stats(self):
+        refresh_daily_stats(self.site.id, self.date)
+
+        self.booking_1.party = 4
+        self.booking_1.save()
+        refresh_daily_stats(self.site.id, self.date)
+
+        # Test the saved stats are replaced.
+        stats = DailySiteStats.objects.get(site=self.site, date=self.date)
+        self.assertEqual(stats.covers, 10)
+
+    def test_refresh_daily_stats_twice(self):
+        refresh_daily_stats(self.site.id, self.date)
+        refresh_daily_stats(self.site.id, self.date)
+
+        stats = DailySiteStats.objects.get(site=self.site, date=self.date)
+        self.assertEqual(stats.covers, 8)
+
+    def test_refresh_daily_stats_existing_row(self):
+        baker.make('reports.DailySiteStats', site=self.site, date=self.date, covers=100)
+
+        refresh_daily_stats(self.site.id, self.date)
+
+        stats = DailySiteStats.objects.get(site=self.site, date=self.date)
+        self.assertEqual(stats.covers, 8)
+
+    def test_refresh_daily_stats_deleted_site(self):
+        site_id = self.site.id
+        self.site.delete()
+
+        with self.assertRaises(Site.DoesNotExist):
+            refresh_daily_stats(site_id, self.date)
+
+    def test_refreshed_on_booking_changed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.booking_1.party = 4
+            self.booking_1.save()
+
+        stats = DailySiteStats.objects.get(site=self.site, date=self.date)
+        self.assertEqual(stats.covers, 10)
+
+    def test_backfill_daily_stats_command(self):
+        stdout = io.StringIO()
+        call_command('backfill_daily_stats', stdout=stdout)
+
+        self.assertEqual(DailySiteStats.objects.filter(site=self.site).count(), 3)
+        self.assertIn('3 days from 2021-06-14 to 2021-06-16', stdout.getvalue())
+
+
+class GetReportTest(DailySiteStatsTestCase):
+    def test_get_report(self):
+        refresh_daily_stats(self.site.id, self.date, date(2021, 6, 16))
+
+        # Test the report is read from the stats alone.
+        with self.assertNumQueries(1):
+            report = get_report(self.site, self.date, date(2021, 6, 16))
+
+        self.assertEqual(len(report['days']), 3)
+        self.assertEqual(report['totals']['covers'], 10)
+        self.assertEqual(report['totals']['bookings'], 3)
+        self.assertEqual(report['cancellation_rate'], 0.25)
+        self.assertEqual(report['covers_by_hour'], {'12': 2, '18': 2, '19': 6})
+        self.assertEqual(report['party_sizes'], {'2': 2, '6': 1})
@@ -0,0 +1,99 @@
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+
+from model_bakery import baker
+
+
+class ReportViewTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', site_name='A')
+        self.other_site = baker.make('sites.Site', site_name='B')
+        self.user = baker.make('accounts.User', is_manager=False, site=self.site)
+        self.client.force_login(self.user)
+
+        baker.make('reports.DailySiteStats', site=self.site, date=date(2021, 6, 14), covers=4)
+        baker.make('reports.DailySiteStats', site=self.site, date=date(2021, 6, 15), covers=6)
+        baker.make('reports.DailySiteStats', site=self.site, date=date(2021, 6, 16), covers=8)
+
+    def test_view_url_exists_at_desired_location(self):
+        response = self.client.get('/reports/')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_view_url_accessible_by_name(self):
+        response = self.client.get(reverse('reports'))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_view_uses_correct_template(self):
+        response = self.client.get(reverse('reports'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'reports/report.html')
+
+    def test_unauthenticated_request(self):
+        self.client.logout()
+
+        response = self.client.get(reverse('reports'))
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_get_context_data(self):
+        response = self.client.get(
+            reverse('reports') + '?date_from=2021-06-14&date_to=2021-06-15'
+        )
+        report = response.context['report']
+
+        self.assertEqual(report['site'], self.site)
+        self.assertEqual(len(report['days']), 2)
+        self.assertEqual(report['totals']['covers'], 10)
+
+    def test_other_site(self):
+        # Test a User cannot see the report of a Site they do not belong to.
+        response = self.client.get(reverse('reports') + f'?site={self.other_site.id}')
+
+        self.assertEqual(response.status_code, 404)
+
+        response = self.client.get(reverse('reports') + '?site=invalid')
+
+        self.assertEqual(response.status_code, 404)
+
+
+class ReportAPIViewTest(TestCase):
+    def setUp(self):
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+
+        self.site = baker.make('sites.Site')
+        baker.make(
+            'reports.DailySiteStats',
+            site=self.site,
+            date=date(2021, 6, 14),
+            bookings=2,
+            covers=4,
+            covers_by_hour={'18': 4},
+            party_sizes={'2': 2},
+        )
+
+    def test_view_url_accessible_by_name(self):
+        response = self.client.get(
+            reverse('api-reports')
+            + f'?site={self.site.id}&date_from=2021-06-01&date_to=2021-06-30'
+        )
+        data = response.json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['site'], self.site.id)
+        self.assertEqual(data['totals']['covers'], 4)
+        self.assertEqual(data['covers_by_hour'], {'18': 4})
+        self.assertEqual(len(data['days']), 1)
+        self.assertEqual(data['days'][0]['date'], '2021-06-14')
+
+    def test_unauthenticated_request(self):
+        self.client.logout()
+
+        response = self.client.get(reverse('api-reports'))
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,16 @@
+from django.urls import path
+
+from . import api, views
+
+urlpatterns = [
+    path(
+        'reports/',
+        views.ReportView.as_view(),
+        name='reports',
+    ),
+    path(
+        'api/reports/',
+        api.ReportAPIView.as_view(),
+        name='api-reports',
+    ),
+]
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http.response import Http404
+from django.utils import timezone
+from django.views.generic.base import TemplateView
+
+from bookings.filters import get_date_param
+from core.mixins import ReplicaReadMixin
+from sites.models import Site
+from .stats import get_report
+
+
+class ReportMixin:
+    """
+    Mixin to build the report of the Site and date range selected by the query
+    parameters, defaulting to the User's first Site and the last 30 days.
+    """
+
+    default_days = 30
+
+    def get_sites(self):
+        return Site.objects.get_sites(self.request.user).order_by('site_name')
+
+    def get_site(self, sites):
+        site_id = self.request.GET.get('site')
+        if not site_id:
+            return sites.first()
+
+        if not site_id.isdigit() or (site := sites.filter(id=site_id).first()) is None:
+            raise Http404('Site not found')
+        return site
+
+    def get_date_range(self):
+        end = get_date_param(self.request.GET, 'date_to') or timezone.localdate()
+        start = get_date_param(self.request.GET, 'date_from') or end - timedelta(
+            days=self.default_days - 1
+        )
+        return min(start, end), end
+
+    def get_report(self, sites):
+        site = self.get_site(sites)
+        if site is None:
+            return None
+        return get_report(site, *self.get_date_range())
+
+
+class ReportView(LoginRequiredMixin, ReplicaReadMixin, ReportMixin, TemplateView):
+    """
+    View to display a report of a Site's Bookings over a range of dates.
+    """
+
+    template_name = 'reports/report.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        sites = self.get_sites()
+        context['sites'] = sites.only('id', 'site_name')
+        context['report'] = self.get_report(sites)
+        return context
@@ -1,11 +1,21 @@
 from django.contrib import admin
 
-from .models import Site, Table
+from .models import ScheduleOverride, Site, SiteEmailTemplates, Table
+
+
+class SiteEmailTemplatesInline(admin.StackedInline):
+    model = SiteEmailTemplates
+    can_delete = False
+
+
+class ScheduleOverrideInline(admin.TabularInline):
+    model = ScheduleOverride
+    extra = 0
 
 
 @admin.register(Site)
 class SiteAdmin(admin.ModelAdmin):
-    pass
+    inlines = [ScheduleOverrideInline, SiteEmailTemplatesInline]
 
 
 @admin.register(Table)
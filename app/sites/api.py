@@ -0,0 +1,45 @@
+from django.db.models import Prefetch
+
+from rest_framework.generics import ListAPIView, RetrieveAPIView
+
+from core.api import SparseFieldsMixin
+from core.pagination import KeysetCursorPagination
+from .models import Site, Table
+from .serializers import SiteSerializer
+
+
+class SiteAPIMixin(SparseFieldsMixin):
+    """
+    Mixin for the Site API views, scoped to the Sites the User can see.
+    """
+
+    serializer_class = SiteSerializer
+    keyset_ordering = ('site_name',)
+    field_plans = {
+        'id': ('id',),
+        'site_name': ('site_name',),
+        'slug': ('slug',),
+        'booking_duration': ('booking_duration',),
+        'min_party_num': ('min_party_num',),
+        'max_party_num': ('max_party_num',),
+        'early_booking': ('early_booking',),
+        'last_booking': ('last_booking',),
+        'tables': (Prefetch('tables', queryset=Table.objects.only('id', 'site')),),
+    }
+
+    def get_queryset(self):
+        return self.plan_queryset(Site.objects.get_sites(self.request.user))
+
+
+class SiteListAPIView(SiteAPIMixin, ListAPIView):
+    """
+    API view to return the Sites the User can see a page at a time, ordered by name.
+    """
+
+    pagination_class = KeysetCursorPagination
+
+
+class SiteDetailAPIView(SiteAPIMixin, RetrieveAPIView):
+    """
+    API view to return a single Site.
+    """
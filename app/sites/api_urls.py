@@ -0,0 +1,16 @@
+from django.urls import path
+
+from . import api
+
+urlpatterns = [
+    path(
+        'api/sites/',
+        api.SiteListAPIView.as_view(),
+        name='api-site-list',
+    ),
+    path(
+        'api/sites/<pk>/',
+        api.SiteDetailAPIView.as_view(),
+        name='api-site-detail',
+    ),
+]
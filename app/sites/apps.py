@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class SitesConfig(AppConfig):
+    name = 'sites'
+
+    def ready(self):
+        from . import signals
@@ -1,5 +1,8 @@
 from django import forms
+from django.core.exceptions import ValidationError
+from django.utils import timezone
 
+from bookings.cancellation import close_site
 from .models import Site, Table
 
 
@@ -14,7 +17,8 @@ class EmailTemplateForm(forms.Form):
 
     def save(self, site):
         """
-        Save the data to the correct email template.
+        Save the data to the correct email template. The templates are saved along with
+        the Site by its accessors.
         """
         template = self.cleaned_data.get('template')
         email_subject = self.cleaned_data.get('email_subject')
@@ -78,3 +82,44 @@ TableFormSet = forms.inlineformset_factory(
     min_num=1,
     can_delete=True,
 )
+
+
+class SiteClosureForm(forms.Form):
+    """
+    Form for closing a Site over a range of dates, cancelling the Bookings made for them.
+    """
+
+    start_date = forms.DateField(required=True)
+    end_date = forms.DateField(required=True)
+    description = forms.CharField(max_length=150, required=False)
+
+    max_days = 366
+
+    def __init__(self, *args, instance=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.instance = instance
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start_date = cleaned_data.get('start_date')
+        end_date = cleaned_data.get('end_date')
+
+        if start_date and start_date < timezone.localdate():
+            raise ValidationError({'start_date': 'Start date must be today or in the future'})
+        if start_date and end_date and end_date < start_date:
+            raise ValidationError({'end_date': 'End date must be on or after the start date'})
+        if start_date and end_date and (end_date - start_date).days >= self.max_days:
+            message = f'A site can be closed for {self.max_days} days at most'
+            raise ValidationError({'end_date': message})
+
+        return cleaned_data
+
+    def save(self):
+        """Close the Site, returning it as the object of the view."""
+        self.cancelled_count = close_site(
+            self.instance,
+            self.cleaned_data['start_date'],
+            self.cleaned_data['end_date'],
+            self.cleaned_data['description'],
+        )
+        return self.instance
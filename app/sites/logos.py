@@ -0,0 +1,149 @@
+import hashlib
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+
+from PIL import Image, ImageOps, features
+
+from .models import Site
+
+logger = logging.getLogger(__name__)
+
+# Errors of a logo which cannot be read, or a copy which cannot be encoded, such as a
+# KeyError for a format Pillow was built without.
+LOGO_ERRORS = (OSError, ValueError, KeyError, Image.DecompressionBombError)
+
+# The Pillow format and file extension of each format the logo is resized to.
+LOGO_FORMATS = {
+    'webp': ('WEBP', 'webp'),
+    'jpeg': ('JPEG', 'jpg'),
+}
+
+# The Pillow feature of the encoder of each format.
+LOGO_FEATURES = {
+    'webp': 'webp',
+    'jpeg': 'jpg',
+}
+
+
+def get_logo_storage():
+    return Site._meta.get_field('site_logo').storage
+
+
+def get_variant_name(name, digest, width, image_format):
+    """
+    Return the name of a resized copy of a logo, next to the original. The digest of the
+    original is part of the name, so a new logo is never cached under an old url.
+    """
+    root, _ = os.path.splitext(name)
+    return f'{root}_{digest[:8]}_{width}w.{LOGO_FORMATS[image_format][1]}'
+
+
+def get_logo_formats():
+    """Return the formats of LOGO_FORMATS that Pillow was built with an encoder for."""
+    return [
+        image_format
+        for image_format in LOGO_FORMATS
+        if features.check(LOGO_FEATURES[image_format])
+    ]
+
+
+def encode_image(image, image_format):
+    """Return the file of an RGBA image in the given format."""
+    pil_format, _ = LOGO_FORMATS[image_format]
+    if pil_format == 'JPEG':
+        # JPEG has no transparency, so the logo is flattened onto white.
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+
+    buffer = BytesIO()
+    image.save(buffer, pil_format, quality=settings.SITE_LOGO_QUALITY)
+    return ContentFile(buffer.getvalue())
+
+
+def make_logo_variants(name, storage):
+    """
+    Save copies of the logo of the given name resized to each of SITE_LOGO_WIDTHS, in
+    every format Pillow can encode, next to it. Logos narrower than a width are copied at
+    their own width rather than enlarged. Returns the name, format and size of each copy.
+    If a copy fails, those already saved are deleted.
+    """
+    image_formats = get_logo_formats()
+
+    with storage.open(name) as file:
+        content = file.read()
+    digest = hashlib.md5(content).hexdigest()
+    image = ImageOps.exif_transpose(Image.open(BytesIO(content))).convert('RGBA')
+
+    variants = []
+    try:
+        for width in sorted({min(width, image.width) for width in settings.SITE_LOGO_WIDTHS}):
+            height = max(round(image.height * width / image.width), 1)
+            resized = image.resize((width, height), Image.LANCZOS)
+
+            for image_format in image_formats:
+                variant_name = storage.save(
+                    get_variant_name(name, digest, width, image_format),
+                    encode_image(resized, image_format),
+                )
+                variants.append(
+                    {
+                        'name': variant_name,
+                        'format': image_format,
+                        'width': width,
+                        'height': height,
+                    }
+                )
+    except Exception:
+        delete_logo_variants(variants, storage)
+        raise
+
+    return variants
+
+
+def delete_logo_variants(variants, storage):
+    for variant in variants:
+        storage.delete(variant['name'])
+
+
+def generate_logo_variants(site_id, stale_variants=()):
+    """
+    Make the resized copies of the logo of a Site and record them on it, deleting the
+    copies of the logo it replaced. Returns the copies recorded.
+    """
+    storage = get_logo_storage()
+    delete_logo_variants(stale_variants, storage)
+
+    site = Site.objects.filter(id=site_id).first()
+    if site is None or not site.site_logo:
+        return []
+
+    name = site.site_logo.name
+    try:
+        variants = make_logo_variants(name, storage)
+    except LOGO_ERRORS:
+        # The original is still shown, as it is when the copies are not made yet.
+        logger.exception('Failed to resize the logo of Site %s', site_id)
+        return []
+
+    with transaction.atomic():
+        site = Site.objects.select_for_update().filter(id=site_id).first()
+        if site is None or site.site_logo.name != name:
+            # The logo was replaced meanwhile, its own task makes the copies of it.
+            delete_logo_variants(variants, storage)
+            return []
+
+        names = {variant['name'] for variant in variants}
+        delete_logo_variants(
+            [variant for variant in site.site_logo_variants if variant['name'] not in names],
+            storage,
+        )
+        site.site_logo_variants = variants
+        site.save(update_fields=['site_logo_variants'])
+
+    return variants
@@ -0,0 +1,108 @@
+# Generated by Django 3.2 on 2026-10-19 11:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+EMAIL_TEMPLATE_FIELDS = [
+    'client_email_booking_created_subject',
+    'client_email_booking_created_content',
+    'client_email_booking_updated_subject',
+    'client_email_booking_updated_content',
+    'client_email_booking_cancelled_subject',
+    'client_email_booking_cancelled_content',
+    'client_email_booking_reminder_subject',
+    'client_email_booking_reminder_content',
+    'admin_email_booking_created_subject',
+    'admin_email_booking_created_content',
+]
+
+
+def copy_templates_to_model(apps, schema_editor):
+    Site = apps.get_model('sites', 'Site')
+    SiteEmailTemplates = apps.get_model('sites', 'SiteEmailTemplates')
+
+    SiteEmailTemplates.objects.bulk_create(
+        [
+            SiteEmailTemplates(site_id=values.pop('id'), **values)
+            for values in Site.objects.values('id', *EMAIL_TEMPLATE_FIELDS).iterator()
+        ],
+        batch_size=500,
+    )
+
+
+def copy_templates_to_site(apps, schema_editor):
+    Site = apps.get_model('sites', 'Site')
+    SiteEmailTemplates = apps.get_model('sites', 'SiteEmailTemplates')
+
+    for templates in SiteEmailTemplates.objects.values('site_id', *EMAIL_TEMPLATE_FIELDS).iterator():
+        Site.objects.filter(id=templates.pop('site_id')).update(**templates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteEmailTemplates',
+            fields=[
+                ('site', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='email_templates', serialize=False, to='sites.site')),
+                ('client_email_booking_created_subject', models.CharField(default='Your booking has been confirmed', max_length=200)),
+                ('client_email_booking_created_content', models.TextField(default='\nHi {{ client_name }},\n\nYour booking request has been <strong>confirmed</strong>. We look forward to seeing you soon.\n\n<strong>Your booking:</strong>\nName: {{ client_name }}\nEmail: {{ client_email }}\nParty: {{ party }}\nDate: {{ date }} [{{ duration }}]\nLocation: {{ site_name }}\nReference: {{ reference }}\n')),
+                ('client_email_booking_updated_subject', models.CharField(default='Your booking has been updated', max_length=200)),
+                ('client_email_booking_updated_content', models.TextField(default='\nHi {{ client_name }},\n\nYour booking has been <strong>updated</strong>. We look forward to seeing you soon.\n\n<strong>Your updated booking:</strong>\nName: {{ client_name }}\nEmail: {{ client_email }}\nParty: {{ party }}\nDate: {{ date }} [{{ duration }}]\nLocation: {{ site_name }}\nReference: {{ reference }}\n')),
+                ('client_email_booking_cancelled_subject', models.CharField(default='Your booking has been cancelled', max_length=200)),
+                ('client_email_booking_cancelled_content', models.TextField(default='\nHi {{ client_name }},\n\nSorry, we could not accommodate your booking request.\n\n<strong>Your cancelled booking:</strong>\nName: {{ client_name }}\nEmail: {{ client_email }}\nParty: {{ party }}\nDate: {{ date }} [{{ duration }}]\nLocation: {{ site_name }}\nReference: {{ reference }}\n')),
+                ('client_email_booking_reminder_subject', models.CharField(default='Your upcoming booking', max_length=200)),
+                ('client_email_booking_reminder_content', models.TextField(default='\nHi {{ client_name }},\n\nWe look forward to seeing you soon.\n\n<strong>Your booking:</strong>\nName: {{ client_name }}\nEmail: {{ client_email }}\nParty: {{ party }}\nDate: {{ date }} [{{ duration }}]\nLocation: {{ site_name }}\nReference: {{ reference }}\n')),
+                ('admin_email_booking_created_subject', models.CharField(default='New booking', max_length=200)),
+                ('admin_email_booking_created_content', models.TextField(default='\n<strong>A new booking has been created:</strong>\nName: {{ client_name }}\nEmail: {{ client_email }}\nParty: {{ party }}\nDate: {{ date }} [{{ duration }}]\nLocation: {{ site_name }}\nReference: {{ reference }}\n')),
+            ],
+            options={
+                'verbose_name_plural': 'site email templates',
+            },
+        ),
+        migrations.RunPython(copy_templates_to_model, copy_templates_to_site),
+        migrations.RemoveField(
+            model_name='site',
+            name='admin_email_booking_created_content',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='admin_email_booking_created_subject',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_cancelled_content',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_cancelled_subject',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_created_content',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_created_subject',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_reminder_content',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_reminder_subject',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_updated_content',
+        ),
+        migrations.RemoveField(
+            model_name='site',
+            name='client_email_booking_updated_subject',
+        ),
+    ]
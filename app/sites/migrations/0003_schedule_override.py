@@ -0,0 +1,33 @@
+# Generated by Django 3.2 on 2026-10-19 00:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_site_email_templates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleOverride',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('is_closed', models.BooleanField(default=True, verbose_name='closed')),
+                ('opening_hour', models.TimeField(blank=True, null=True)),
+                ('closing_hour', models.TimeField(blank=True, null=True)),
+                ('description', models.CharField(blank=True, max_length=150)),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule_overrides', to='sites.site')),
+            ],
+            options={
+                'ordering': ['date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='scheduleoverride',
+            constraint=models.UniqueConstraint(fields=('site', 'date'), name='unique_site_schedule_date'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-10-19 14:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0003_schedule_override'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='site',
+            name='site_logo_variants',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
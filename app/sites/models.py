@@ -18,6 +18,22 @@ from .constants import (
     default_opening_time,
 )
 from .managers import SiteManager
+from .schedule import DaySchedule, compile_schedule
+
+
+def email_template_property(name):
+    """
+    Return a property reading and writing the given field of the Site's email templates.
+    """
+
+    def getter(site):
+        return getattr(site.get_email_templates(), name)
+
+    def setter(site, value):
+        setattr(site.get_email_templates(), name, value)
+        site._email_templates_changed = True
+
+    return property(getter, setter)
 
 
 class Site(models.Model):
@@ -119,6 +135,8 @@ class Site(models.Model):
         default=2,
     )
     site_logo = models.ImageField(blank=True, upload_to='sites')
+    # Resized copies of the logo, made in the background once it is uploaded.
+    site_logo_variants = models.JSONField(default=list, blank=True, editable=False)
 
     # Schedule settings - hour rounded to nearest 15 minutes.
     mon_opening_hour = models.TimeField(default=default_opening_time)
@@ -144,41 +162,36 @@ class Site(models.Model):
         default=ReminderEmailTimeChoices.BEFORE_24_HOURS,
     )
 
-    # Email templates.
-    client_email_booking_created_subject = models.CharField(
-        max_length=200,
-        default=default_booking_created_subject,
+    # Email templates, stored in SiteEmailTemplates and accessed through the Site.
+    client_email_booking_created_subject = email_template_property(
+        'client_email_booking_created_subject'
     )
-    client_email_booking_created_content = models.TextField(
-        default=default_booking_created_content,
+    client_email_booking_created_content = email_template_property(
+        'client_email_booking_created_content'
     )
-    client_email_booking_updated_subject = models.CharField(
-        max_length=200,
-        default=default_booking_updated_subject,
+    client_email_booking_updated_subject = email_template_property(
+        'client_email_booking_updated_subject'
     )
-    client_email_booking_updated_content = models.TextField(
-        default=default_booking_updated_content,
+    client_email_booking_updated_content = email_template_property(
+        'client_email_booking_updated_content'
     )
-    client_email_booking_cancelled_subject = models.CharField(
-        max_length=200,
-        default=default_booking_cancelled_subject,
+    client_email_booking_cancelled_subject = email_template_property(
+        'client_email_booking_cancelled_subject'
     )
-    client_email_booking_cancelled_content = models.TextField(
-        default=default_booking_cancelled_content,
+    client_email_booking_cancelled_content = email_template_property(
+        'client_email_booking_cancelled_content'
     )
-    client_email_booking_reminder_subject = models.CharField(
-        max_length=200,
-        default=default_booking_reminder_subject,
+    client_email_booking_reminder_subject = email_template_property(
+        'client_email_booking_reminder_subject'
     )
-    client_email_booking_reminder_content = models.TextField(
-        default=default_booking_reminder_content,
+    client_email_booking_reminder_content = email_template_property(
+        'client_email_booking_reminder_content'
     )
-    admin_email_booking_created_subject = models.CharField(
-        max_length=200,
-        default=default_booking_admin_created_subject,
+    admin_email_booking_created_subject = email_template_property(
+        'admin_email_booking_created_subject'
     )
-    admin_email_booking_created_content = models.TextField(
-        default=default_booking_admin_created_content,
+    admin_email_booking_created_content = email_template_property(
+        'admin_email_booking_created_content'
     )
 
     objects = SiteManager()
@@ -189,8 +202,60 @@ class Site(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.site_name)
+
+        adding = self._state.adding
         super().save(*args, **kwargs)
 
+        # Create the email templates with the Site, and save any changes made to them
+        # through the Site's accessors.
+        if adding or getattr(self, '_email_templates_changed', False):
+            email_templates = self.get_email_templates()
+            email_templates.site = self
+            email_templates.save()
+            self._email_templates_changed = False
+
+    def get_logo_variants(self, image_format):
+        """
+        Return the resized copies of the logo in the given format, smallest first, with
+        the url of each.
+        """
+        storage = self.site_logo.storage
+        return [
+            {**variant, 'url': storage.url(variant['name'])}
+            for variant in self.site_logo_variants
+            if variant['format'] == image_format
+        ]
+
+    def get_logo_srcset(self, image_format):
+        return ', '.join(
+            f'{variant["url"]} {variant["width"]}w'
+            for variant in self.get_logo_variants(image_format)
+        )
+
+    @property
+    def logo_webp_srcset(self):
+        return self.get_logo_srcset('webp')
+
+    @property
+    def logo_jpeg_srcset(self):
+        return self.get_logo_srcset('jpeg')
+
+    @property
+    def logo_fallback(self):
+        """Return the smallest JPEG copy of the logo, for browsers without srcset."""
+        variants = self.get_logo_variants('jpeg')
+        return variants[0] if variants else None
+
+    def get_email_templates(self):
+        """
+        Return the Site's email templates, with the defaults if they do not exist yet.
+        """
+        try:
+            return self.email_templates
+        except SiteEmailTemplates.DoesNotExist:
+            self.email_templates = SiteEmailTemplates(site=self)
+            return self.email_templates
+
     def clean(self):
         # General settings
         if self.min_party_num > self.max_party_num:
@@ -202,19 +267,14 @@ class Site(models.Model):
             )
 
         # Schedule settings
-        for day_prefix in self.DAY_PREFIXES:
-            opening_field_name = f'{day_prefix}_opening_hour'
-            closing_field_name = f'{day_prefix}_closing_hour'
-            opening_hour = getattr(self, opening_field_name)
-            closing_hour = getattr(self, closing_field_name)
-
-            if opening_hour > closing_hour:
-                raise ValidationError(
-                    {
-                        opening_field_name: 'Opening time must be before closing time',
-                        closing_field_name: '',
-                    }
-                )
+        for weekday in compile_schedule(self).get_invalid_weekdays():
+            day_prefix = self.DAY_PREFIXES[weekday]
+            raise ValidationError(
+                {
+                    f'{day_prefix}_opening_hour': 'Opening time must be before closing time',
+                    f'{day_prefix}_closing_hour': '',
+                }
+            )
 
 
 class Table(models.Model):
@@ -232,3 +292,108 @@ class Table(models.Model):
 
     def __str__(self):
         return f'{self.table_name} [{self.number_of_seats} Seats]'
+
+
+class ScheduleOverride(models.Model):
+    """
+    Model to override the weekly opening hours of a Site on a specific date, either
+    closing it for the day or opening it for special hours.
+    """
+
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name='schedule_overrides',
+    )
+    date = models.DateField()
+    is_closed = models.BooleanField('closed', default=True)
+    opening_hour = models.TimeField(null=True, blank=True)
+    closing_hour = models.TimeField(null=True, blank=True)
+    description = models.CharField(max_length=150, blank=True)
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(fields=['site', 'date'], name='unique_site_schedule_date')
+        ]
+
+    def __str__(self):
+        if self.is_closed:
+            return f'{self.date} [Closed]'
+        return f'{self.date} [{self.opening_hour} - {self.closing_hour}]'
+
+    def clean(self):
+        if self.is_closed:
+            self.opening_hour = self.closing_hour = None
+            return
+
+        if self.opening_hour is None or self.closing_hour is None:
+            raise ValidationError(
+                {
+                    'opening_hour': 'Opening and closing times are required unless closed',
+                    'closing_hour': '',
+                }
+            )
+
+        if not DaySchedule(self.opening_hour, self.closing_hour).is_valid:
+            raise ValidationError(
+                {
+                    'opening_hour': 'Opening time must be before closing time',
+                    'closing_hour': '',
+                }
+            )
+
+
+class SiteEmailTemplates(models.Model):
+    """
+    Model to store the email templates of a Site. Kept apart from the Site so the large
+    template fields are only loaded when sending or editing emails.
+    """
+
+    site = models.OneToOneField(
+        Site,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='email_templates',
+    )
+    client_email_booking_created_subject = models.CharField(
+        max_length=200,
+        default=default_booking_created_subject,
+    )
+    client_email_booking_created_content = models.TextField(
+        default=default_booking_created_content,
+    )
+    client_email_booking_updated_subject = models.CharField(
+        max_length=200,
+        default=default_booking_updated_subject,
+    )
+    client_email_booking_updated_content = models.TextField(
+        default=default_booking_updated_content,
+    )
+    client_email_booking_cancelled_subject = models.CharField(
+        max_length=200,
+        default=default_booking_cancelled_subject,
+    )
+    client_email_booking_cancelled_content = models.TextField(
+        default=default_booking_cancelled_content,
+    )
+    client_email_booking_reminder_subject = models.CharField(
+        max_length=200,
+        default=default_booking_reminder_subject,
+    )
+    client_email_booking_reminder_content = models.TextField(
+        default=default_booking_reminder_content,
+    )
+    admin_email_booking_created_subject = models.CharField(
+        max_length=200,
+        default=default_booking_admin_created_subject,
+    )
+    admin_email_booking_created_content = models.TextField(
+        default=default_booking_admin_created_content,
+    )
+
+    class Meta:
+        verbose_name_plural = 'site email templates'
+
+    def __str__(self):
+        return f'Email templates of {self.site}'
@@ -0,0 +1,124 @@
+from datetime import date, datetime, time, timedelta
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+# The time of each slot of the day, by slot index.
+SLOT_TIMES = tuple(
+    (datetime.combine(date.min, time()) + timedelta(minutes=x * SLOT_MINUTES)).time()
+    for x in range(SLOTS_PER_DAY)
+)
+
+
+def time_to_slot(value):
+    """Return the index of the slot the given time falls in."""
+    return (value.hour * 60 + value.minute) // SLOT_MINUTES
+
+
+class DaySchedule:
+    """
+    The opening hours of a single day compiled into the time slots which can be booked,
+    from opening to closing time inclusive. A closed day has no slots.
+    """
+
+    __slots__ = ('opening_hour', 'closing_hour', 'slots', 'times')
+
+    def __init__(self, opening_hour=None, closing_hour=None):
+        set_attribute = super().__setattr__
+        set_attribute('opening_hour', opening_hour)
+        set_attribute('closing_hour', closing_hour)
+
+        if self.is_closed or not self.is_valid:
+            set_attribute('slots', ())
+            set_attribute('times', ())
+            return
+
+        # Hours are kept to 15 minute intervals, but an unaligned time is stepped from
+        # as is rather than being snapped to a slot.
+        if opening_hour == SLOT_TIMES[time_to_slot(opening_hour)]:
+            first, last = time_to_slot(opening_hour), time_to_slot(closing_hour)
+            set_attribute('slots', tuple(range(first, last + 1)))
+            set_attribute('times', SLOT_TIMES[first : last + 1])
+        else:
+            times = []
+            current = datetime.combine(date.min, opening_hour)
+            while current.date() == date.min and current.time() <= closing_hour:
+                times.append(current.time())
+                current += timedelta(minutes=SLOT_MINUTES)
+            set_attribute('slots', ())
+            set_attribute('times', tuple(times))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('DaySchedule is immutable')
+
+    def __repr__(self):
+        if self.is_closed:
+            return '<DaySchedule: closed>'
+        return f'<DaySchedule: {self.opening_hour}-{self.closing_hour}>'
+
+    @property
+    def is_closed(self):
+        return self.opening_hour is None or self.closing_hour is None
+
+    @property
+    def is_valid(self):
+        """Return False if the day opens after it closes."""
+        return self.is_closed or self.opening_hour <= self.closing_hour
+
+
+CLOSED = DaySchedule()
+
+
+class CompiledSchedule:
+    """
+    A Site's weekly opening hours and the overrides of them for specific dates, compiled
+    once per Site version so the booking engine reads the slots of a day directly.
+    """
+
+    __slots__ = ('weekly', 'overrides')
+
+    def __init__(self, weekly, overrides=None):
+        super().__setattr__('weekly', tuple(weekly))
+        super().__setattr__('overrides', dict(overrides or {}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CompiledSchedule is immutable')
+
+    def get_day(self, day):
+        """Return the schedule of the given date, or of the given weekday if an int."""
+        if isinstance(day, int):
+            return self.weekly[day]
+        if isinstance(day, datetime):
+            day = day.date()
+        return self.overrides.get(day, self.weekly[day.weekday()])
+
+    def get_invalid_weekdays(self):
+        """Return the weekdays which open after they close."""
+        return [weekday for weekday, day in enumerate(self.weekly) if not day.is_valid]
+
+
+def compile_weekly_schedule(site):
+    """Compile the weekly opening hours of a Site, or snapshot, Monday first."""
+    return [
+        DaySchedule(
+            getattr(site, f'{day}_opening_hour'),
+            getattr(site, f'{day}_closing_hour'),
+        )
+        for day in ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+    ]
+
+
+def compile_schedule(site, overrides=()):
+    """
+    Compile the schedule of a Site from its weekly opening hours and the given
+    ScheduleOverrides.
+    """
+    return CompiledSchedule(
+        compile_weekly_schedule(site),
+        {
+            override.date: CLOSED
+            if override.is_closed
+            else DaySchedule(override.opening_hour, override.closing_hour)
+            for override in overrides
+        },
+    )
@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+from core.api import SparseFieldsSerializerMixin
+from .models import Site
+
+
+class SiteSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Site model.
+    """
+
+    class Meta:
+        model = Site
+        fields = [
+            'id',
+            'site_name',
+            'slug',
+            'booking_duration',
+            'min_party_num',
+            'max_party_num',
+            'early_booking',
+            'last_booking',
+            'tables',
+        ]
+        read_only_fields = fields
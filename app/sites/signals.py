@@ -0,0 +1,76 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch.dispatcher import receiver
+
+from .models import ScheduleOverride, Site, Table
+from .snapshot import invalidate_site_snapshot
+from .tasks import generate_site_logo_variants
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_site(sender, instance, *args, **kwargs):
+    """
+    Invalidate the snapshot of a Site when it changes.
+    """
+    invalidate_site_snapshot(instance.id)
+
+
+@receiver(post_save, sender=Table)
+@receiver(post_delete, sender=Table)
+def invalidate_table_site(sender, instance, *args, **kwargs):
+    """
+    Invalidate the snapshot of a Table's Site when the Table changes.
+    """
+    invalidate_site_snapshot(instance.site_id)
+
+
+@receiver(post_save, sender=ScheduleOverride)
+@receiver(post_delete, sender=ScheduleOverride)
+def invalidate_schedule_override_site(sender, instance, *args, **kwargs):
+    """
+    Invalidate the snapshot of a ScheduleOverride's Site when the override changes.
+    """
+    invalidate_site_snapshot(instance.site_id)
+
+
+@receiver(post_init, sender=Site)
+def keep_site_logo(sender, instance, *args, **kwargs):
+    """
+    Keep the logo a Site is loaded with, to know whether a new one was uploaded when it
+    is saved. A deferred logo is not loaded to compare.
+    """
+    if instance.pk is None:
+        instance._loaded_site_logo = ''
+    elif 'site_logo' in instance.get_deferred_fields():
+        instance._loaded_site_logo = None
+    else:
+        instance._loaded_site_logo = instance.site_logo.name or ''
+
+
+@receiver(pre_save, sender=Site)
+def reset_site_logo_variants(sender, instance, *args, **kwargs):
+    """
+    Stop showing the resized copies of a Site's logo once it is replaced, until those of
+    the new logo are made.
+    """
+    loaded = getattr(instance, '_loaded_site_logo', None)
+    instance._stale_logo_variants = None
+    if loaded is not None and loaded != (instance.site_logo.name or ''):
+        instance._stale_logo_variants = instance.site_logo_variants
+        instance.site_logo_variants = []
+
+
+@receiver(post_save, sender=Site)
+def queue_site_logo_variants(sender, instance, *args, **kwargs):
+    """
+    Make the resized copies of a Site's logo in the background when it is uploaded, once
+    the upload is committed.
+    """
+    stale_variants = getattr(instance, '_stale_logo_variants', None)
+    instance._loaded_site_logo = instance.site_logo.name or ''
+    instance._stale_logo_variants = None
+    if stale_variants is None:
+        return
+
+    transaction.on_commit(lambda: generate_site_logo_variants.delay(instance.id, stale_variants))
@@ -0,0 +1,166 @@
+import uuid
+from collections import namedtuple
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from core.replicas import use_primary
+from .schedule import compile_schedule
+
+# Process-local snapshots by Site id. Each is validated against the version in the
+# shared cache before use, so a change made in any process is seen by all of them.
+_snapshots = {}
+
+TableSnapshot = namedtuple('TableSnapshot', ['id', 'table_name', 'number_of_seats'])
+
+
+def get_version_cache_key(site_id):
+    return f'sites.snapshot.version.{site_id}'
+
+
+class SiteSnapshot:
+    """
+    Immutable copy of a Site's settings, compiled schedule and Tables, shared by
+    everything handling a booking rather than each re-reading the Site. Attribute names
+    match those of the Site so a snapshot can be used in its place when reading settings.
+    """
+
+    SETTINGS = (
+        'site_name',
+        'slug',
+        'booking_duration',
+        'min_party_num',
+        'max_party_num',
+        'early_booking',
+        'last_booking',
+        'booking_time_before_closing',
+        'upward_scaling_policy',
+    )
+
+    __slots__ = ('id', 'version', 'schedule', 'tables', *SETTINGS)
+
+    def __init__(self, site, tables, version, overrides=()):
+        set_attribute = super().__setattr__
+        set_attribute('id', site.id)
+        set_attribute('version', version)
+
+        for name in self.SETTINGS:
+            set_attribute(name, getattr(site, name))
+
+        set_attribute('schedule', compile_schedule(site, overrides))
+        set_attribute(
+            'tables',
+            tuple(
+                TableSnapshot(table.id, table.table_name, table.number_of_seats)
+                for table in sorted(tables, key=lambda table: (table.number_of_seats, table.id))
+            ),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError('SiteSnapshot is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('SiteSnapshot is immutable')
+
+    def __repr__(self):
+        return f'<SiteSnapshot: {self.site_name} [{self.version}]>'
+
+    def get_day(self, day):
+        """Return the compiled schedule of the given date."""
+        return self.schedule.get_day(day)
+
+    def get_seat_choices(self):
+        """Return the number of seats of each Table, smallest first."""
+        return [table.number_of_seats for table in self.tables]
+
+    def get_tables(self, seats):
+        """Return the Tables with one of the given numbers of seats."""
+        return [table for table in self.tables if table.number_of_seats in seats]
+
+
+def get_version(site_id):
+    key = get_version_cache_key(site_id)
+    version = cache.get(key)
+
+    if version is None:
+        # No version yet, or it was evicted. Only the first process to add one wins.
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+
+    return version
+
+
+def build_site_snapshot(site_id, version):
+    from .models import ScheduleOverride, Site
+
+    # Overrides in the past are no longer needed, yesterday's are kept for timezones.
+    overrides = ScheduleOverride.objects.filter(
+        date__gte=timezone.localdate() - timedelta(days=1)
+    )
+    # Read from the primary, as a snapshot is kept until the next change of the Site.
+    with use_primary():
+        site = Site.objects.prefetch_related(
+            'tables', Prefetch('schedule_overrides', queryset=overrides)
+        ).get(id=site_id)
+    return SiteSnapshot(site, site.tables.all(), version, site.schedule_overrides.all())
+
+
+def get_site_snapshot(site):
+    """
+    Return the snapshot of the given Site, or Site id, building it if this process has
+    no snapshot of its current version. A snapshot is returned as is.
+    """
+    if isinstance(site, SiteSnapshot):
+        return site
+
+    site_id = getattr(site, 'id', site)
+
+    # The version is read before the Site so a change committed in between leaves a
+    # newer snapshot under the old version, to be rebuilt next time, never the reverse.
+    version = get_version(site_id)
+    snapshot = _snapshots.get(site_id)
+
+    if snapshot is None or snapshot.version != version:
+        snapshot = build_site_snapshot(site_id, version)
+
+        # A snapshot of changes that are not committed yet could outlive a rollback,
+        # as the version is only replaced on commit, so it is not kept until then.
+        if not is_invalidation_pending(site_id):
+            _snapshots[site_id] = snapshot
+
+    return snapshot
+
+
+class VersionReplacement:
+    """Commit callback replacing the version of a Site, so all processes rebuild it."""
+
+    def __init__(self, site_id):
+        self.site_id = site_id
+        self.done = False
+
+    def __call__(self):
+        cache.set(get_version_cache_key(self.site_id), uuid.uuid4().hex, None)
+        self.done = True
+
+
+def is_invalidation_pending(site_id):
+    """
+    Return whether the given Site was invalidated in the current transaction. Django
+    drops the commit callbacks of a transaction or savepoint that is rolled back.
+    """
+    return any(
+        isinstance(func, VersionReplacement) and func.site_id == site_id and not func.done
+        for _, func in transaction.get_connection().run_on_commit
+    )
+
+
+def invalidate_site_snapshot(site_id):
+    """
+    Discard the snapshot of the given Site. This process drops its copy immediately and
+    the other processes once the change is committed and the version is replaced.
+    """
+    _snapshots.pop(site_id, None)
+    transaction.on_commit(VersionReplacement(site_id))
@@ -0,0 +1,12 @@
+from celery import shared_task
+
+from .logos import generate_logo_variants
+
+
+@shared_task
+def generate_site_logo_variants(site_id, stale_variants=()):
+    """
+    Make the resized copies of the logo of a Site, once uploaded, and delete those of
+    the logo it replaced.
+    """
+    return len(generate_logo_variants(site_id, stale_variants))
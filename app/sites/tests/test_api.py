@@ -0,0 +1,46 @@
+from django.urls import reverse
+
+from model_bakery import baker
+from rest_framework.test import APITestCase
+
+
+class SiteAPITest(APITestCase):
+    def setUp(self):
+        self.site_1 = baker.make('sites.Site', site_name='Site B')
+        self.site_2 = baker.make('sites.Site', site_name='Site A')
+        self.table = baker.make('sites.Table', site=self.site_1)
+
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+
+        self.url = reverse('api-site-list')
+
+    def test_list(self):
+        # Session, User, Sites, Tables.
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+
+        self.assertEqual(
+            [site['site_name'] for site in response.data['results']],
+            ['Site A', 'Site B'],
+        )
+        self.assertEqual(response.data['results'][1]['tables'], [self.table.id])
+
+    def test_list_scoped_to_site(self):
+        user = baker.make('accounts.User', is_manager=False, site=self.site_1)
+        self.client.force_login(user)
+
+        response = self.client.get(self.url, {'fields': 'id'})
+
+        self.assertEqual(response.data['results'], [{'id': self.site_1.id}])
+
+    def test_detail(self):
+        response = self.client.get(
+            reverse('api-site-detail', kwargs={'pk': self.site_2.id}),
+            {'fields': 'site_name,booking_duration'},
+        )
+
+        self.assertEqual(
+            response.data,
+            {'site_name': 'Site A', 'booking_duration': self.site_2.booking_duration},
+        )
@@ -1,8 +1,11 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
 
 from model_bakery import baker
 
-from ..forms import EmailTemplateForm, TableFormSet
+from ..forms import EmailTemplateForm, SiteClosureForm, TableFormSet
 
 
 class EmailTemplateFormTest(TestCase):
@@ -114,3 +117,44 @@ class TableFormSetTest(TestCase):
 
         self.assertFalse(formset.is_valid())
         self.assertEqual(formset.total_error_count(), 2)
+
+
+class SiteClosureFormTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.today = timezone.localdate()
+
+    def test_valid(self):
+        form = SiteClosureForm(
+            data={'start_date': self.today, 'end_date': self.today + timedelta(days=3)},
+            instance=self.site,
+        )
+
+        self.assertTrue(form.is_valid())
+
+    def test_start_date_in_past(self):
+        form = SiteClosureForm(
+            data={'start_date': self.today - timedelta(days=1), 'end_date': self.today},
+            instance=self.site,
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('start_date', form.errors)
+
+    def test_end_date_before_start_date(self):
+        form = SiteClosureForm(
+            data={'start_date': self.today + timedelta(days=1), 'end_date': self.today},
+            instance=self.site,
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('end_date', form.errors)
+
+    def test_range_too_long(self):
+        form = SiteClosureForm(
+            data={'start_date': self.today, 'end_date': self.today + timedelta(days=366)},
+            instance=self.site,
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('end_date', form.errors)
@@ -0,0 +1,167 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from model_bakery import baker
+from PIL import Image, features
+
+from ..logos import encode_image, generate_logo_variants, get_logo_formats, get_logo_storage
+from ..models import Site
+
+
+def make_logo(size=(1000, 500), image_format='PNG', mode='RGBA'):
+    buffer = BytesIO()
+    Image.new(mode, size, (255, 0, 0, 128) if mode == 'RGBA' else 'red').save(
+        buffer, image_format
+    )
+    return SimpleUploadedFile(f'logo.{image_format.lower()}', buffer.getvalue())
+
+
+@override_settings(SITE_LOGO_WIDTHS=(160, 320, 640))
+class SiteLogoTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def exists(self, name):
+        return os.path.exists(os.path.join(self.media_root, name))
+
+
+class GenerateLogoVariantsTest(SiteLogoTestCase):
+    def test_variants_made_on_upload(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            site = baker.make('sites.Site', site_logo=make_logo())
+
+        site.refresh_from_db()
+        variants = site.site_logo_variants
+        self.assertEqual(
+            [(variant['format'], variant['width'], variant['height']) for variant in variants],
+            [
+                (image_format, width, height)
+                for width, height in ((160, 80), (320, 160), (640, 320))
+                for image_format in get_logo_formats()
+            ],
+        )
+        for variant in variants:
+            self.assertTrue(self.exists(variant['name']))
+            self.assertEqual(os.path.dirname(variant['name']), 'sites')
+        with Image.open(os.path.join(self.media_root, site.logo_fallback['name'])) as image:
+            self.assertEqual((image.format, image.size), ('JPEG', (160, 80)))
+
+    def test_formats_without_encoder_skipped(self):
+        # Test a logo is still resized to JPEG by a Pillow built without WebP.
+        with patch('sites.logos.features.check', side_effect=lambda feature: feature == 'jpg'):
+            with self.captureOnCommitCallbacks(execute=True):
+                site = baker.make('sites.Site', site_logo=make_logo())
+
+        site.refresh_from_db()
+        self.assertEqual(
+            [variant['format'] for variant in site.site_logo_variants], ['jpeg'] * 3
+        )
+        self.assertEqual(site.logo_webp_srcset, '')
+        self.assertIsNotNone(site.logo_fallback)
+
+    def test_small_logo_not_enlarged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            site = baker.make('sites.Site', site_logo=make_logo(size=(200, 100)))
+
+        site.refresh_from_db()
+        self.assertEqual(
+            sorted({variant['width'] for variant in site.site_logo_variants}), [160, 200]
+        )
+
+    def test_replaced_logo_variants_deleted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            site = baker.make('sites.Site', site_logo=make_logo())
+        site.refresh_from_db()
+        old_variants = site.site_logo_variants
+
+        site.site_logo = make_logo(image_format='JPEG', mode='RGB')
+        with self.captureOnCommitCallbacks() as callbacks:
+            site.save()
+
+        # Test the old copies stop being shown as soon as the logo is replaced.
+        self.assertEqual(Site.objects.get(id=site.id).site_logo_variants, [])
+
+        for callback in callbacks:
+            callback()
+        for variant in old_variants:
+            self.assertFalse(self.exists(variant['name']))
+        site.refresh_from_db()
+        self.assertEqual(len(site.site_logo_variants), 3 * len(get_logo_formats()))
+
+    def test_other_changes_not_queued(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            site = baker.make('sites.Site', site_logo=make_logo())
+        site.refresh_from_db()
+
+        site.site_name = 'Renamed'
+        with patch('sites.signals.generate_site_logo_variants') as mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                site.save()
+
+        mock.delay.assert_not_called()
+
+    def test_invalid_logo(self):
+        site = baker.make('sites.Site')
+        Site.objects.filter(id=site.id).update(
+            site_logo=get_logo_storage().save('sites/logo.png', SimpleUploadedFile('', b'x'))
+        )
+
+        with self.assertLogs('sites.logos', 'ERROR'):
+            self.assertEqual(generate_logo_variants(site.id), [])
+
+    def test_encoder_error(self):
+        # Test the copies saved before one fails to encode are deleted.
+        site = baker.make('sites.Site', site_logo=make_logo())
+        encoded = encode_image(Image.new('RGBA', (1, 1)), 'jpeg')
+
+        with patch('sites.logos.encode_image', side_effect=[encoded, KeyError('WEBP')]):
+            with self.assertLogs('sites.logos', 'ERROR'):
+                self.assertEqual(generate_logo_variants(site.id), [])
+
+        self.assertEqual(os.listdir(os.path.join(self.media_root, 'sites')), ['logo.png'])
+
+    def test_no_logo(self):
+        site = baker.make('sites.Site')
+
+        self.assertEqual(generate_logo_variants(site.id), [])
+
+
+class SiteLogoSrcsetTest(SiteLogoTestCase):
+    def test_srcset(self):
+        site = baker.make('sites.Site')
+        site.site_logo_variants = [
+            {'name': 'sites/logo_160w.webp', 'format': 'webp', 'width': 160, 'height': 80},
+            {'name': 'sites/logo_160w.jpg', 'format': 'jpeg', 'width': 160, 'height': 80},
+            {'name': 'sites/logo_320w.webp', 'format': 'webp', 'width': 320, 'height': 160},
+        ]
+
+        self.assertEqual(
+            site.logo_webp_srcset,
+            '/mediafiles/sites/logo_160w.webp 160w, /mediafiles/sites/logo_320w.webp 320w',
+        )
+        self.assertEqual(site.logo_fallback['url'], '/mediafiles/sites/logo_160w.jpg')
+
+    def test_site_list(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            site = baker.make('sites.Site', site_logo=make_logo())
+
+        response = self.client.get(reverse('frontend-site-list'))
+
+        site.refresh_from_db()
+        self.assertContains(response, site.logo_jpeg_srcset)
+        if features.check('webp'):
+            self.assertContains(response, site.logo_webp_srcset)
+            self.assertContains(response, 'type="image/webp"')
+        else:
+            self.assertNotContains(response, 'type="image/webp"')
@@ -5,6 +5,9 @@ from django.test import TestCase
 
 from model_bakery import baker
 
+from ..constants import default_booking_admin_created_subject, default_booking_created_subject
+from ..models import Site, SiteEmailTemplates
+
 
 class SiteTest(TestCase):
     def setUp(self):
@@ -47,6 +50,93 @@ class SiteTest(TestCase):
                 self.site.clean()
 
 
+class SiteEmailTemplatesTest(TestCase):
+    def test_created_with_site(self):
+        site = baker.make('sites.Site')
+
+        self.assertTrue(SiteEmailTemplates.objects.filter(site=site).exists())
+        self.assertEqual(
+            site.client_email_booking_created_subject, default_booking_created_subject
+        )
+
+    def test_accessors(self):
+        site = baker.make('sites.Site')
+        site = Site.objects.get(id=site.id)
+
+        site.client_email_booking_created_subject = 'Subject'
+        site.client_email_booking_created_content = 'Content'
+        site.save()
+
+        templates = SiteEmailTemplates.objects.get(site=site)
+        self.assertEqual(templates.client_email_booking_created_subject, 'Subject')
+        self.assertEqual(templates.client_email_booking_created_content, 'Content')
+
+    def test_accessors_without_templates(self):
+        site = baker.make('sites.Site')
+        SiteEmailTemplates.objects.filter(site=site).delete()
+        site = Site.objects.get(id=site.id)
+
+        # Test the defaults are used until the templates are saved.
+        self.assertEqual(
+            site.admin_email_booking_created_subject, default_booking_admin_created_subject
+        )
+
+        site.admin_email_booking_created_subject = 'Subject'
+        site.save()
+
+        self.assertEqual(
+            SiteEmailTemplates.objects.get(site=site).admin_email_booking_created_subject,
+            'Subject',
+        )
+
+    def test_site_save_without_changes(self):
+        site = Site.objects.select_related('email_templates').get(id=baker.make('sites.Site').id)
+
+        # Test the templates are not saved again when unchanged.
+        with self.assertNumQueries(1):
+            site.save()
+
+
+class ScheduleOverrideTest(TestCase):
+    def setUp(self):
+        self.override = baker.make('sites.ScheduleOverride', date=datetime.date(2021, 6, 14))
+
+    def test_str(self):
+        self.assertEqual('2021-06-14 [Closed]', self.override.__str__())
+
+        self.override.is_closed = False
+        self.override.opening_hour = datetime.time(12, 0)
+        self.override.closing_hour = datetime.time(13, 0)
+
+        self.assertEqual('2021-06-14 [12:00:00 - 13:00:00]', self.override.__str__())
+
+    def test_clean_closed(self):
+        # Test the hours of a closed date are cleared.
+        self.override.opening_hour = datetime.time(12, 0)
+        self.override.closing_hour = datetime.time(13, 0)
+        self.override.clean()
+
+        self.assertIsNone(self.override.opening_hour)
+        self.assertIsNone(self.override.closing_hour)
+
+    def test_clean_opening_times(self):
+        self.override.is_closed = False
+
+        # Test both hours are required when open.
+        with self.assertRaises(ValidationError):
+            self.override.clean()
+
+        # Test the closing hour cannot be before the opening hour.
+        self.override.opening_hour = datetime.time(13, 0)
+        self.override.closing_hour = datetime.time(12, 0)
+
+        with self.assertRaises(ValidationError):
+            self.override.clean()
+
+        self.override.closing_hour = datetime.time(14, 0)
+        self.override.clean()
+
+
 class TableTest(TestCase):
     def setUp(self):
         self.table = baker.make('sites.Table')
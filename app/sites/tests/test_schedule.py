@@ -0,0 +1,70 @@
+from datetime import date, datetime, time
+
+from django.test import SimpleTestCase
+
+from ..schedule import CLOSED, SLOT_TIMES, CompiledSchedule, DaySchedule, time_to_slot
+
+
+class DayScheduleTest(SimpleTestCase):
+    def test_slots(self):
+        day = DaySchedule(time(12, 0), time(13, 0))
+
+        self.assertEqual(day.slots, (48, 49, 50, 51, 52))
+        self.assertEqual(
+            day.times, (time(12, 0), time(12, 15), time(12, 30), time(12, 45), time(13, 0))
+        )
+        self.assertEqual([SLOT_TIMES[slot] for slot in day.slots], list(day.times))
+
+    def test_slots_unaligned(self):
+        # Test unaligned hours are stepped from as is.
+        day = DaySchedule(time(12, 10), time(12, 40))
+
+        self.assertEqual(day.times, (time(12, 10), time(12, 25), time(12, 40)))
+
+        # Test stepping stops at midnight.
+        day = DaySchedule(time(23, 50), time(23, 59))
+
+        self.assertEqual(day.times, (time(23, 50),))
+
+    def test_closed(self):
+        self.assertTrue(CLOSED.is_closed)
+        self.assertTrue(CLOSED.is_valid)
+        self.assertEqual(CLOSED.times, ())
+
+    def test_invalid(self):
+        day = DaySchedule(time(13, 0), time(12, 0))
+
+        self.assertFalse(day.is_valid)
+        self.assertEqual(day.times, ())
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            CLOSED.opening_hour = time(12, 0)
+
+    def test_time_to_slot(self):
+        self.assertEqual(time_to_slot(time(0, 0)), 0)
+        self.assertEqual(time_to_slot(time(12, 20)), 49)
+        self.assertEqual(time_to_slot(time(23, 45)), 95)
+
+
+class CompiledScheduleTest(SimpleTestCase):
+    def setUp(self):
+        self.weekly = [DaySchedule(time(9, 0), time(17, 0)) for _ in range(7)]
+        self.override = DaySchedule(time(18, 0), time(20, 0))
+        self.schedule = CompiledSchedule(
+            self.weekly, {date(2021, 6, 14): self.override, date(2021, 6, 15): CLOSED}
+        )
+
+    def test_get_day(self):
+        # Test overrides take precedence over the weekday.
+        self.assertIs(self.schedule.get_day(date(2021, 6, 14)), self.override)
+        self.assertIs(self.schedule.get_day(datetime(2021, 6, 15, 12, 0)), CLOSED)
+        self.assertIs(self.schedule.get_day(date(2021, 6, 16)), self.weekly[2])
+        self.assertIs(self.schedule.get_day(0), self.weekly[0])
+
+    def test_get_invalid_weekdays(self):
+        self.assertEqual(self.schedule.get_invalid_weekdays(), [])
+
+        self.weekly[4] = DaySchedule(time(13, 0), time(12, 0))
+
+        self.assertEqual(CompiledSchedule(self.weekly).get_invalid_weekdays(), [4])
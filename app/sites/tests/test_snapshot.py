@@ -0,0 +1,144 @@
+from datetime import date, time, timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+
+from model_bakery import baker
+
+from ..snapshot import (
+    SiteSnapshot,
+    _snapshots,
+    get_site_snapshot,
+    get_version_cache_key,
+    invalidate_site_snapshot,
+)
+
+
+class SiteSnapshotTest(TestCase):
+    def setUp(self):
+        # Committed, so snapshots are kept as they would be outside of a test.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.site = baker.make(
+                'sites.Site',
+                mon_opening_hour=time(9),
+                mon_closing_hour=time(17),
+            )
+            self.table_6 = baker.make('sites.Table', site=self.site, number_of_seats=6)
+            self.table_2 = baker.make('sites.Table', site=self.site, number_of_seats=2)
+            self.table_4 = baker.make('sites.Table', site=self.site, number_of_seats=4)
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+    def test_get_site_snapshot(self):
+        snapshot = get_site_snapshot(self.site)
+
+        self.assertIsInstance(snapshot, SiteSnapshot)
+        self.assertEqual(snapshot.id, self.site.id)
+        self.assertEqual(snapshot.booking_duration, self.site.booking_duration)
+        self.assertEqual(snapshot.get_day(0).opening_hour, time(9))
+        self.assertEqual(snapshot.get_day(0).closing_hour, time(17))
+        self.assertEqual(snapshot.get_seat_choices(), [2, 4, 6])
+        self.assertEqual(
+            [table.id for table in snapshot.get_tables({2, 6})],
+            [self.table_2.id, self.table_6.id],
+        )
+
+        # A snapshot or Site id can be passed in place of the Site.
+        self.assertIs(get_site_snapshot(snapshot), snapshot)
+        self.assertIs(get_site_snapshot(self.site.id), snapshot)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = get_site_snapshot(self.site)
+
+        with self.assertRaises(AttributeError):
+            snapshot.booking_duration = 0
+
+        with self.assertRaises(AttributeError):
+            del snapshot.site_name
+
+        with self.assertRaises(AttributeError):
+            snapshot.other = 1
+
+    def test_snapshot_is_reused(self):
+        snapshot = get_site_snapshot(self.site)
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_site_snapshot(self.site), snapshot)
+
+    def test_snapshot_invalidated_on_change(self):
+        snapshot = get_site_snapshot(self.site)
+
+        self.site.booking_duration = 60
+        self.site.save()
+
+        self.assertEqual(get_site_snapshot(self.site).booking_duration, 60)
+
+        table = baker.make('sites.Table', site=self.site, number_of_seats=8)
+
+        self.assertEqual(get_site_snapshot(self.site).get_seat_choices(), [2, 4, 6, 8])
+
+        table.delete()
+
+        self.assertEqual(get_site_snapshot(self.site).get_seat_choices(), [2, 4, 6])
+        self.assertIsNot(get_site_snapshot(self.site), snapshot)
+
+    def test_snapshot_invalidated_on_schedule_override(self):
+        day = date.today() + timedelta(days=7)
+        get_site_snapshot(self.site)
+
+        override = baker.make('sites.ScheduleOverride', site=self.site, date=day)
+
+        self.assertTrue(get_site_snapshot(self.site).get_day(day).is_closed)
+
+        override.delete()
+
+        self.assertFalse(get_site_snapshot(self.site).get_day(day).is_closed)
+
+    def test_snapshot_not_kept_until_commit(self):
+        booking_duration = self.site.booking_duration
+        get_site_snapshot(self.site)
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.site.booking_duration = 60
+                self.site.save()
+
+                self.assertEqual(get_site_snapshot(self.site).booking_duration, 60)
+                self.assertNotIn(self.site.id, _snapshots)
+                raise RuntimeError
+
+        # The change was rolled back under the same version, and is not served.
+        self.assertEqual(get_site_snapshot(self.site).booking_duration, booking_duration)
+
+    def test_snapshot_kept_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.site.booking_duration = 60
+            self.site.save()
+
+            get_site_snapshot(self.site)
+
+        snapshot = get_site_snapshot(self.site)
+
+        self.assertEqual(snapshot.booking_duration, 60)
+        self.assertIs(get_site_snapshot(self.site), snapshot)
+
+    def test_invalidate_site_snapshot(self):
+        snapshot = get_site_snapshot(self.site)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_site_snapshot(self.site.id)
+
+        self.assertNotEqual(cache.get(get_version_cache_key(self.site.id)), snapshot.version)
+
+    def test_snapshot_rebuilt_on_new_version(self):
+        # Another process changing the Site replaces the version.
+        snapshot = get_site_snapshot(self.site)
+        cache.set(get_version_cache_key(self.site.id), 'other', None)
+
+        new_snapshot = get_site_snapshot(self.site)
+
+        self.assertIsNot(new_snapshot, snapshot)
+        self.assertEqual(new_snapshot.version, 'other')
@@ -350,6 +350,51 @@ class SiteDetailCapacityViewTest(TestCase):
         )
 
 
+class SiteDetailClosuresViewTest(TestCase):
+    def setUp(self):
+        self.user = baker.make('accounts.User', is_manager=True)
+        self.client.force_login(self.user)
+
+        self.site = baker.make('sites.Site')
+
+    def test_view_url_exists_at_desired_location(self):
+        response = self.client.get(f'/sites/{self.site.id}/closures/')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_view_uses_correct_template(self):
+        response = self.client.get(reverse('site-detail-closures', args=[self.site.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'sites/site_detail_closures.html')
+
+    def test_unauthenticated_request(self):
+        self.client.logout()
+
+        response = self.client.get(reverse('site-detail-closures', args=[self.site.id]))
+
+        self.assertTrue(response.status_code, 302)
+
+    def test_post(self):
+        start_date = datetime.date.today() + datetime.timedelta(days=1)
+        data = {
+            'start_date': start_date,
+            'end_date': start_date + datetime.timedelta(days=1),
+            'description': 'Holiday',
+        }
+
+        response = self.client.post(
+            reverse('site-detail-closures', args=[self.site.id]), data=data
+        )
+
+        self.assertEqual(self.site.schedule_overrides.filter(is_closed=True).count(), 2)
+        self.assertRedirects(
+            response,
+            expected_url=reverse('site-detail-closures', args=[self.site.id]),
+            fetch_redirect_response=False,
+        )
+
+
 class SiteDetailEmailViewTest(TestCase):
     def setUp(self):
         self.user = baker.make('accounts.User', is_manager=True)
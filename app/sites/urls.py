@@ -28,6 +28,11 @@ urlpatterns = [
         views.SiteDetailCapacityView.as_view(),
         name='site-detail-capacity',
     ),
+    path(
+        '<pk>/closures/',
+        views.SiteDetailClosuresView.as_view(),
+        name='site-detail-closures',
+    ),
     path(
         '<pk>/email/',
         views.SiteDetailEmailView.as_view(),
@@ -5,14 +5,15 @@ from django.http.response import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.urls.base import reverse_lazy
+from django.utils import timezone
 from django.views.generic import CreateView, FormView, ListView, UpdateView
 
 from bookings.utils import round_time
 from core.fields import BooleanSelectField
 from core.mixins import ManagerAccessMixin
-from .forms import EmailTemplateForm, TableFormSet
+from .forms import EmailTemplateForm, SiteClosureForm, TableFormSet
 from .mixins import SiteSettingsMixin
-from .models import Site
+from .models import ScheduleOverride, Site
 
 
 class SiteListView(LoginRequiredMixin, ListView):
@@ -149,6 +150,36 @@ class SiteDetailCapacityView(LoginRequiredMixin, SiteSettingsMixin, UpdateView):
         return reverse('site-detail-capacity', args=[self.object.id])
 
 
+class SiteDetailClosuresView(LoginRequiredMixin, SiteSettingsMixin, UpdateView):
+    """
+    View to display the upcoming closures of a Site and close it over a range of dates.
+    """
+
+    template_name = 'sites/site_detail_closures.html'
+    form_class = SiteClosureForm
+    tab_name = 'closures'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['closures'] = ScheduleOverride.objects.filter(
+            site=self.object, is_closed=True, date__gte=timezone.localdate()
+        )
+        return context
+
+    def get_success_message(self, cleaned_data):
+        return (
+            f'Site closed from {cleaned_data["start_date"]} to {cleaned_data["end_date"]}, '
+            f'{self.form.cancelled_count} booking(s) cancelled'
+        )
+
+    def form_valid(self, form):
+        self.form = form
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        return reverse('site-detail-closures', args=[self.object.id])
+
+
 class SiteDetailEmailView(LoginRequiredMixin, SiteSettingsMixin, UpdateView):
     """
     View to display the email settings for a Site.
@@ -163,6 +194,9 @@ class SiteDetailEmailView(LoginRequiredMixin, SiteSettingsMixin, UpdateView):
     success_message = 'Site successfully updated'
     tab_name = 'email'
 
+    def get_queryset(self):
+        return super().get_queryset().select_related('email_templates')
+
     def get_form(self, form_class=None):
         form = super().get_form(form_class=form_class)
         form.fields['send_admin_notification_email'] = BooleanSelectField()
@@ -184,7 +218,7 @@ class SiteDetailEmailTemplateView(LoginRequiredMixin, SuccessMessageMixin, FormV
         raise Http404
 
     def get_object(self):
-        queryset = Site.objects.get_sites(self.request.user)
+        queryset = Site.objects.get_sites(self.request.user).select_related('email_templates')
         return get_object_or_404(queryset, pk=self.kwargs['pk'])
 
     def form_valid(self, form):
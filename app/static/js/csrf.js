@@ -0,0 +1,10 @@
+// Fill in the CSRF token of the forms of cached pages, which are rendered without one.
+document.querySelectorAll('input[data-csrf-url]').forEach(function (input) {
+    fetch(input.dataset.csrfUrl, { credentials: 'same-origin' })
+        .then(function (response) {
+            return response.json();
+        })
+        .then(function (data) {
+            input.value = data.token;
+        });
+});
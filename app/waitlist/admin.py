@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import WaitlistEntry
+
+
+@admin.register(WaitlistEntry)
+class WaitlistEntryAdmin(admin.ModelAdmin):
+    list_display = ['client_name', 'site', 'date', 'party', 'status', 'created_at']
+    list_filter = ['site', 'status']
+    date_hierarchy = 'date'
@@ -0,0 +1,19 @@
+from post_office import mail
+
+
+def send_waitlist_notification_email(entry):
+    """
+    Send an email to the Client of the given WaitlistEntry when a time is free.
+    """
+    date = entry.date.strftime('%d/%m/%Y')
+    time = entry.matched_time.strftime('%H:%M')
+
+    mail.send(
+        entry.client_email,
+        subject=f'A table is free at {entry.site.site_name}',
+        message=(
+            f'Hi {entry.client_name},\n\n'
+            f'A table for {entry.party} is now free at {entry.site.site_name} on {date} '
+            f'at {time}. Tables are not held, so book soon to secure it.'
+        ),
+    )
@@ -0,0 +1,58 @@
+from django.utils import timezone
+
+from bookings.batch import evaluate_group
+from .email import send_waitlist_notification_email
+from .models import WaitlistEntry
+
+
+def match_waitlist(site_id, date):
+    """
+    Re-evaluate the waiting entries of a Site on the given date against its
+    availability, and notify those a time is now free for in the order they joined.
+    The availability of each party size is found in a single pass of the booking
+    engine, with the booked Tables of the date loaded once. Returns the entries
+    notified.
+    """
+    entries = list(
+        WaitlistEntry.objects.filter(
+            site_id=site_id,
+            date=date,
+            status=WaitlistEntry.StatusChoices.WAITING,
+        )
+        .select_related('site')
+        .order_by('created_at', 'id')
+    )
+    if not entries:
+        return []
+
+    available_time_slots = evaluate_group(site_id, date, sorted({x.party for x in entries}))
+    now = timezone.now()
+    notified = []
+
+    for entry in entries:
+        time_slots = available_time_slots[entry.party]
+
+        # The date or party size can no longer be booked.
+        if isinstance(time_slots, str):
+            continue
+
+        time_slot = next((x for x in time_slots if entry.matches(x)), None)
+        if time_slot is None:
+            continue
+
+        # Only notify entries not already notified by another run.
+        updated = WaitlistEntry.objects.filter(
+            id=entry.id, status=WaitlistEntry.StatusChoices.WAITING
+        ).update(
+            status=WaitlistEntry.StatusChoices.NOTIFIED,
+            notified_at=now,
+            matched_time=time_slot,
+        )
+        if updated:
+            entry.status = WaitlistEntry.StatusChoices.NOTIFIED
+            entry.notified_at = now
+            entry.matched_time = time_slot
+            send_waitlist_notification_email(entry)
+            notified.append(entry)
+
+    return notified
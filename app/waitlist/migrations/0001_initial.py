@@ -0,0 +1,40 @@
+# Generated by Django 3.2 on 2026-10-19 09:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('sites', '0003_schedule_override'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('earliest_time', models.TimeField()),
+                ('latest_time', models.TimeField()),
+                ('party', models.PositiveSmallIntegerField()),
+                ('client_name', models.CharField(max_length=250)),
+                ('client_email', models.EmailField(max_length=254, verbose_name='email')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'Waiting'), (2, 'Notified')], default=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('notified_at', models.DateTimeField(blank=True, null=True)),
+                ('matched_time', models.TimeField(blank=True, null=True)),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to='sites.site')),
+            ],
+            options={
+                'verbose_name_plural': 'waitlist entries',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='waitlistentry',
+            index=models.Index(fields=['site', 'date', 'status', 'created_at'], name='waitlist_wa_site_id_630b90_idx'),
+        ),
+    ]
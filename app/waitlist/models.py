@@ -0,0 +1,57 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from sites.models import Site
+
+
+class WaitlistEntry(models.Model):
+    """
+    Model to store a request to be told when a Site has a table free for a party on a
+    date, within a window of time.
+    """
+
+    class StatusChoices(models.IntegerChoices):
+        WAITING = 1
+        NOTIFIED = 2
+
+    site = models.ForeignKey(
+        Site,
+        on_delete=models.CASCADE,
+        related_name='waitlist_entries',
+    )
+    date = models.DateField()
+    earliest_time = models.TimeField()
+    latest_time = models.TimeField()
+    party = models.PositiveSmallIntegerField()
+
+    client_name = models.CharField(max_length=250)
+    client_email = models.EmailField('email')
+
+    status = models.PositiveSmallIntegerField(
+        choices=StatusChoices.choices,
+        default=StatusChoices.WAITING,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    # The time found free when the entry was matched.
+    notified_at = models.DateTimeField(null=True, blank=True)
+    matched_time = models.TimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = 'waitlist entries'
+        indexes = [models.Index(fields=['site', 'date', 'status', 'created_at'])]
+
+    def __str__(self):
+        return f'{self.client_name} | {self.site} [{self.date}]'
+
+    def clean(self):
+        if (
+            self.earliest_time is not None
+            and self.latest_time is not None
+            and self.earliest_time > self.latest_time
+        ):
+            raise ValidationError('The earliest time must be before the latest time.')
+
+    def matches(self, time_slot):
+        """Return True if the given time slot is within the entry's window."""
+        return self.earliest_time <= time_slot <= self.latest_time
@@ -0,0 +1,29 @@
+from django.dispatch.dispatcher import receiver
+from django.utils import timezone
+
+from bookings.signals import booking_changed
+from .models import WaitlistEntry
+from .tasks import match_site_waitlist
+
+
+@receiver(booking_changed)
+def match_booking_waitlist(sender, site_id, dates=(), **kwargs):
+    """
+    Match the waitlist of the Booking's Site on the dates it changed, as a cancelled or
+    moved Booking frees its Tables. Only dates with entries waiting are matched.
+    """
+    dates = [date for date in dates if date >= timezone.localdate()]
+    if not dates:
+        return
+
+    waiting_dates = (
+        WaitlistEntry.objects.filter(
+            site_id=site_id,
+            date__in=dates,
+            status=WaitlistEntry.StatusChoices.WAITING,
+        )
+        .values_list('date', flat=True)
+        .distinct()
+    )
+    for date in waiting_dates:
+        match_site_waitlist.delay(site_id, date.isoformat())
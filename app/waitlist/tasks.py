@@ -0,0 +1,18 @@
+from datetime import date
+
+from celery import shared_task
+
+from sites.models import Site
+from .matching import match_waitlist
+
+
+@shared_task
+def match_site_waitlist(site_id, day):
+    """
+    Match the waiting entries of a Site on the given ISO formatted date.
+    """
+    try:
+        match_waitlist(site_id, date.fromisoformat(day))
+    except Site.DoesNotExist:
+        # The Site was deleted since the change.
+        pass
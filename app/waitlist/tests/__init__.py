@@ -0,0 +1 @@
+from core.tests import *
\ No newline at end of file
@@ -0,0 +1,97 @@
+from datetime import datetime, time, timedelta
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from model_bakery import baker
+
+from bookings.models import Booking, BookingTableRelationship
+from sites.snapshot import _snapshots
+from .. import matching
+from ..matching import match_waitlist
+from ..models import WaitlistEntry
+
+
+class MatchWaitlistTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site', max_party_num=6, booking_duration=120)
+        self.table = baker.make('sites.Table', site=self.site, number_of_seats=4)
+        self.date = timezone.localdate() + timedelta(days=2)
+
+        # The only Table is booked for the evening.
+        self.booking = baker.make(
+            'bookings.Booking',
+            site=self.site,
+            booking_date=timezone.make_aware(datetime.combine(self.date, time(18))),
+            duration=300,
+            party=4,
+        )
+        BookingTableRelationship.objects.create(booking=self.booking, table=self.table)
+
+        self.entry_1 = self.make_entry(time(18), time(20))
+        self.entry_2 = self.make_entry(time(19), time(20), party=3)
+        self.entry_3 = self.make_entry(time(18), time(20), party=6)
+        mail.outbox = []
+
+    def tearDown(self):
+        _snapshots.clear()
+        cache.clear()
+
+    def make_entry(self, earliest_time, latest_time, party=4):
+        return baker.make(
+            'waitlist.WaitlistEntry',
+            site=self.site,
+            date=self.date,
+            earliest_time=earliest_time,
+            latest_time=latest_time,
+            party=party,
+            client_email='client@email.com',
+        )
+
+    def test_match_waitlist_none_free(self):
+        self.assertEqual(match_waitlist(self.site.id, self.date), [])
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_match_waitlist(self):
+        self.booking.cancel_booking()
+        mail.outbox = []
+
+        with patch.object(matching, 'evaluate_group', wraps=matching.evaluate_group) as mock:
+            notified = match_waitlist(self.site.id, self.date)
+
+        # Each party size is evaluated in a single pass.
+        mock.assert_called_once_with(self.site.id, self.date, [3, 4, 6])
+
+        # Entries are notified in the order they joined, the party of 6 has no Table.
+        self.assertEqual(notified, [self.entry_1, self.entry_2])
+        self.assertEqual(len(mail.outbox), 2)
+
+        self.entry_1.refresh_from_db()
+        self.assertEqual(self.entry_1.status, WaitlistEntry.StatusChoices.NOTIFIED)
+        self.assertEqual(self.entry_1.matched_time, time(18))
+        self.assertIsNotNone(self.entry_1.notified_at)
+
+        self.entry_2.refresh_from_db()
+        self.assertEqual(self.entry_2.matched_time, time(19))
+
+        # Entries are only notified once.
+        self.assertEqual(match_waitlist(self.site.id, self.date), [])
+
+    def test_match_waitlist_on_cancellation(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Booking.objects.get(id=self.booking.id).cancel_booking()
+
+        self.entry_1.refresh_from_db()
+        self.assertEqual(self.entry_1.status, WaitlistEntry.StatusChoices.NOTIFIED)
+        self.assertIn('A table is free', mail.outbox[-1].subject)
+
+    def test_match_waitlist_other_date_not_matched(self):
+        other_date = self.date + timedelta(days=1)
+
+        with patch.object(matching, 'evaluate_group') as mock:
+            match_waitlist(self.site.id, other_date)
+
+        mock.assert_not_called()
@@ -0,0 +1,25 @@
+from datetime import time
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from model_bakery import baker
+
+
+class WaitlistEntryTest(TestCase):
+    def test_clean(self):
+        entry = baker.prepare(
+            'waitlist.WaitlistEntry', earliest_time=time(20), latest_time=time(18)
+        )
+
+        with self.assertRaises(ValidationError):
+            entry.clean()
+
+    def test_matches(self):
+        entry = baker.prepare(
+            'waitlist.WaitlistEntry', earliest_time=time(18), latest_time=time(20)
+        )
+
+        self.assertTrue(entry.matches(time(18)))
+        self.assertTrue(entry.matches(time(20)))
+        self.assertFalse(entry.matches(time(20, 15)))
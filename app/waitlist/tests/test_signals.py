@@ -0,0 +1,41 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from model_bakery import baker
+
+from bookings.models import Booking
+from bookings.signals import booking_changed
+from ..models import WaitlistEntry
+
+
+class MatchBookingWaitlistTest(TestCase):
+    def setUp(self):
+        self.site = baker.make('sites.Site')
+        self.date = timezone.localdate() + timedelta(days=2)
+        baker.make('waitlist.WaitlistEntry', site=self.site, date=self.date)
+        baker.make(
+            'waitlist.WaitlistEntry',
+            site=self.site,
+            date=self.date + timedelta(days=1),
+            status=WaitlistEntry.StatusChoices.NOTIFIED,
+        )
+
+    def send(self, *dates):
+        booking_changed.send(sender=Booking, booking_id=1, site_id=self.site.id, dates=dates)
+
+    @patch('waitlist.signals.match_site_waitlist.delay')
+    def test_only_waiting_dates_matched(self, mock):
+        self.send(self.date, self.date + timedelta(days=1), self.date + timedelta(days=2))
+
+        mock.assert_called_once_with(self.site.id, self.date.isoformat())
+
+    @patch('waitlist.signals.match_site_waitlist.delay')
+    def test_past_dates_not_matched(self, mock):
+        WaitlistEntry.objects.update(date=self.date - timedelta(days=7))
+
+        self.send(self.date - timedelta(days=7))
+
+        mock.assert_not_called()